@@ -0,0 +1,278 @@
+from bisect import bisect_right
+
+from alfabeto import ClasseCaracteres, particionar, rotulo_de_intervalos
+from fechos import calcular_fechos_epsilon
+from reconhecedor import ReconhecedorAFN
+
+
+LIMITE_ESTADOS_PADRAO = 10000
+
+
+class LimiteEstadosExcedido(Exception):
+    def __init__(self, limite):
+        super().__init__(f"Determinização excedeu o limite de {limite} estados")
+        self.limite = limite
+
+
+class AFD:
+    def __init__(self, transicoes, finais, inicial=0):
+        self.transicoes = transicoes
+        self.finais = set(finais)
+        self.inicial = inicial
+        self._chaves = None
+
+    @staticmethod
+    def _cobertura_rotulos(estados):
+        rotulos = {simbolo for estado in estados for simbolo in estado.transicoes if simbolo != 'ε'}
+        grupos = {}
+        for inicio, fim, conjunto in particionar(rotulos):
+            grupos.setdefault(conjunto, []).append((inicio, fim))
+
+        cobertura = {rotulo: [] for rotulo in rotulos}
+        for conjunto, intervalos in grupos.items():
+            chave = rotulo_de_intervalos(intervalos)
+            for rotulo in conjunto:
+                cobertura[rotulo].append(chave)
+        for rotulo, chaves in cobertura.items():
+            if not chaves:
+                chaves.append(rotulo)
+        return cobertura
+
+    @classmethod
+    def de_afn(cls, afn, limite_estados=None):
+        estados = afn.obter_todos_estados()
+        fechos = calcular_fechos_epsilon(estados)
+        cobertura = cls._cobertura_rotulos(estados)
+
+        inicial = fechos[afn.estado_inicial]
+        indices = {inicial: 0}
+        conjuntos = [inicial]
+        transicoes = []
+        finais = set()
+
+        i = 0
+        while i < len(conjuntos):
+            conjunto = conjuntos[i]
+            movimentos = {}
+
+            for estado in conjunto:
+                if estado.eh_final:
+                    finais.add(i)
+                for simbolo, destinos in estado.transicoes.items():
+                    if simbolo == 'ε':
+                        continue
+                    for chave in cobertura[simbolo]:
+                        alvo = movimentos.setdefault(chave, set())
+                        for destino in destinos:
+                            alvo |= fechos[destino]
+
+            saida = {}
+            for simbolo, alvo in movimentos.items():
+                alvo = frozenset(alvo)
+                destino = indices.get(alvo)
+                if destino is None:
+                    if limite_estados is not None and len(conjuntos) >= limite_estados:
+                        raise LimiteEstadosExcedido(limite_estados)
+                    destino = len(conjuntos)
+                    indices[alvo] = destino
+                    conjuntos.append(alvo)
+                saida[simbolo] = destino
+
+            transicoes.append(saida)
+            i += 1
+
+        return cls(transicoes, finais)
+
+    def total_estados(self):
+        return len(self.transicoes)
+
+    def alfabeto(self):
+        simbolos = set()
+        for saida in self.transicoes:
+            simbolos.update(saida)
+        return sorted(simbolos)
+
+    def tem_classes(self):
+        if self._chaves is None:
+            intervalos = sorted(
+                (inicio, fim, chave)
+                for chave in self.alfabeto() if isinstance(chave, ClasseCaracteres)
+                for inicio, fim in chave.intervalos
+            )
+            self._chaves = (
+                [inicio for inicio, _, _ in intervalos],
+                [fim for _, fim, _ in intervalos],
+                [chave for _, _, chave in intervalos],
+            )
+        return bool(self._chaves[0])
+
+    def chave(self, simbolo):
+        if not self.tem_classes() or len(simbolo) != 1:
+            return simbolo
+        inicios, fins, chaves = self._chaves
+        codigo = ord(simbolo)
+        i = bisect_right(inicios, codigo) - 1
+        if i >= 0 and codigo <= fins[i]:
+            return chaves[i]
+        return simbolo
+
+    def minimizar(self):
+        alfabeto = self.alfabeto()
+        n = len(self.transicoes) + 1
+        sumidouro = n - 1
+
+        inversas = {simbolo: [[] for _ in range(n)] for simbolo in alfabeto}
+        for origem in range(n):
+            saida = self.transicoes[origem] if origem != sumidouro else {}
+            for simbolo in alfabeto:
+                inversas[simbolo][saida.get(simbolo, sumidouro)].append(origem)
+
+        finais = set(self.finais)
+        nao_finais = set(range(n)) - finais
+        blocos = [bloco for bloco in (finais, nao_finais) if bloco]
+        classe = [0] * n
+        for indice, bloco in enumerate(blocos):
+            for estado in bloco:
+                classe[estado] = indice
+
+        pendentes = set()
+        if len(blocos) == 2:
+            pendentes.add(0 if len(blocos[0]) <= len(blocos[1]) else 1)
+
+        while pendentes:
+            divisor = set(blocos[pendentes.pop()])
+
+            for simbolo in alfabeto:
+                inversa = inversas[simbolo]
+                atingidos = {}
+                for destino in divisor:
+                    for origem in inversa[destino]:
+                        atingidos.setdefault(classe[origem], set()).add(origem)
+
+                for indice, parte in atingidos.items():
+                    bloco = blocos[indice]
+                    if len(parte) == len(bloco):
+                        continue
+
+                    resto = bloco - parte
+                    menor, maior = (parte, resto) if len(parte) <= len(resto) else (resto, parte)
+                    novo = len(blocos)
+                    blocos[indice] = maior
+                    blocos.append(menor)
+                    for estado in menor:
+                        classe[estado] = novo
+                    pendentes.add(novo)
+
+        morto = classe[sumidouro]
+        if classe[self.inicial] == morto:
+            return AFD([{}], set())
+
+        numeracao = {classe[self.inicial]: 0}
+        ordem = [classe[self.inicial]]
+        transicoes = []
+        finais = set()
+
+        i = 0
+        while i < len(ordem):
+            representante = next(iter(blocos[ordem[i]]))
+            if representante in self.finais:
+                finais.add(i)
+
+            saida = {}
+            for simbolo, destino in self.transicoes[representante].items():
+                bloco_destino = classe[destino]
+                if bloco_destino == morto:
+                    continue
+                if bloco_destino not in numeracao:
+                    numeracao[bloco_destino] = len(ordem)
+                    ordem.append(bloco_destino)
+                saida[simbolo] = numeracao[bloco_destino]
+
+            transicoes.append(saida)
+            i += 1
+
+        return AFD(transicoes, finais)
+
+    def exibir_texto(self):
+        resultado = []
+        resultado.append("="*60)
+        resultado.append("ESTRUTURA DO AFD")
+        resultado.append("="*60)
+        resultado.append(f"Estado Inicial: d{self.inicial}")
+        resultado.append(f"Estados Finais: {', '.join(f'd{e}' for e in sorted(self.finais))}")
+        resultado.append(f"\nTotal de Estados: {self.total_estados()}")
+        resultado.append("\nTransições:")
+        resultado.append("-"*60)
+
+        for estado, saida in enumerate(self.transicoes):
+            marcador = " (INICIAL)" if estado == self.inicial else ""
+            marcador += " (FINAL)" if estado in self.finais else ""
+            resultado.append(f"\nd{estado}{marcador}:")
+
+            if not saida:
+                resultado.append("  (sem transições)")
+            else:
+                for simbolo, destino in sorted(saida.items()):
+                    resultado.append(f"  {simbolo} → d{destino}")
+
+        resultado.append("="*60)
+        return "\n".join(resultado)
+
+
+class ReconhecedorAFD:
+    def __init__(self, afd):
+        self.afd = afd
+        self.historico = []
+
+    def reconhecer(self, cadeia):
+        self.historico = []
+
+        transicoes = self.afd.transicoes
+        atual = self.afd.inicial
+        traduzir = self.afd.chave if self.afd.tem_classes() else None
+
+        self.historico.append({
+            'passo': 'Inicial',
+            'simbolo': '',
+            'estados': [f"d{atual}"]
+        })
+
+        for i, simbolo in enumerate(cadeia):
+            atual = transicoes[atual].get(simbolo if traduzir is None else traduzir(simbolo))
+
+            if atual is None:
+                self.historico.append({
+                    'passo': f'Após ler {i+1}',
+                    'simbolo': simbolo,
+                    'estados': []
+                })
+                return False, "Nenhum estado alcançável"
+
+            self.historico.append({
+                'passo': f'Após ler {i+1}',
+                'simbolo': simbolo,
+                'estados': [f"d{atual}"]
+            })
+
+        if atual in self.afd.finais:
+            return True, f"Estado final d{atual} alcançado"
+
+        return False, "Nenhum estado final alcançado"
+
+    def obter_historico_texto(self):
+        resultado = []
+        for item in self.historico:
+            estados_str = ', '.join(str(e) for e in item['estados'])
+            if item['passo'] == 'Inicial':
+                resultado.append(f"{item['passo']}: {{{estados_str}}}")
+            else:
+                resultado.append(f"{item['passo']} '{item['simbolo']}': {{{estados_str}}}")
+        return '\n'.join(resultado)
+
+
+def criar_reconhecedor_deterministico(afn, limite_estados=LIMITE_ESTADOS_PADRAO):
+    try:
+        afd = AFD.de_afn(afn, limite_estados=limite_estados).minimizar()
+    except LimiteEstadosExcedido:
+        return ReconhecedorAFN(afn, modo='afd_preguicoso')
+    return ReconhecedorAFD(afd)
@@ -1,16 +1,43 @@
+from itertools import count
+
+from alfabeto import ClassesAlfabeto
+from compacto import AFNCompacto
+from fechos import calcular_fechos_epsilon
+
+
+_relogio = count(1)
+
+
+class VersaoGrafo:
+    __slots__ = ('marca',)
+
+    def __init__(self):
+        self.marca = 0
+
+    def registrar(self):
+        self.marca = next(_relogio)
+
+
+_versao_avulsa = VersaoGrafo()
+
+
 class Estado:
     contador = 0
 
-    def __init__(self):
-        self.id = Estado.contador
-        Estado.contador += 1
+    def __init__(self, id=None, versao=None):
+        if id is None:
+            id = Estado.contador
+            Estado.contador += 1
+        self.id = id
         self.transicoes = {}
         self.eh_final = False
+        self.versao = versao if versao is not None else _versao_avulsa
 
     def adicionar_transicao(self, simbolo, estado_destino):
         if simbolo not in self.transicoes:
             self.transicoes[simbolo] = []
         self.transicoes[simbolo].append(estado_destino)
+        self.versao.registrar()
 
     def __repr__(self):
         return f"q{self.id}"
@@ -22,13 +49,43 @@ class Estado:
         return isinstance(other, Estado) and self.id == other.id
 
 
+class FabricaEstados:
+    def __init__(self):
+        self.proximo_id = 0
+        self.versao = VersaoGrafo()
+
+    def novo(self):
+        estado = Estado(self.proximo_id, self.versao)
+        self.proximo_id += 1
+        return estado
+
+
 class AFN:
-    def __init__(self, estado_inicial, estado_final):
+    def __init__(self, estado_inicial, estado_final=None):
         self.estado_inicial = estado_inicial
         self.estado_final = estado_final
-        estado_final.eh_final = True
-
-    def obter_todos_estados(self):
+        self.relatorio_eliminacao = None
+        if estado_final is not None:
+            estado_final.eh_final = True
+        self.invalidar_indice()
+
+    def invalidar_indice(self):
+        self._marca_indice = None
+        self._versoes = ()
+        self._estados = None
+        self._por_id = None
+        self._transicoes = None
+        self._por_simbolo = None
+
+    def _indice_valido(self):
+        marca = self._marca_indice
+        return marca is not None and all(versao.marca < marca for versao in self._versoes)
+
+    def _atualizar_indice(self):
+        if self._indice_valido():
+            return
+
+        marca = next(_relogio)
         visitados = set()
         pilha = [self.estado_inicial]
 
@@ -43,18 +100,116 @@ class AFN:
                     if destino not in visitados:
                         pilha.append(destino)
 
-        return sorted(visitados, key=lambda e: e.id)
-
-    def obter_transicoes(self):
+        estados = sorted(visitados, key=lambda e: e.id)
         transicoes = []
-        estados = self.obter_todos_estados()
+        por_simbolo = {}
 
         for estado in estados:
             for simbolo, destinos in estado.transicoes.items():
+                arestas = por_simbolo.setdefault(simbolo, [])
                 for destino in destinos:
                     transicoes.append((estado, simbolo, destino))
+                    arestas.append((estado, destino))
+
+        self._estados = estados
+        self._por_id = {estado.id: estado for estado in estados}
+        self._transicoes = transicoes
+        self._por_simbolo = por_simbolo
+        self._versoes = {estado.versao for estado in estados}
+        self._marca_indice = marca
+
+    def obter_todos_estados(self):
+        self._atualizar_indice()
+        return list(self._estados)
+
+    def obter_transicoes(self):
+        self._atualizar_indice()
+        return list(self._transicoes)
+
+    def obter_estado(self, id):
+        self._atualizar_indice()
+        return self._por_id[id]
+
+    def total_estados(self):
+        self._atualizar_indice()
+        return len(self._estados)
+
+    def total_transicoes(self):
+        self._atualizar_indice()
+        return len(self._transicoes)
+
+    def transicoes_por_simbolo(self, simbolo):
+        self._atualizar_indice()
+        return list(self._por_simbolo.get(simbolo, ()))
+
+    def eliminar_epsilon(self):
+        estados = self.obter_todos_estados()
+        total_transicoes = self.total_transicoes()
+        fechos = calcular_fechos_epsilon(estados)
+        versao = VersaoGrafo()
+
+        novos = {self.estado_inicial: Estado(self.estado_inicial.id, versao)}
+        fila = [self.estado_inicial]
+        total_novas_transicoes = 0
+
+        while fila:
+            estado = fila.pop()
+            novo = novos[estado]
+            vistos = set()
+
+            for membro in sorted(fechos[estado], key=lambda e: e.id):
+                if membro.eh_final:
+                    novo.eh_final = True
+                for simbolo, destinos in membro.transicoes.items():
+                    if simbolo == 'ε':
+                        continue
+                    for destino in destinos:
+                        if (simbolo, destino) in vistos:
+                            continue
+                        vistos.add((simbolo, destino))
+                        if destino not in novos:
+                            novos[destino] = Estado(destino.id, versao)
+                            fila.append(destino)
+                        novo.adicionar_transicao(simbolo, novos[destino])
+                        total_novas_transicoes += 1
+
+        resultado = AFN(novos[self.estado_inicial])
+        resultado.relatorio_eliminacao = {
+            'estados_antes': len(estados),
+            'estados_depois': len(novos),
+            'estados_removidos': len(estados) - len(novos),
+            'transicoes_antes': total_transicoes,
+            'transicoes_depois': total_novas_transicoes,
+            'transicoes_removidas': total_transicoes - total_novas_transicoes,
+        }
+        return resultado
+
+    def compactar(self):
+        return AFNCompacto.de_afn(self)
+
+    def classes_alfabeto(self):
+        return ClassesAlfabeto.de_afn(self)
+
+    @classmethod
+    def de_compacto(cls, compacto):
+        versao = VersaoGrafo()
+        estados = [Estado(compacto.ids[i], versao) for i in range(compacto.total_estados())]
+
+        for i, estado in enumerate(estados):
+            estado.eh_final = bool(compacto.finais[i])
+            for simbolo, destinos in compacto.transicoes_do_estado(i).items():
+                for destino in destinos:
+                    estado.adicionar_transicao(simbolo, estados[destino])
+
+        finais = [estado for estado in estados if estado.eh_final]
+        return cls(estados[compacto.inicial], finais[0] if len(finais) == 1 else None)
+
+    def salvar(self, caminho, formato=None):
+        self.compactar().salvar(caminho, formato)
 
-        return transicoes
+    @classmethod
+    def carregar(cls, caminho):
+        return cls.de_compacto(AFNCompacto.carregar(caminho))
 
     def exibir_texto(self):
         estados = self.obter_todos_estados()
@@ -64,7 +219,11 @@ class AFN:
         resultado.append("ESTRUTURA DO AFN-ε")
         resultado.append("="*60)
         resultado.append(f"Estado Inicial: {self.estado_inicial}")
-        resultado.append(f"Estado Final: {self.estado_final}")
+        finais = [self.estado_final] if self.estado_final is not None else [e for e in estados if e.eh_final]
+        if len(finais) == 1:
+            resultado.append(f"Estado Final: {finais[0]}")
+        else:
+            resultado.append(f"Estados Finais: {', '.join(str(e) for e in finais)}")
         resultado.append(f"\nTotal de Estados: {len(estados)}")
         resultado.append("\nTransições:")
         resultado.append("-"*60)
@@ -0,0 +1,253 @@
+from array import array
+from bisect import bisect_right
+
+
+TAMANHO_TABELA = 256
+MAXIMO_CODIGO = 0x10FFFF
+ESPECIAIS_CLASSE = '\\[]^-'
+
+
+class ErroClasseCaracteres(ValueError):
+    def __init__(self, mensagem, posicao):
+        super().__init__(mensagem)
+        self.mensagem = mensagem
+        self.posicao = posicao
+
+
+def _normalizar(intervalos):
+    normalizados = []
+    for inicio, fim in sorted(intervalos):
+        if normalizados and inicio <= normalizados[-1][1] + 1:
+            if fim > normalizados[-1][1]:
+                normalizados[-1] = (normalizados[-1][0], fim)
+        else:
+            normalizados.append((inicio, fim))
+    return normalizados
+
+
+def _complemento(intervalos):
+    resultado = []
+    proximo = 0
+    for inicio, fim in intervalos:
+        if inicio > proximo:
+            resultado.append((proximo, inicio - 1))
+        proximo = fim + 1
+    if proximo <= MAXIMO_CODIGO:
+        resultado.append((proximo, MAXIMO_CODIGO))
+    return resultado
+
+
+def _escapar(codigo):
+    caractere = chr(codigo)
+    if caractere in ESPECIAIS_CLASSE:
+        return '\\' + caractere
+    if not caractere.isprintable():
+        return f'\\u{{{codigo:x}}}'
+    return caractere
+
+
+def _formatar(intervalos):
+    prefixo = ''
+    complemento = _complemento(intervalos)
+    if intervalos and intervalos[-1][1] == MAXIMO_CODIGO and complemento:
+        prefixo = '^'
+        intervalos = complemento
+
+    itens = []
+    for inicio, fim in intervalos:
+        if inicio == fim:
+            itens.append(_escapar(inicio))
+        elif fim == inicio + 1:
+            itens.append(_escapar(inicio) + _escapar(fim))
+        else:
+            itens.append(f'{_escapar(inicio)}-{_escapar(fim)}')
+    return '[' + prefixo + ''.join(itens) + ']'
+
+
+def _ler_caractere(texto, posicao):
+    caractere = texto[posicao]
+    if caractere != '\\':
+        return ord(caractere), posicao + 1
+
+    if posicao + 1 >= len(texto):
+        raise ErroClasseCaracteres("Escape incompleto em classe de caracteres", posicao)
+    if texto.startswith('u{', posicao + 1):
+        fim = texto.find('}', posicao + 3)
+        try:
+            codigo = int(texto[posicao + 3:fim], 16) if fim != -1 else -1
+        except ValueError:
+            codigo = -1
+        if not 0 <= codigo <= MAXIMO_CODIGO:
+            raise ErroClasseCaracteres("Escape de código inválido em classe de caracteres", posicao)
+        return codigo, fim + 1
+    return ord(texto[posicao + 1]), posicao + 2
+
+
+def ler_classe(texto, inicio):
+    posicao = inicio + 1
+    negada = texto.startswith('^', posicao)
+    if negada:
+        posicao += 1
+
+    intervalos = []
+    primeiro = True
+
+    while True:
+        if posicao >= len(texto):
+            raise ErroClasseCaracteres("Colchete '[' não foi fechado", inicio)
+        if texto[posicao] == ']' and not primeiro:
+            break
+        primeiro = False
+
+        item = posicao
+        baixo, posicao = _ler_caractere(texto, posicao)
+        alto = baixo
+        if texto.startswith('-', posicao) and posicao + 1 < len(texto) and texto[posicao + 1] != ']':
+            alto, posicao = _ler_caractere(texto, posicao + 1)
+            if alto < baixo:
+                raise ErroClasseCaracteres("Intervalo invertido em classe de caracteres", item)
+        intervalos.append((baixo, alto))
+
+    intervalos = _normalizar(intervalos)
+    if negada:
+        intervalos = _complemento(intervalos)
+    if not intervalos:
+        raise ErroClasseCaracteres("Classe de caracteres vazia", inicio)
+    return rotulo_de_intervalos(intervalos), posicao + 1
+
+
+class ClasseCaracteres(str):
+    def __new__(cls, intervalos):
+        intervalos = tuple(_normalizar(intervalos))
+        classe = super().__new__(cls, _formatar(intervalos))
+        classe.intervalos = intervalos
+        classe._inicios = [inicio for inicio, _ in intervalos]
+        return classe
+
+    def __reduce__(self):
+        return (ClasseCaracteres, (self.intervalos,))
+
+    @classmethod
+    def de_texto(cls, texto):
+        rotulo, fim = ler_classe(texto, 0)
+        if fim != len(texto):
+            raise ErroClasseCaracteres("Texto excedente após classe de caracteres", fim)
+        return rotulo if isinstance(rotulo, cls) else cls([(ord(rotulo), ord(rotulo))])
+
+    def contem(self, simbolo):
+        if len(simbolo) != 1:
+            return False
+        codigo = ord(simbolo)
+        i = bisect_right(self._inicios, codigo) - 1
+        return i >= 0 and codigo <= self.intervalos[i][1]
+
+    def total_simbolos(self):
+        return sum(fim - inicio + 1 for inicio, fim in self.intervalos)
+
+
+def rotulo_de_intervalos(intervalos):
+    intervalos = _normalizar(intervalos)
+    if len(intervalos) == 1 and intervalos[0][0] == intervalos[0][1]:
+        return chr(intervalos[0][0])
+    return ClasseCaracteres(intervalos)
+
+
+def restaurar_rotulo(texto):
+    if len(texto) > 1 and texto.startswith('['):
+        return ClasseCaracteres.de_texto(texto)
+    return texto
+
+
+def intervalos_do_rotulo(rotulo):
+    if isinstance(rotulo, ClasseCaracteres):
+        return rotulo.intervalos
+    if len(rotulo) == 1:
+        return ((ord(rotulo), ord(rotulo)),)
+    return ()
+
+
+def particionar(rotulos):
+    eventos = {}
+    for rotulo in rotulos:
+        for inicio, fim in intervalos_do_rotulo(rotulo):
+            eventos.setdefault(inicio, ([], []))[0].append(rotulo)
+            eventos.setdefault(fim + 1, ([], []))[1].append(rotulo)
+
+    pontos = sorted(eventos)
+    ativos = set()
+    elementares = []
+
+    for i, ponto in enumerate(pontos):
+        entram, saem = eventos[ponto]
+        ativos.difference_update(saem)
+        ativos.update(entram)
+        if ativos:
+            elementares.append((ponto, pontos[i + 1] - 1, frozenset(ativos)))
+
+    return elementares
+
+
+class ClassesAlfabeto:
+    def __init__(self, classes):
+        self.classes = [()] + [tuple(classe) for classe in classes]
+        self.tabela = array('l', [0] * TAMANHO_TABELA)
+
+        elementares = sorted(
+            (inicio, fim, indice)
+            for indice, classe in enumerate(self.classes)
+            for inicio, fim in classe
+        )
+        self._inicios = [inicio for inicio, _, _ in elementares]
+        self._fins = [fim for _, fim, _ in elementares]
+        self._indices = [indice for _, _, indice in elementares]
+
+        for inicio, fim, indice in elementares:
+            for codigo in range(inicio, min(fim, TAMANHO_TABELA - 1) + 1):
+                self.tabela[codigo] = indice
+
+    @classmethod
+    def de_transicoes(cls, transicoes):
+        assinaturas = {}
+        for origem, simbolo, destino in transicoes:
+            if simbolo == 'ε':
+                continue
+            assinaturas.setdefault(simbolo, set()).add((origem, destino))
+
+        grupos = {}
+        for inicio, fim, rotulos in particionar(assinaturas):
+            assinatura = frozenset().union(*(assinaturas[rotulo] for rotulo in rotulos))
+            grupos.setdefault(assinatura, []).append((inicio, fim))
+
+        return cls(sorted(_normalizar(intervalos) for intervalos in grupos.values()))
+
+    @classmethod
+    def de_afn(cls, afn):
+        return cls.de_transicoes(afn.obter_transicoes())
+
+    def classe(self, simbolo):
+        if len(simbolo) != 1:
+            return 0
+        codigo = ord(simbolo)
+        if codigo < TAMANHO_TABELA:
+            return self.tabela[codigo]
+        i = bisect_right(self._inicios, codigo) - 1
+        if i >= 0 and codigo <= self._fins[i]:
+            return self._indices[i]
+        return 0
+
+    def traduzir(self, cadeia):
+        return [self.classe(simbolo) for simbolo in cadeia]
+
+    def total_classes(self):
+        return len(self.classes)
+
+    def representante(self, classe):
+        intervalos = self.classes[classe]
+        return chr(intervalos[0][0]) if intervalos else None
+
+    def exibir_texto(self):
+        resultado = [f"Classes de símbolos: {self.total_classes()}"]
+        for indice, classe in enumerate(self.classes):
+            descricao = rotulo_de_intervalos(classe) if classe else '(demais símbolos)'
+            resultado.append(f"  c{indice}: {descricao}")
+        return "\n".join(resultado)
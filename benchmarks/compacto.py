@@ -0,0 +1,61 @@
+import time
+
+from compacto import memoria_grafo_objetos
+from conversor import ConversorERparaAFN
+from reconhecedor import ReconhecedorAFN
+
+
+def _reconhecer_grafo_objetos(afn, cadeia):
+    def fecho(estados):
+        resultado = set(estados)
+        pilha = list(estados)
+        while pilha:
+            for destino in pilha.pop().transicoes.get('ε', ()):
+                if destino not in resultado:
+                    resultado.add(destino)
+                    pilha.append(destino)
+        return resultado
+
+    atuais = fecho([afn.estado_inicial])
+    for simbolo in cadeia:
+        novos = set()
+        for estado in atuais:
+            novos.update(estado.transicoes.get(simbolo, ()))
+        atuais = fecho(novos)
+    return any(estado.eh_final for estado in atuais)
+
+
+def _medir(funcao, cadeia):
+    inicio = time.perf_counter()
+    funcao(cadeia)
+    return len(cadeia) / (time.perf_counter() - inicio)
+
+
+def main():
+    print(f"{'ER':<30} {'estados':>8} {'B/estado obj':>13} {'B/estado comp':>14} {'trans/s obj':>12} {'trans/s comp':>13}")
+
+    casos = [
+        ('(a|b)*abb', 'ab' * 10000),
+        ('(a|b|c|d)*' + 'abcd' * 100, 'abcd' * 5000),
+        ('(' + '|'.join('abcdefgh') + ')*', 'abcdefgh' * 2500),
+    ]
+
+    for er, cadeia in casos:
+        afn = ConversorERparaAFN(er).converter()
+        compacto = afn.compactar()
+        total = compacto.total_estados()
+
+        reconhecedor = ReconhecedorAFN(compacto)
+        reconhecedor.reconhecer('')
+
+        objetos = _medir(lambda c: _reconhecer_grafo_objetos(afn, c), cadeia)
+        compactas = _medir(reconhecedor.reconhecer, cadeia)
+
+        print(
+            f"{er[:30]:<30} {total:>8} {memoria_grafo_objetos(afn) / total:>13.1f} "
+            f"{compacto.bytes_por_estado():>14.1f} {objetos:>12.0f} {compactas:>13.0f}"
+        )
+
+
+if __name__ == "__main__":
+    main()
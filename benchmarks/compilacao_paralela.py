@@ -0,0 +1,51 @@
+import random
+import time
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
+
+from conversor import ConversorERparaAFN
+
+
+def gerar_corpus(quantidade, tamanho, semente=0):
+    aleatorio = random.Random(semente)
+    corpus = []
+    for _ in range(quantidade):
+        partes = []
+        for _ in range(tamanho):
+            escolha = aleatorio.random()
+            literal = ''.join(aleatorio.choice('abcdef') for _ in range(aleatorio.randint(1, 4)))
+            if escolha < 0.3:
+                partes.append(f"({literal}|{aleatorio.choice('abcdef')})")
+            elif escolha < 0.5:
+                partes.append(f"({literal})*")
+            else:
+                partes.append(literal)
+        corpus.append(''.join(partes))
+    return corpus
+
+
+def compilar_padrao(er):
+    return ConversorERparaAFN(er).converter().compactar().total_estados()
+
+
+def _medir(nome, executar, corpus):
+    inicio = time.perf_counter()
+    estados = sum(executar(corpus))
+    duracao = time.perf_counter() - inicio
+    print(f"{nome:<22} {duracao:>8.3f}s {len(corpus) / duracao:>12.1f} padrões/s {estados:>10} estados")
+
+
+def main(quantidade=400, tamanho=60, workers=4):
+    corpus = gerar_corpus(quantidade, tamanho)
+    print(f"Corpus: {quantidade} padrões, {sum(map(len, corpus))} caracteres")
+
+    _medir("sequencial", lambda c: map(compilar_padrao, c), corpus)
+
+    with ThreadPoolExecutor(workers) as executor:
+        _medir(f"threads ({workers})", lambda c: executor.map(compilar_padrao, c), corpus)
+
+    with ProcessPoolExecutor(workers) as executor:
+        _medir(f"processos ({workers})", lambda c: executor.map(compilar_padrao, c, chunksize=16), corpus)
+
+
+if __name__ == "__main__":
+    main()
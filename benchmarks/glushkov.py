@@ -0,0 +1,39 @@
+import time
+
+from conversor import ConversorERparaAFN, ConversorGlushkov
+from reconhecedor import ReconhecedorAFN
+
+
+CASOS = [
+    ('(a|b)*abb', 'ab' * 20000 + 'abb'),
+    ('((a*)*)*', 'a' * 20000),
+    ('(' + '|'.join('abcdefghijklmnop') + ')*', 'abcdefghijklmnop' * 2500),
+    ('(ab|cd)*' + 'abcd' * 50, 'abcd' * 10000),
+]
+
+
+def _medir(conversor, er, cadeia, modo):
+    inicio = time.perf_counter()
+    afn = conversor(er).converter()
+    compilacao = time.perf_counter() - inicio
+
+    reconhecedor = ReconhecedorAFN(afn, modo=modo, rastreamento='desligado')
+    inicio = time.perf_counter()
+    reconhecedor.reconhecer(cadeia)
+    reconhecimento = time.perf_counter() - inicio
+
+    return len(afn.obter_todos_estados()), len(afn.obter_transicoes()), compilacao, len(cadeia) / reconhecimento
+
+
+def main(modo='conjuntos'):
+    print(f"Modo de reconhecimento: {modo}")
+    print(f"{'ER':<28} {'construção':<10} {'estados':>8} {'trans.':>8} {'compilação':>11} {'símbolos/s':>12}")
+
+    for er, cadeia in CASOS:
+        for nome, conversor in [('thompson', ConversorERparaAFN), ('glushkov', ConversorGlushkov)]:
+            estados, transicoes, compilacao, taxa = _medir(conversor, er, cadeia, modo)
+            print(f"{er[:28]:<28} {nome:<10} {estados:>8} {transicoes:>8} {compilacao:>10.4f}s {taxa:>12.0f}")
+
+
+if __name__ == "__main__":
+    main()
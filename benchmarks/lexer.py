@@ -0,0 +1,70 @@
+import os
+import random
+import tempfile
+import time
+import tracemalloc
+
+from lexer import AnalisadorLexico
+
+
+REGRAS = [
+    ('SE', 'se'),
+    ('ENQUANTO', 'enquanto'),
+    ('ID', '[a-z_][a-z0-9_]*'),
+    ('NUM', '[0-9]+(.[0-9]+)?'),
+    ('OP', '[-+*/<>=]|==|<=|>=|!='),
+    ('PONT', '[(){};,]'),
+    ('ESP', '[ \t\n]+'),
+]
+
+
+def gerar_fonte(caminho, megabytes, semente=0):
+    gerador = random.Random(semente)
+    linhas = [
+        'se (x1 >= 42) { total = total + 3.14; }\n',
+        'enquanto (i < 1000) { i = i + 1; }\n',
+        'valor_maximo = f(a, b, c) * 2;\n',
+    ]
+    with open(caminho, 'w', encoding='utf-8') as arquivo:
+        escritos = 0
+        while escritos < megabytes * 1_000_000:
+            linha = gerador.choice(linhas)
+            arquivo.write(linha)
+            escritos += len(linha)
+
+
+LIMITE_MEMORIA_MEDIDA = 4
+
+
+def _pico_memoria(analisador, caminho):
+    tracemalloc.start()
+    for _ in analisador.tokenizar_arquivo(caminho):
+        pass
+    _, pico = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    return pico
+
+
+def main():
+    analisador = AnalisadorLexico(REGRAS, ignorar={'ESP'})
+    print(f"{'MB':>5} {'tokens':>10} {'tempo':>9} {'MB/s':>7} {'pico memória':>13}")
+
+    with tempfile.TemporaryDirectory() as diretorio:
+        caminho = os.path.join(diretorio, 'fonte.txt')
+        for megabytes in [1, 4, 16]:
+            gerar_fonte(caminho, megabytes)
+            tamanho = os.path.getsize(caminho)
+
+            inicio = time.perf_counter()
+            total = sum(1 for _ in analisador.tokenizar_arquivo(caminho))
+            duracao = time.perf_counter() - inicio
+
+            memoria = '-'
+            if megabytes <= LIMITE_MEMORIA_MEDIDA:
+                memoria = f"{_pico_memoria(analisador, caminho) / 1024:.0f} KiB"
+
+            print(f"{tamanho / 1e6:>5.1f} {total:>10} {duracao:>8.3f}s {tamanho / duracao / 1e6:>7.2f} {memoria:>13}")
+
+
+if __name__ == "__main__":
+    main()
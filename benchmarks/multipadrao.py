@@ -0,0 +1,66 @@
+import random
+import time
+
+from conversor import ConversorERparaAFN
+from multipadrao import AFNMultiplo, ReconhecedorMultiplo
+from reconhecedor import ReconhecedorAFN
+
+
+LIMITE_SEPARADOS = 1000
+
+
+def gerar_padroes(n, semente=0):
+    gerador = random.Random(semente)
+    padroes = []
+    for _ in range(n):
+        prefixo = ''.join(gerador.choice('abcdefgh') for _ in range(gerador.randint(3, 6)))
+        padroes.append(prefixo + gerador.choice(['[0-9]+', '[a-z]*', '(x|y)?', '']))
+    return padroes
+
+
+def gerar_registros(padroes, total, semente=1):
+    gerador = random.Random(semente)
+    registros = []
+    for _ in range(total):
+        base = gerador.choice(padroes).split('[')[0].split('(')[0]
+        registros.append(base + gerador.choice(['', '42', 'zz', 'x']))
+    return registros
+
+
+def _cronometrar(funcao):
+    inicio = time.perf_counter()
+    resultado = funcao()
+    return resultado, time.perf_counter() - inicio
+
+
+def main():
+    print(f"{'padrões':>8} {'estados':>8} {'compilação':>11} {'varredura':>10} {'separados':>10} {'reg/s':>10}")
+
+    for n in [10, 100, 1000, 10000]:
+        padroes = gerar_padroes(n)
+        registros = gerar_registros(padroes, 2000)
+
+        afn, compilacao = _cronometrar(lambda: AFNMultiplo.combinar(padroes))
+        reconhecedor = ReconhecedorMultiplo(afn)
+        combinados, varredura = _cronometrar(lambda: [reconhecedor.padroes(r) for r in registros])
+
+        separados = '-'
+        if n <= LIMITE_SEPARADOS:
+            individuais = [
+                ReconhecedorAFN(ConversorERparaAFN(er).converter(), modo='afd_preguicoso', rastreamento='desligado')
+                for er in padroes
+            ]
+            esperados, tempo = _cronometrar(lambda: [
+                frozenset(i for i, r in enumerate(individuais) if r.aceita(registro)) for registro in registros
+            ])
+            assert esperados == combinados
+            separados = f"{tempo:.4f}s"
+
+        print(
+            f"{n:>8} {afn.total_estados():>8} {compilacao:>10.4f}s {varredura:>9.4f}s "
+            f"{separados:>10} {len(registros) / varredura:>10.0f}"
+        )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,42 @@
+import time
+
+from conversor import ConversorERparaAFN, ConversorGlushkov
+from reconhecedor import ReconhecedorAFN
+
+
+OPERANDO = '(a|b)'
+
+
+def _compilar(conversor, er):
+    inicio = time.perf_counter()
+    afn = conversor(er).converter()
+    return afn, time.perf_counter() - inicio
+
+
+def main():
+    print(f"{'n':>7} {'construção':<10} {'forma':<9} {'estados':>8} {'trans.':>8} {'compilação':>11} {'reconhecer':>11}")
+
+    for n in [10, 100, 1000, 10000]:
+        cadeia = 'ab' * (n // 2)
+        formas = [
+            ('{n}', f'{OPERANDO}{{{n}}}'),
+            ('{0,n}', f'{OPERANDO}{{0,{n}}}'),
+            ('{n,}', f'{OPERANDO}{{{n},}}'),
+            ('expandida', OPERANDO * n),
+        ]
+
+        for nome, conversor in [('thompson', ConversorERparaAFN), ('glushkov', ConversorGlushkov)]:
+            for forma, er in formas:
+                afn, compilacao = _compilar(conversor, er)
+                reconhecedor = ReconhecedorAFN(afn, modo='afd_preguicoso', rastreamento='desligado')
+                inicio = time.perf_counter()
+                reconhecedor.reconhecer(cadeia)
+                reconhecimento = time.perf_counter() - inicio
+                print(
+                    f"{n:>7} {nome:<10} {forma:<9} {afn.total_estados():>8} {afn.total_transicoes():>8} "
+                    f"{compilacao:>10.4f}s {reconhecimento:>10.4f}s"
+                )
+
+
+if __name__ == "__main__":
+    main()
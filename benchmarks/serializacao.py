@@ -0,0 +1,43 @@
+import os
+import tempfile
+import time
+
+from afn import AFN
+from compacto import AFNCompacto
+from conversor import ConversorERparaAFN
+
+
+def _cronometrar(funcao):
+    inicio = time.perf_counter()
+    resultado = funcao()
+    return resultado, time.perf_counter() - inicio
+
+
+def main():
+    print(f"{'alternativas':>12} {'estados':>8} {'compilar':>10} {'bin (KiB)':>10} {'carregar bin':>13} "
+          f"{'json (KiB)':>11} {'carregar json':>14} {'AFN de bin':>11}")
+
+    with tempfile.TemporaryDirectory() as diretorio:
+        binario = os.path.join(diretorio, 'automato.afnc')
+        texto = os.path.join(diretorio, 'automato.json')
+
+        for tamanho in [100, 1000, 10000, 50000]:
+            er = '(' + '|'.join(format(i, 'x') for i in range(tamanho)) + ')*'
+
+            compacto, compilacao = _cronometrar(lambda: ConversorERparaAFN(er).converter().compactar())
+            compacto.salvar(binario)
+            compacto.salvar(texto)
+
+            _, carga_binaria = _cronometrar(lambda: AFNCompacto.carregar(binario))
+            _, carga_json = _cronometrar(lambda: AFNCompacto.carregar(texto))
+            _, carga_afn = _cronometrar(lambda: AFN.carregar(binario))
+
+            print(
+                f"{tamanho:>12} {compacto.total_estados():>8} {compilacao:>9.4f}s "
+                f"{os.path.getsize(binario) / 1024:>10.1f} {carga_binaria:>12.4f}s "
+                f"{os.path.getsize(texto) / 1024:>11.1f} {carga_json:>13.4f}s {carga_afn:>10.4f}s"
+            )
+
+
+if __name__ == "__main__":
+    main()
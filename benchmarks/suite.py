@@ -0,0 +1,189 @@
+import argparse
+import gc
+import json
+import platform
+import sys
+import time
+
+from conversor import ConversorERparaAFN
+from reconhecedor import ReconhecedorAFN
+
+
+LIMITE_REGRESSAO_PADRAO = 0.25
+TEMPO_MINIMO_COMPARAVEL = 1e-3
+
+
+def _cronometrar(funcao, repeticoes):
+    melhor = float('inf')
+    for _ in range(repeticoes):
+        inicio = time.perf_counter()
+        funcao()
+        melhor = min(melhor, time.perf_counter() - inicio)
+    return melhor
+
+
+def _converter_sem_coleta(er):
+    coleta_ativa = gc.isenabled()
+    gc.disable()
+    try:
+        return ConversorERparaAFN(er).converter()
+    finally:
+        if coleta_ativa:
+            gc.enable()
+
+
+def _uniao_larga(n):
+    return '|'.join(format(i, 'x') for i in range(n))
+
+
+def _concatenacao_longa(n):
+    return ('ab' * n)[:n]
+
+
+def _estrelas_aninhadas(n):
+    return '(' * n + 'a' + ')*' * n
+
+
+FAMILIAS_CONVERSAO = {
+    'uniao_larga': (_uniao_larga, [10, 100, 1000, 10000]),
+    'concatenacao_longa': (_concatenacao_longa, [100, 1000, 10000, 100000]),
+    'estrelas_aninhadas': (_estrelas_aninhadas, [10, 100, 1000]),
+}
+
+FAMILIAS_RECONHECIMENTO = {
+    'a_ou_b_estrela': ('(a|b)*', lambda n: 'ab' * (n // 2)),
+    'estrelas_aninhadas': ('((a*)*)*', lambda n: 'a' * n),
+    'uniao_larga_estrela': ('(' + _uniao_larga(256) + ')*', lambda n: ('7f' * n)[:n]),
+}
+
+LIMITE_POR_MODO = {
+    'conjuntos': 10 ** 4,
+    'bits': 10 ** 6,
+    'afd_preguicoso': 10 ** 7,
+}
+
+
+def medir_conversao(repeticoes):
+    for familia, (gerar, tamanhos) in FAMILIAS_CONVERSAO.items():
+        for tamanho in tamanhos:
+            er = gerar(tamanho)
+            segundos = _cronometrar(lambda: ConversorERparaAFN(er).converter(), repeticoes)
+            yield {'nome': f'conversao/{familia}', 'parametro': tamanho, 'segundos': segundos}
+            segundos = _cronometrar(lambda: _converter_sem_coleta(er), repeticoes)
+            yield {'nome': f'conversao_sem_coleta/{familia}', 'parametro': tamanho, 'segundos': segundos}
+
+
+def medir_reconhecimento(repeticoes, tamanho_maximo):
+    tamanhos = [10 ** expoente for expoente in range(3, 8) if 10 ** expoente <= tamanho_maximo]
+
+    for familia, (er, gerar) in FAMILIAS_RECONHECIMENTO.items():
+        afn = ConversorERparaAFN(er).converter()
+        for modo, limite in LIMITE_POR_MODO.items():
+            reconhecedor = ReconhecedorAFN(afn, modo=modo, rastreamento='desligado')
+            for tamanho in tamanhos:
+                if tamanho > limite:
+                    continue
+                cadeia = gerar(tamanho)
+                segundos = _cronometrar(lambda: reconhecedor.reconhecer(cadeia), repeticoes)
+                yield {
+                    'nome': f'reconhecimento/{familia}/{modo}',
+                    'parametro': tamanho,
+                    'segundos': segundos,
+                    'simbolos_por_segundo': tamanho / segundos,
+                }
+
+
+def medir_visualizacao(repeticoes):
+    try:
+        import matplotlib
+        matplotlib.use('Agg')
+        import matplotlib.pyplot as plt
+        from visualizador import VisualizadorAFN
+    except ImportError:
+        return
+
+    for tamanho in [10, 50, 100]:
+        afn = ConversorERparaAFN(_uniao_larga(tamanho)).converter()
+
+        def desenhar():
+            plt.close(VisualizadorAFN(afn).visualizar())
+
+        segundos = _cronometrar(desenhar, repeticoes)
+        yield {'nome': 'visualizacao/uniao_larga', 'parametro': tamanho, 'segundos': segundos}
+
+
+def executar(repeticoes=3, tamanho_maximo=10 ** 6):
+    resultados = []
+    for medicoes in (
+        medir_conversao(repeticoes),
+        medir_reconhecimento(repeticoes, tamanho_maximo),
+        medir_visualizacao(repeticoes),
+    ):
+        for resultado in medicoes:
+            print(f"{resultado['nome']:<45} {resultado['parametro']:>10} {resultado['segundos']:>10.5f}s", file=sys.stderr)
+            resultados.append(resultado)
+
+    return {
+        'python': platform.python_version(),
+        'plataforma': platform.platform(),
+        'data': time.strftime('%Y-%m-%dT%H:%M:%S'),
+        'resultados': resultados,
+    }
+
+
+def comparar(base, atual, limite=LIMITE_REGRESSAO_PADRAO, tempo_minimo=TEMPO_MINIMO_COMPARAVEL):
+    anteriores = {(r['nome'], r['parametro']): r['segundos'] for r in base['resultados']}
+    regressoes = []
+
+    for resultado in atual['resultados']:
+        anterior = anteriores.get((resultado['nome'], resultado['parametro']))
+        if anterior is None or anterior < tempo_minimo:
+            continue
+        razao = resultado['segundos'] / anterior
+        if razao > 1 + limite:
+            regressoes.append({
+                'nome': resultado['nome'],
+                'parametro': resultado['parametro'],
+                'anterior': anterior,
+                'atual': resultado['segundos'],
+                'razao': razao,
+            })
+
+    return regressoes
+
+
+def main(argumentos=None):
+    parser = argparse.ArgumentParser(prog="python -m benchmarks.suite", description="Benchmarks de conversão, reconhecimento e visualização")
+    parser.add_argument("--saida", help="arquivo JSON onde gravar os resultados")
+    parser.add_argument("--base", help="arquivo JSON de uma execução anterior para comparação")
+    parser.add_argument("--limite", type=float, default=LIMITE_REGRESSAO_PADRAO, help="aumento relativo tolerado antes de acusar regressão")
+    parser.add_argument("--repeticoes", type=int, default=3)
+    parser.add_argument("--tamanho-maximo", type=int, default=10 ** 6, help="maior cadeia de entrada (até 10^7)")
+    opcoes = parser.parse_args(argumentos)
+
+    atual = executar(opcoes.repeticoes, opcoes.tamanho_maximo)
+
+    if opcoes.saida:
+        with open(opcoes.saida, 'w', encoding='utf-8') as arquivo:
+            json.dump(atual, arquivo, indent=2, ensure_ascii=False)
+    else:
+        json.dump(atual, sys.stdout, indent=2, ensure_ascii=False)
+        print()
+
+    if opcoes.base:
+        with open(opcoes.base, encoding='utf-8') as arquivo:
+            base = json.load(arquivo)
+        regressoes = comparar(base, atual, opcoes.limite)
+        for regressao in regressoes:
+            print(
+                f"REGRESSÃO {regressao['nome']} [{regressao['parametro']}]: "
+                f"{regressao['anterior']:.5f}s → {regressao['atual']:.5f}s ({regressao['razao']:.2f}x)",
+                file=sys.stderr,
+            )
+        return 1 if regressoes else 0
+
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,44 @@
+import time
+
+from conversor import ConversorERparaAFN
+
+
+LIMITE_COMPLETO = 2000
+
+
+def _uniao_larga(n):
+    return '(' + '|'.join(format(i, 'x') for i in range(n)) + ')*'
+
+
+def main():
+    try:
+        import matplotlib
+        matplotlib.use('Agg')
+        import matplotlib.pyplot as plt
+        from visualizador import VisualizadorAFN
+    except ImportError:
+        print("matplotlib não está instalado; benchmark de visualização ignorado")
+        return
+
+    print(f"{'n':>6} {'estados':>8} {'detalhe':<13} {'visíveis':>9} {'desenho':>10}")
+
+    for n in [10, 50, 100, 500, 1000, 5000]:
+        afn = ConversorERparaAFN(_uniao_larga(n)).converter()
+        total = afn.total_estados()
+
+        for detalhe in ['completo', 'simplificado']:
+            if detalhe == 'completo' and total > LIMITE_COMPLETO:
+                continue
+
+            visualizador = VisualizadorAFN(afn, detalhe=detalhe)
+            inicio = time.perf_counter()
+            fig = visualizador.visualizar()
+            fig.canvas.draw()
+            segundos = time.perf_counter() - inicio
+            plt.close(fig)
+
+            print(f"{n:>6} {total:>8} {detalhe:<13} {len(visualizador.posicoes):>9} {segundos:>9.4f}s")
+
+
+if __name__ == "__main__":
+    main()
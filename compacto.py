@@ -0,0 +1,405 @@
+import json
+import struct
+import sys
+import zlib
+from array import array
+from types import MappingProxyType
+
+from alfabeto import ClasseCaracteres, ClassesAlfabeto, particionar, restaurar_rotulo
+
+
+MAGICA = b'AFNC'
+VERSAO_FORMATO = 1
+_CABECALHO = struct.Struct('<4sHIQ')
+_CONTAGENS = struct.Struct('<qqqqq')
+_TAMANHO_SIMBOLO = struct.Struct('<I')
+
+
+class ErroFormatoAutomato(ValueError):
+    pass
+
+
+def _somente_leitura(tabela):
+    return memoryview(tabela).toreadonly()
+
+
+def _tabela_em_bytes(tabela):
+    tabela = array('q', tabela)
+    if sys.byteorder == 'big':
+        tabela.byteswap()
+    return tabela.tobytes()
+
+
+def _tabela_de_bytes(dados, inicio, quantidade):
+    fim = inicio + 8 * quantidade
+    if fim > len(dados):
+        raise ErroFormatoAutomato("Arquivo de autômato truncado")
+    tabela = array('q')
+    tabela.frombytes(dados[inicio:fim])
+    if sys.byteorder == 'big':
+        tabela.byteswap()
+    if tabela.itemsize != array('l').itemsize:
+        tabela = array('l', tabela)
+    return tabela, fim
+
+
+def _particionar_rotulos(simbolos):
+    indices = {simbolo: i for i, simbolo in enumerate(simbolos)}
+    grupos = {}
+    for inicio, fim, rotulos in particionar(simbolos):
+        grupos.setdefault(frozenset(indices[rotulo] for rotulo in rotulos), []).append((inicio, fim))
+
+    conjuntos = list(grupos)
+    particao = ClassesAlfabeto([grupos[conjunto] for conjunto in conjuntos])
+    return particao, ((),) + tuple(tuple(sorted(conjunto)) for conjunto in conjuntos)
+
+
+class RotuloEstado:
+    __slots__ = ('id',)
+
+    def __init__(self, id):
+        self.id = id
+
+    def __repr__(self):
+        return f"q{self.id}"
+
+
+class AFNCompacto:
+    def __init__(self, ids, inicial, finais, simbolos, deslocamentos, rotulos, destinos,
+                 deslocamentos_epsilon, destinos_epsilon):
+        self.ids = _somente_leitura(ids)
+        self.inicial = inicial
+        self.finais = _somente_leitura(finais)
+        self.simbolos = tuple(simbolos)
+        self.alfabeto = MappingProxyType({simbolo: i for i, simbolo in enumerate(simbolos)})
+        self.rotulos_classes = tuple(i for i, simbolo in enumerate(self.simbolos) if isinstance(simbolo, ClasseCaracteres))
+        self._indices_unitarios = tuple((i,) for i in range(len(self.simbolos)))
+        self._particao_rotulos, self._indices_particao = (
+            _particionar_rotulos(self.simbolos) if self.rotulos_classes else (None, ())
+        )
+        self.deslocamentos = _somente_leitura(deslocamentos)
+        self.rotulos = _somente_leitura(rotulos)
+        self.destinos = _somente_leitura(destinos)
+        self.deslocamentos_epsilon = _somente_leitura(deslocamentos_epsilon)
+        self.destinos_epsilon = _somente_leitura(destinos_epsilon)
+        self._congelado = True
+
+    def __setattr__(self, nome, valor):
+        if getattr(self, '_congelado', False):
+            raise AttributeError("AFNCompacto é imutável")
+        super().__setattr__(nome, valor)
+
+    def __reduce__(self):
+        return (AFNCompacto, (
+            array('l', self.ids), self.inicial, bytearray(self.finais), self.simbolos,
+            array('l', self.deslocamentos), array('l', self.rotulos), array('l', self.destinos),
+            array('l', self.deslocamentos_epsilon), array('l', self.destinos_epsilon),
+        ))
+
+    @classmethod
+    def de_afn(cls, afn):
+        estados = afn.obter_todos_estados()
+        indices = {estado: i for i, estado in enumerate(estados)}
+        simbolos = sorted({s for estado in estados for s in estado.transicoes if s != 'ε'})
+        alfabeto = {simbolo: i for i, simbolo in enumerate(simbolos)}
+
+        deslocamentos = array('l', [0])
+        rotulos = array('l')
+        destinos = array('l')
+        deslocamentos_epsilon = array('l', [0])
+        destinos_epsilon = array('l')
+
+        for estado in estados:
+            for simbolo in sorted(estado.transicoes, key=lambda s: alfabeto.get(s, -1)):
+                for destino in estado.transicoes[simbolo]:
+                    if simbolo == 'ε':
+                        destinos_epsilon.append(indices[destino])
+                    else:
+                        rotulos.append(alfabeto[simbolo])
+                        destinos.append(indices[destino])
+            deslocamentos.append(len(destinos))
+            deslocamentos_epsilon.append(len(destinos_epsilon))
+
+        return cls(
+            array('l', (estado.id for estado in estados)),
+            indices[afn.estado_inicial],
+            bytearray(estado.eh_final for estado in estados),
+            simbolos,
+            deslocamentos,
+            rotulos,
+            destinos,
+            deslocamentos_epsilon,
+            destinos_epsilon,
+        )
+
+    def total_estados(self):
+        return len(self.ids)
+
+    def total_transicoes(self):
+        return len(self.destinos) + len(self.destinos_epsilon)
+
+    def rotulo(self, estado):
+        return RotuloEstado(self.ids[estado])
+
+    def obter_todos_estados(self):
+        return list(range(self.total_estados()))
+
+    def indices_do_simbolo(self, simbolo):
+        if self._particao_rotulos is None:
+            indice = self.alfabeto.get(simbolo)
+            return () if indice is None else self._indices_unitarios[indice]
+        return self._indices_particao[self._particao_rotulos.classe(simbolo)]
+
+    def sucessores(self, estado, simbolo):
+        indices = self.indices_do_simbolo(simbolo)
+        if not indices:
+            return []
+        rotulos = self.rotulos
+        destinos = self.destinos
+        return [
+            destinos[k]
+            for k in range(self.deslocamentos[estado], self.deslocamentos[estado + 1])
+            if rotulos[k] in indices
+        ]
+
+    def sucessores_epsilon(self, estado):
+        inicio = self.deslocamentos_epsilon[estado]
+        fim = self.deslocamentos_epsilon[estado + 1]
+        return self.destinos_epsilon[inicio:fim]
+
+    def transicoes_do_estado(self, estado):
+        transicoes = {}
+        for k in range(self.deslocamentos[estado], self.deslocamentos[estado + 1]):
+            transicoes.setdefault(self.simbolos[self.rotulos[k]], []).append(self.destinos[k])
+        epsilon = self.sucessores_epsilon(estado)
+        if epsilon:
+            transicoes['ε'] = list(epsilon)
+        return transicoes
+
+    def obter_transicoes(self):
+        transicoes = []
+
+        for estado in self.obter_todos_estados():
+            for simbolo, destinos in self.transicoes_do_estado(estado).items():
+                for destino in destinos:
+                    transicoes.append((estado, simbolo, destino))
+
+        return transicoes
+
+    def classes_alfabeto(self):
+        simbolos = self.simbolos
+        rotulos = self.rotulos
+        destinos = self.destinos
+        deslocamentos = self.deslocamentos
+        return ClassesAlfabeto.de_transicoes(
+            (estado, simbolos[rotulos[k]], destinos[k])
+            for estado in range(self.total_estados())
+            for k in range(deslocamentos[estado], deslocamentos[estado + 1])
+        )
+
+    def exibir_texto(self):
+        estados = self.obter_todos_estados()
+        finais = [str(self.rotulo(e)) for e in estados if self.finais[e]]
+
+        resultado = []
+        resultado.append("="*60)
+        resultado.append("ESTRUTURA DO AFN-ε")
+        resultado.append("="*60)
+        resultado.append(f"Estado Inicial: {self.rotulo(self.inicial)}")
+        if len(finais) == 1:
+            resultado.append(f"Estado Final: {finais[0]}")
+        else:
+            resultado.append(f"Estados Finais: {', '.join(finais)}")
+        resultado.append(f"\nTotal de Estados: {len(estados)}")
+        resultado.append("\nTransições:")
+        resultado.append("-"*60)
+
+        for estado in estados:
+            marcador = " (INICIAL)" if estado == self.inicial else ""
+            marcador += " (FINAL)" if self.finais[estado] else ""
+            resultado.append(f"\n{self.rotulo(estado)}{marcador}:")
+
+            transicoes = self.transicoes_do_estado(estado)
+            if not transicoes:
+                resultado.append("  (sem transições)")
+            else:
+                for simbolo, destinos in sorted(transicoes.items()):
+                    destinos_str = ", ".join(str(self.rotulo(d)) for d in destinos)
+                    resultado.append(f"  {simbolo} → {destinos_str}")
+
+        resultado.append("="*60)
+        return "\n".join(resultado)
+
+    def para_bytes(self):
+        partes = [
+            _CONTAGENS.pack(
+                len(self.ids), len(self.simbolos), len(self.destinos), len(self.destinos_epsilon), self.inicial
+            ),
+            _tabela_em_bytes(self.ids),
+            bytes(self.finais),
+        ]
+        for simbolo in self.simbolos:
+            codificado = simbolo.encode('utf-8')
+            partes.append(_TAMANHO_SIMBOLO.pack(len(codificado)))
+            partes.append(codificado)
+        for tabela in (self.deslocamentos, self.rotulos, self.destinos, self.deslocamentos_epsilon, self.destinos_epsilon):
+            partes.append(_tabela_em_bytes(tabela))
+
+        corpo = b''.join(partes)
+        return _CABECALHO.pack(MAGICA, VERSAO_FORMATO, zlib.crc32(corpo), len(corpo)) + corpo
+
+    @classmethod
+    def de_bytes(cls, dados):
+        dados = memoryview(dados)
+        if len(dados) < _CABECALHO.size:
+            raise ErroFormatoAutomato("Arquivo de autômato truncado")
+
+        magica, versao, soma, tamanho = _CABECALHO.unpack_from(dados)
+        if magica != MAGICA:
+            raise ErroFormatoAutomato("Arquivo não contém um autômato compilado")
+        if versao != VERSAO_FORMATO:
+            raise ErroFormatoAutomato(f"Versão de formato não suportada: {versao}")
+
+        corpo = dados[_CABECALHO.size:]
+        if len(corpo) != tamanho:
+            raise ErroFormatoAutomato("Arquivo de autômato truncado")
+        if zlib.crc32(corpo) != soma:
+            raise ErroFormatoAutomato("Soma de verificação não confere")
+
+        total_estados, total_simbolos, total_transicoes, total_epsilon, inicial = _CONTAGENS.unpack_from(corpo)
+        posicao = _CONTAGENS.size
+
+        ids, posicao = _tabela_de_bytes(corpo, posicao, total_estados)
+        finais = bytearray(corpo[posicao:posicao + total_estados])
+        posicao += total_estados
+
+        simbolos = []
+        for _ in range(total_simbolos):
+            (tamanho_simbolo,) = _TAMANHO_SIMBOLO.unpack_from(corpo, posicao)
+            posicao += _TAMANHO_SIMBOLO.size
+            simbolos.append(restaurar_rotulo(str(corpo[posicao:posicao + tamanho_simbolo], 'utf-8')))
+            posicao += tamanho_simbolo
+
+        deslocamentos, posicao = _tabela_de_bytes(corpo, posicao, total_estados + 1)
+        rotulos, posicao = _tabela_de_bytes(corpo, posicao, total_transicoes)
+        destinos, posicao = _tabela_de_bytes(corpo, posicao, total_transicoes)
+        deslocamentos_epsilon, posicao = _tabela_de_bytes(corpo, posicao, total_estados + 1)
+        destinos_epsilon, posicao = _tabela_de_bytes(corpo, posicao, total_epsilon)
+
+        return cls(
+            ids, inicial, finais, simbolos, deslocamentos, rotulos, destinos,
+            deslocamentos_epsilon, destinos_epsilon,
+        )
+
+    def _conteudo_json(self):
+        return {
+            'formato': 'afn-compacto',
+            'versao': VERSAO_FORMATO,
+            'inicial': self.inicial,
+            'simbolos': list(self.simbolos),
+            'estados': [
+                {'id': self.ids[estado], 'final': bool(self.finais[estado]), 'transicoes': self.transicoes_do_estado(estado)}
+                for estado in range(self.total_estados())
+            ],
+        }
+
+    @staticmethod
+    def _soma_json(conteudo):
+        canonico = json.dumps(conteudo, sort_keys=True, separators=(',', ':'), ensure_ascii=False)
+        return zlib.crc32(canonico.encode('utf-8'))
+
+    def para_json(self):
+        conteudo = self._conteudo_json()
+        conteudo['soma_verificacao'] = self._soma_json(conteudo)
+        return json.dumps(conteudo, indent=2, ensure_ascii=False)
+
+    @classmethod
+    def de_json(cls, texto):
+        try:
+            conteudo = json.loads(texto)
+        except ValueError:
+            raise ErroFormatoAutomato("Arquivo não contém um autômato compilado")
+
+        if not isinstance(conteudo, dict) or conteudo.get('formato') != 'afn-compacto':
+            raise ErroFormatoAutomato("Arquivo não contém um autômato compilado")
+        if conteudo.get('versao') != VERSAO_FORMATO:
+            raise ErroFormatoAutomato(f"Versão de formato não suportada: {conteudo.get('versao')}")
+        soma = conteudo.pop('soma_verificacao', None)
+        if soma != cls._soma_json(conteudo):
+            raise ErroFormatoAutomato("Soma de verificação não confere")
+
+        simbolos = [restaurar_rotulo(simbolo) for simbolo in conteudo['simbolos']]
+        alfabeto = {simbolo: i for i, simbolo in enumerate(simbolos)}
+        ids = array('l')
+        finais = bytearray()
+        deslocamentos = array('l', [0])
+        rotulos = array('l')
+        destinos = array('l')
+        deslocamentos_epsilon = array('l', [0])
+        destinos_epsilon = array('l')
+
+        for estado in conteudo['estados']:
+            ids.append(estado['id'])
+            finais.append(estado['final'])
+            transicoes = estado['transicoes']
+            for simbolo in sorted(transicoes, key=lambda s: alfabeto.get(s, -1)):
+                for destino in transicoes[simbolo]:
+                    if simbolo == 'ε':
+                        destinos_epsilon.append(destino)
+                    else:
+                        rotulos.append(alfabeto[simbolo])
+                        destinos.append(destino)
+            deslocamentos.append(len(destinos))
+            deslocamentos_epsilon.append(len(destinos_epsilon))
+
+        return cls(
+            ids, conteudo['inicial'], finais, simbolos, deslocamentos, rotulos, destinos,
+            deslocamentos_epsilon, destinos_epsilon,
+        )
+
+    def salvar(self, caminho, formato=None):
+        if formato is None:
+            formato = 'json' if str(caminho).endswith('.json') else 'binario'
+
+        if formato == 'json':
+            with open(caminho, 'w', encoding='utf-8') as arquivo:
+                arquivo.write(self.para_json())
+        elif formato == 'binario':
+            with open(caminho, 'wb') as arquivo:
+                arquivo.write(self.para_bytes())
+        else:
+            raise ValueError(f"Formato de serialização inválido: {formato}")
+
+    @classmethod
+    def carregar(cls, caminho):
+        with open(caminho, 'rb') as arquivo:
+            dados = arquivo.read()
+
+        if dados[:len(MAGICA)] == MAGICA:
+            return cls.de_bytes(dados)
+        try:
+            texto = dados.decode('utf-8')
+        except UnicodeDecodeError:
+            raise ErroFormatoAutomato("Arquivo não contém um autômato compilado")
+        return cls.de_json(texto)
+
+    def memoria_bytes(self):
+        tabelas = (
+            self.ids, self.finais, self.deslocamentos, self.rotulos, self.destinos,
+            self.deslocamentos_epsilon, self.destinos_epsilon,
+        )
+        total = sum(sys.getsizeof(tabela) + tabela.nbytes for tabela in tabelas)
+        total += sys.getsizeof(self.simbolos) + sys.getsizeof(dict(self.alfabeto))
+        return total
+
+    def bytes_por_estado(self):
+        return self.memoria_bytes() / max(self.total_estados(), 1)
+
+
+def memoria_grafo_objetos(afn):
+    total = 0
+    for estado in afn.obter_todos_estados():
+        total += sys.getsizeof(estado) + sys.getsizeof(estado.__dict__)
+        total += sys.getsizeof(estado.transicoes)
+        total += sum(sys.getsizeof(destinos) for destinos in estado.transicoes.values())
+    return total
@@ -1,69 +1,159 @@
-from afn import Estado, AFN
+import threading
+from collections import OrderedDict
+from contextlib import nullcontext
+
+from afn import AFN, FabricaEstados
+from alfabeto import ErroClasseCaracteres, ler_classe
+
+
+LIMITE_REPETICAO = 100000
+
+
+class ErroSintaxeER(ValueError):
+    def __init__(self, mensagem, posicao):
+        super().__init__(f"{mensagem} na posição {posicao}")
+        self.posicao = posicao
 
 
 class ConversorERparaAFN:
-    def __init__(self, expressao_regular):
+    def __init__(self, expressao_regular, instrumentacao=None):
         self.er = expressao_regular
         self.posicao = 0
+        self.fabrica = FabricaEstados()
+        self.instrumentacao = instrumentacao
 
-    def converter(self):
-        Estado.contador = 0
-        return self._expressao()
+        if instrumentacao is not None:
+            self._simbolo = instrumentacao.contar(self._simbolo, 'simbolos')
+            self._concatenacao = instrumentacao.contar(self._concatenacao, 'concatenacoes')
+            self._uniao = instrumentacao.contar(self._uniao, 'unioes')
+            self._fechamento = instrumentacao.contar(self._fechamento, 'fechamentos')
+            self._mais = instrumentacao.contar(self._mais, 'positivos')
+            self._opcional = instrumentacao.contar(self._opcional, 'opcionais')
+            self._repeticao = instrumentacao.contar(self._repeticao, 'repeticoes')
 
-    def _proximo_char(self):
-        if self.posicao < len(self.er):
-            return self.er[self.posicao]
-        return None
+    def _fase(self, nome):
+        if self.instrumentacao is None:
+            return nullcontext()
+        return self.instrumentacao.fase(nome)
 
-    def _consumir_char(self):
-        char = self._proximo_char()
-        self.posicao += 1
-        return char
+    def converter(self, fabrica=None):
+        self.fabrica = fabrica if fabrica is not None else FabricaEstados()
+        primeiro_id = self.fabrica.proximo_id
 
-    def _expressao(self):
-        termo = self._termo()
+        self._iniciar()
+        with self._fase('analise'):
+            fragmento = self._analisar()
+        with self._fase('finalizacao'):
+            afn = self._finalizar(fragmento)
 
-        if self._proximo_char() == '|':
-            self._consumir_char()
-            expressao_direita = self._expressao()
-            return self._uniao(termo, expressao_direita)
+        if self.instrumentacao is not None:
+            criados = self.fabrica.proximo_id - primeiro_id
+            self.instrumentacao.estatisticas.incrementar('estados_criados', criados)
+            self.instrumentacao.notificar('conversao', {'expressao': self.er, 'estados': criados})
+        return afn
 
-        return termo
+    def _iniciar(self):
+        pass
+
+    def _finalizar(self, afn):
+        return afn
 
-    def _termo(self):
-        fator = self._fator()
+    def _analisar(self):
+        pilha = []
+        alternativas = []
+        fatores = []
+        retomar = 0
 
-        proximo = self._proximo_char()
-        if proximo and proximo not in ['|', ')', None]:
-            termo_direita = self._termo()
-            return self._concatenacao(fator, termo_direita)
+        for posicao, char in enumerate(self.er):
+            if posicao < retomar:
+                continue
+            self.posicao = posicao
 
-        return fator
+            if char == '[':
+                try:
+                    rotulo, retomar = ler_classe(self.er, posicao)
+                except ErroClasseCaracteres as erro:
+                    raise ErroSintaxeER(erro.mensagem, erro.posicao)
+                fatores.append(self._simbolo(rotulo))
+            elif char == '(':
+                pilha.append((posicao, alternativas, fatores))
+                alternativas = []
+                fatores = []
+            elif char == ')':
+                if not pilha:
+                    raise ErroSintaxeER("Parêntese ')' sem '(' correspondente", posicao)
+                grupo = self._fechar_grupo(alternativas, fatores, posicao)
+                _, alternativas, fatores = pilha.pop()
+                fatores.append(grupo)
+            elif char == '|':
+                alternativas.append(self._fechar_termo(fatores, posicao))
+                fatores = []
+            elif char in '*+?{':
+                if not fatores:
+                    raise ErroSintaxeER(f"Operador '{char}' sem operando", posicao)
+                if char == '*':
+                    fatores[-1] = self._fechamento(fatores[-1])
+                elif char == '+':
+                    fatores[-1] = self._mais(fatores[-1])
+                elif char == '?':
+                    fatores[-1] = self._opcional(fatores[-1])
+                else:
+                    minimo, maximo, retomar = self._ler_quantificador(posicao)
+                    fatores[-1] = self._repeticao(fatores[-1], minimo, maximo)
+            else:
+                fatores.append(self._simbolo(char))
 
-    def _fator(self):
-        base = self._base()
+        self.posicao = len(self.er)
 
-        if self._proximo_char() == '*':
-            self._consumir_char()
-            return self._fechamento(base)
+        if pilha:
+            raise ErroSintaxeER("Parêntese '(' não foi fechado", pilha[-1][0])
 
-        return base
+        return self._fechar_grupo(alternativas, fatores, self.posicao)
 
-    def _base(self):
-        char = self._proximo_char()
+    def _ler_quantificador(self, posicao):
+        fim = self.er.find('}', posicao)
+        if fim == -1:
+            raise ErroSintaxeER("Chave '{' não foi fechada", posicao)
 
-        if char == '(':
-            self._consumir_char()
-            expressao = self._expressao()
-            self._consumir_char()
-            return expressao
+        partes = self.er[posicao + 1:fim].split(',')
+        if len(partes) > 2 or not _numeral(partes[0]) or (len(partes) == 2 and partes[1] and not _numeral(partes[1])):
+            raise ErroSintaxeER("Quantificador '{' malformado", posicao)
 
-        simbolo = self._consumir_char()
-        return self._simbolo(simbolo)
+        minimo = int(partes[0])
+        if len(partes) == 1:
+            maximo = minimo
+        else:
+            maximo = int(partes[1]) if partes[1] else None
+
+        if maximo is not None and maximo < minimo:
+            raise ErroSintaxeER("Quantificador com máximo menor que o mínimo", posicao)
+        if max(minimo, maximo or 0) > LIMITE_REPETICAO:
+            raise ErroSintaxeER(f"Quantificador excede o limite de {LIMITE_REPETICAO} repetições", posicao)
+
+        return minimo, maximo, fim + 1
+
+    def _fechar_termo(self, fatores, posicao):
+        if not fatores:
+            raise ErroSintaxeER("Alternativa vazia", posicao)
+
+        termo = fatores[-1]
+        for fator in reversed(fatores[:-1]):
+            termo = self._concatenacao(fator, termo)
+
+        return termo
+
+    def _fechar_grupo(self, alternativas, fatores, posicao):
+        alternativas.append(self._fechar_termo(fatores, posicao))
+
+        expressao = alternativas[-1]
+        for alternativa in reversed(alternativas[:-1]):
+            expressao = self._uniao(alternativa, expressao)
+
+        return expressao
 
     def _simbolo(self, simbolo):
-        inicial = Estado()
-        final = Estado()
+        inicial = self.fabrica.novo()
+        final = self.fabrica.novo()
         inicial.adicionar_transicao(simbolo, final)
         return AFN(inicial, final)
 
@@ -73,8 +163,8 @@ class ConversorERparaAFN:
         return AFN(afn1.estado_inicial, afn2.estado_final)
 
     def _uniao(self, afn1, afn2):
-        novo_inicial = Estado()
-        novo_final = Estado()
+        novo_inicial = self.fabrica.novo()
+        novo_final = self.fabrica.novo()
 
         novo_inicial.adicionar_transicao('ε', afn1.estado_inicial)
         novo_inicial.adicionar_transicao('ε', afn2.estado_inicial)
@@ -88,8 +178,8 @@ class ConversorERparaAFN:
         return AFN(novo_inicial, novo_final)
 
     def _fechamento(self, afn):
-        novo_inicial = Estado()
-        novo_final = Estado()
+        novo_inicial = self.fabrica.novo()
+        novo_final = self.fabrica.novo()
 
         novo_inicial.adicionar_transicao('ε', afn.estado_inicial)
         novo_inicial.adicionar_transicao('ε', novo_final)
@@ -99,4 +189,286 @@ class ConversorERparaAFN:
         afn.estado_final.adicionar_transicao('ε', afn.estado_inicial)
         afn.estado_final.adicionar_transicao('ε', novo_final)
 
-        return AFN(novo_inicial, novo_final)
\ No newline at end of file
+        return AFN(novo_inicial, novo_final)
+
+    def _mais(self, afn):
+        novo_inicial = self.fabrica.novo()
+        novo_final = self.fabrica.novo()
+
+        novo_inicial.adicionar_transicao('ε', afn.estado_inicial)
+
+        afn.estado_final.eh_final = False
+
+        afn.estado_final.adicionar_transicao('ε', afn.estado_inicial)
+        afn.estado_final.adicionar_transicao('ε', novo_final)
+
+        return AFN(novo_inicial, novo_final)
+
+    def _opcional(self, afn):
+        novo_inicial = self.fabrica.novo()
+        novo_final = self.fabrica.novo()
+
+        novo_inicial.adicionar_transicao('ε', afn.estado_inicial)
+        novo_inicial.adicionar_transicao('ε', novo_final)
+
+        afn.estado_final.eh_final = False
+        afn.estado_final.adicionar_transicao('ε', novo_final)
+
+        return AFN(novo_inicial, novo_final)
+
+    def _vazio(self):
+        inicial = self.fabrica.novo()
+        final = self.fabrica.novo()
+        inicial.adicionar_transicao('ε', final)
+        return AFN(inicial, final)
+
+    def _copiar(self, afn, inicial, final):
+        copias = {afn.estado_inicial: inicial, afn.estado_final: final}
+        pilha = [afn.estado_inicial]
+
+        while pilha:
+            estado = pilha.pop()
+            copia = copias[estado]
+            for simbolo, destinos in estado.transicoes.items():
+                for destino in destinos:
+                    if destino not in copias:
+                        copias[destino] = self.fabrica.novo()
+                        pilha.append(destino)
+                    copia.adicionar_transicao(simbolo, copias[destino])
+
+    def _encadear_copias(self, afn, total):
+        fronteiras = [afn.estado_inicial, afn.estado_final]
+        afn.estado_final.eh_final = False
+
+        for _ in range(total - 1):
+            fronteiras.append(self.fabrica.novo())
+            self._copiar(afn, fronteiras[-2], fronteiras[-1])
+
+        return fronteiras
+
+    def _repeticao(self, afn, minimo, maximo):
+        if maximo == 0:
+            return self._vazio()
+        if maximo is None and minimo <= 1:
+            return self._fechamento(afn) if minimo == 0 else self._mais(afn)
+
+        if maximo is None:
+            ultimo = AFN(self.fabrica.novo(), self.fabrica.novo())
+            self._copiar(afn, ultimo.estado_inicial, ultimo.estado_final)
+            fronteiras = self._encadear_copias(afn, minimo - 1)
+            return self._concatenacao(AFN(fronteiras[0], fronteiras[-1]), self._mais(ultimo))
+
+        fronteiras = self._encadear_copias(afn, maximo)
+        final = fronteiras[-1]
+        for fronteira in fronteiras[minimo:-1]:
+            fronteira.adicionar_transicao('ε', final)
+
+        return AFN(fronteiras[0], final)
+
+
+def _numeral(texto):
+    return texto.isascii() and texto.isdigit()
+
+
+def _unir(conjunto1, conjunto2):
+    if len(conjunto1) < len(conjunto2):
+        conjunto1, conjunto2 = conjunto2, conjunto1
+    conjunto1 |= conjunto2
+    return conjunto1
+
+
+class ConversorGlushkov(ConversorERparaAFN):
+    def _iniciar(self):
+        self.estado_inicial = self.fabrica.novo()
+        self.posicoes = []
+        self.simbolos = {}
+        self.seguintes = {}
+
+    def _ligar(self, ultimos, primeiros):
+        for estado in ultimos:
+            seguintes = self.seguintes.get(estado)
+            if seguintes is None:
+                self.seguintes[estado] = set(primeiros)
+            else:
+                seguintes |= primeiros
+
+    def _nova_posicao(self, simbolo):
+        posicao = self.fabrica.novo()
+        self.posicoes.append(posicao)
+        self.simbolos[posicao] = simbolo
+        return posicao
+
+    def _simbolo(self, simbolo):
+        posicao = self._nova_posicao(simbolo)
+        return (False, {posicao}, {posicao})
+
+    def _concatenacao(self, fragmento1, fragmento2):
+        anulavel1, primeiros1, ultimos1 = fragmento1
+        anulavel2, primeiros2, ultimos2 = fragmento2
+
+        self._ligar(ultimos1, primeiros2)
+
+        primeiros = _unir(primeiros1, primeiros2) if anulavel1 else primeiros1
+        ultimos = _unir(ultimos2, ultimos1) if anulavel2 else ultimos2
+        return (anulavel1 and anulavel2, primeiros, ultimos)
+
+    def _uniao(self, fragmento1, fragmento2):
+        anulavel1, primeiros1, ultimos1 = fragmento1
+        anulavel2, primeiros2, ultimos2 = fragmento2
+        return (anulavel1 or anulavel2, _unir(primeiros1, primeiros2), _unir(ultimos1, ultimos2))
+
+    def _fechamento(self, fragmento):
+        _, primeiros, ultimos = fragmento
+        self._ligar(ultimos, primeiros)
+        return (True, primeiros, ultimos)
+
+    def _mais(self, fragmento):
+        anulavel, primeiros, ultimos = fragmento
+        self._ligar(ultimos, primeiros)
+        return (anulavel, primeiros, ultimos)
+
+    def _opcional(self, fragmento):
+        _, primeiros, ultimos = fragmento
+        return (True, primeiros, ultimos)
+
+    def _vazio(self):
+        return (True, set(), set())
+
+    def _copiar(self, fragmento):
+        anulavel, primeiros, ultimos = fragmento
+        copias = {}
+        pilha = sorted(primeiros, key=lambda e: e.id)
+        for posicao in pilha:
+            copias[posicao] = self._nova_posicao(self.simbolos[posicao])
+
+        while pilha:
+            posicao = pilha.pop()
+            for seguinte in sorted(self.seguintes.get(posicao, ()), key=lambda e: e.id):
+                if seguinte not in copias:
+                    copias[seguinte] = self._nova_posicao(self.simbolos[seguinte])
+                    pilha.append(seguinte)
+
+        for posicao, copia in copias.items():
+            seguintes = self.seguintes.get(posicao)
+            if seguintes:
+                self.seguintes[copia] = {copias[seguinte] for seguinte in seguintes}
+
+        return (anulavel, {copias[p] for p in primeiros}, {copias[p] for p in ultimos})
+
+    def _repeticao(self, fragmento, minimo, maximo):
+        if maximo == 0:
+            return self._vazio()
+        if maximo is None and minimo <= 1:
+            return self._fechamento(fragmento) if minimo == 0 else self._mais(fragmento)
+
+        total = minimo if maximo is None else maximo
+        copias = [fragmento] + [self._copiar(fragmento) for _ in range(total - 1)]
+
+        resultado = None
+        if maximo is None:
+            copias[-1] = self._mais(copias[-1])
+        else:
+            for copia in reversed(copias[minimo:]):
+                resultado = self._opcional(copia if resultado is None else self._concatenacao(copia, resultado))
+            copias = copias[:minimo]
+
+        for copia in reversed(copias):
+            resultado = copia if resultado is None else self._concatenacao(copia, resultado)
+
+        return resultado
+
+    def _finalizar(self, fragmento):
+        anulavel, primeiros, ultimos = fragmento
+        inicial = self.estado_inicial
+
+        inicial.eh_final = anulavel
+        for posicao in ultimos:
+            posicao.eh_final = True
+
+        for origem, destinos in [(inicial, primeiros)] + list(self.seguintes.items()):
+            for destino in sorted(destinos, key=lambda e: e.id):
+                origem.adicionar_transicao(self.simbolos[destino], destino)
+
+        return AFN(inicial)
+
+
+CONSTRUCOES = {
+    'thompson': ConversorERparaAFN,
+    'glushkov': ConversorGlushkov,
+}
+
+
+class CacheCompilacao:
+    def __init__(self, tamanho_maximo=128, bytes_maximo=None):
+        self.tamanho_maximo = tamanho_maximo
+        self.bytes_maximo = bytes_maximo
+        self._entradas = OrderedDict()
+        self._bytes = 0
+        self._trava = threading.Lock()
+        self.acertos = 0
+        self.faltas = 0
+        self.remocoes = 0
+
+    def obter(self, er, construcao='thompson', eliminar_epsilon=False):
+        chave = (er, construcao, eliminar_epsilon)
+
+        with self._trava:
+            compacto = self._entradas.get(chave)
+            if compacto is not None:
+                self._entradas.move_to_end(chave)
+                self.acertos += 1
+                return compacto
+            self.faltas += 1
+
+        afn = CONSTRUCOES[construcao](er).converter()
+        if eliminar_epsilon:
+            afn = afn.eliminar_epsilon()
+        compacto = afn.compactar()
+
+        with self._trava:
+            if chave not in self._entradas:
+                self._entradas[chave] = compacto
+                self._bytes += compacto.memoria_bytes()
+                self._remover_excedentes()
+            return self._entradas.get(chave, compacto)
+
+    def _remover_excedentes(self):
+        while self._entradas and (
+            (self.tamanho_maximo is not None and len(self._entradas) > self.tamanho_maximo)
+            or (self.bytes_maximo is not None and self._bytes > self.bytes_maximo)
+        ):
+            _, compacto = self._entradas.popitem(last=False)
+            self._bytes -= compacto.memoria_bytes()
+            self.remocoes += 1
+
+    def limpar(self):
+        with self._trava:
+            self._entradas.clear()
+            self._bytes = 0
+
+    def estatisticas(self):
+        with self._trava:
+            return {
+                'entradas': len(self._entradas),
+                'bytes': self._bytes,
+                'acertos': self.acertos,
+                'faltas': self.faltas,
+                'remocoes': self.remocoes,
+            }
+
+
+_cache = CacheCompilacao()
+
+
+def configurar_cache(tamanho_maximo=128, bytes_maximo=None):
+    global _cache
+    _cache = CacheCompilacao(tamanho_maximo, bytes_maximo)
+    return _cache
+
+
+def compilar(er, construcao='thompson', eliminar_epsilon=False):
+    return _cache.obter(er, construcao, eliminar_epsilon)
+
+
+def compilar_afn(er, construcao='thompson', eliminar_epsilon=False):
+    return AFN.de_compacto(compilar(er, construcao, eliminar_epsilon))
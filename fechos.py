@@ -0,0 +1,65 @@
+def _sucessores_epsilon(estado):
+    return estado.transicoes.get('ε', ())
+
+
+def calcular_fechos_epsilon(estados, sucessores_epsilon=_sucessores_epsilon):
+    indice = {}
+    menor = {}
+    pilha_componente = []
+    na_pilha = set()
+    fechos = {}
+
+    for raiz in estados:
+        if raiz in indice:
+            continue
+
+        indice[raiz] = menor[raiz] = len(indice)
+        pilha_componente.append(raiz)
+        na_pilha.add(raiz)
+        trabalho = [(raiz, iter(sucessores_epsilon(raiz)))]
+
+        while trabalho:
+            estado, sucessores = trabalho[-1]
+            avancou = False
+
+            for destino in sucessores:
+                if destino not in indice:
+                    indice[destino] = menor[destino] = len(indice)
+                    pilha_componente.append(destino)
+                    na_pilha.add(destino)
+                    trabalho.append((destino, iter(sucessores_epsilon(destino))))
+                    avancou = True
+                    break
+                if destino in na_pilha:
+                    menor[estado] = min(menor[estado], indice[destino])
+
+            if avancou:
+                continue
+
+            trabalho.pop()
+            if trabalho:
+                pai = trabalho[-1][0]
+                menor[pai] = min(menor[pai], menor[estado])
+
+            if menor[estado] != indice[estado]:
+                continue
+
+            componente = []
+            while True:
+                membro = pilha_componente.pop()
+                na_pilha.discard(membro)
+                componente.append(membro)
+                if membro == estado:
+                    break
+
+            fecho = set(componente)
+            for membro in componente:
+                for destino in sucessores_epsilon(membro):
+                    if destino in fechos:
+                        fecho |= fechos[destino]
+
+            fecho = frozenset(fecho)
+            for membro in componente:
+                fechos[membro] = fecho
+
+    return fechos
@@ -0,0 +1,81 @@
+import time
+from contextlib import contextmanager
+
+
+class Estatisticas:
+    def __init__(self):
+        self.contadores = {}
+        self.picos = {}
+        self.tempos = {}
+
+    def incrementar(self, nome, valor=1):
+        self.contadores[nome] = self.contadores.get(nome, 0) + valor
+
+    def registrar_pico(self, nome, valor):
+        if valor > self.picos.get(nome, 0):
+            self.picos[nome] = valor
+
+    def registrar_tempo(self, fase, segundos):
+        self.tempos[fase] = self.tempos.get(fase, 0.0) + segundos
+
+    def zerar(self):
+        self.contadores.clear()
+        self.picos.clear()
+        self.tempos.clear()
+
+    def como_dict(self):
+        return {
+            'contadores': dict(self.contadores),
+            'picos': dict(self.picos),
+            'tempos': dict(self.tempos),
+        }
+
+    def __repr__(self):
+        return f"Estatisticas({self.como_dict()})"
+
+
+class Instrumentacao:
+    def __init__(self, callback=None):
+        self.estatisticas = Estatisticas()
+        self.callback = callback
+
+    def notificar(self, evento, dados):
+        if self.callback is not None:
+            self.callback(evento, dados)
+
+    @contextmanager
+    def fase(self, nome):
+        inicio = time.perf_counter()
+        try:
+            yield
+        finally:
+            segundos = time.perf_counter() - inicio
+            self.estatisticas.registrar_tempo(nome, segundos)
+            self.notificar('fase', {'fase': nome, 'segundos': segundos})
+
+    def contar(self, funcao, contador):
+        estatisticas = self.estatisticas
+
+        def contada(*argumentos):
+            estatisticas.incrementar(contador)
+            return funcao(*argumentos)
+
+        return contada
+
+    def contar_arestas(self, sucessores, contador):
+        estatisticas = self.estatisticas
+
+        def contados(estado):
+            destinos = sucessores(estado)
+            estatisticas.incrementar(contador, len(destinos))
+            return destinos
+
+        return contados
+
+    def registrar_passo(self, simbolo, total_ativos):
+        estatisticas = self.estatisticas
+        if simbolo:
+            estatisticas.incrementar('passos')
+        estatisticas.incrementar('estados_visitados', total_ativos)
+        estatisticas.registrar_pico('estados_ativos', total_ativos)
+        self.notificar('passo', {'simbolo': simbolo, 'estados_ativos': total_ativos})
@@ -4,7 +4,7 @@ import matplotlib.pyplot as plt
 from matplotlib.backends.backend_tkagg import FigureCanvasTkAgg
 
 from afn import Estado
-from conversor import ConversorERparaAFN
+from conversor import compilar, compilar_afn
 from reconhecedor import ReconhecedorAFN
 from visualizador import VisualizadorAFN
 
@@ -32,7 +32,7 @@ class InterfaceAFN:
         frame_er = ttk.LabelFrame(main_frame, text="1. Expressão Regular", padding="10")
         frame_er.grid(row=0, column=0, columnspan=2, sticky=(tk.W, tk.E), pady=5)
 
-        ttk.Label(frame_er, text="Notação: ab (concat), a|b (união), a* (Kleene), (a|b)* (parênteses)").grid(
+        ttk.Label(frame_er, text="Notação: ab (concat), a|b (união), a* (Kleene), a+ a? a{2,5} (repetição), (a|b)* (parênteses), [a-z] e [^abc] (classes)").grid(
             row=0, column=0, columnspan=3, sticky=tk.W, pady=5
         )
 
@@ -102,9 +102,8 @@ class InterfaceAFN:
             return
 
         try:
-            conversor = ConversorERparaAFN(er)
-            self.afn = conversor.converter()
-            self.reconhecedor = ReconhecedorAFN(self.afn)
+            self.afn = compilar_afn(er)
+            self.reconhecedor = ReconhecedorAFN(compilar(er))
 
             self._atualizar_visualizacao_grafica()
 
@@ -115,7 +114,7 @@ class InterfaceAFN:
 
             self.text_resultado.delete(1.0, tk.END)
 
-            messagebox.showinfo("Sucesso", f"AFN-ε gerado com sucesso!\n\nTotal de estados: {len(self.afn.obter_todos_estados())}")
+            messagebox.showinfo("Sucesso", f"AFN-ε gerado com sucesso!\n\nTotal de estados: {self.afn.total_estados()}")
 
         except Exception as e:
             messagebox.showerror("Erro", f"Erro ao converter:\n{str(e)}")
@@ -0,0 +1,146 @@
+import codecs
+import mmap
+from collections import namedtuple
+
+from multipadrao import AFNMultiplo, ReconhecedorMultiplo
+
+
+TAMANHO_BLOCO = 1 << 16
+
+Token = namedtuple('Token', ['tipo', 'lexema', 'inicio', 'fim'])
+
+
+class ErroLexico(ValueError):
+    def __init__(self, posicao):
+        super().__init__(f"Nenhuma regra reconhece a entrada na posição {posicao}")
+        self.posicao = posicao
+
+
+def _blocos_de_texto(fonte, tamanho_bloco):
+    if isinstance(fonte, str):
+        yield fonte
+        return
+
+    decodificador = codecs.getincrementaldecoder('utf-8')()
+    if hasattr(fonte, 'read'):
+        while True:
+            bloco = fonte.read(tamanho_bloco)
+            if not bloco:
+                break
+            yield bloco if isinstance(bloco, str) else decodificador.decode(bloco)
+    else:
+        for inicio in range(0, len(fonte), tamanho_bloco):
+            yield decodificador.decode(fonte[inicio:inicio + tamanho_bloco])
+
+    resto = decodificador.decode(b'', final=True)
+    if resto:
+        yield resto
+
+
+class AnalisadorLexico:
+    def __init__(self, regras, ignorar=(), construcao='thompson'):
+        regras = list(regras)
+        if not regras:
+            raise ValueError("O analisador léxico precisa de ao menos uma regra")
+
+        self.nomes = [nome for nome, _ in regras]
+        self.ignorar = frozenset(ignorar)
+        self.afn = AFNMultiplo.combinar([er for _, er in regras], construcao)
+        self.reconhecedor = ReconhecedorMultiplo(self.afn)
+        self._regras_afd = {}
+        self.reconhecedor.ao_descartar_afd = self._regras_afd.clear
+
+    def _regra(self, estado):
+        padroes = self.reconhecedor.padroes_do_estado(estado)
+        regra = (min(padroes) if padroes else -1, self.reconhecedor.esta_morto(estado))
+        self._regras_afd[estado] = regra
+        return regra
+
+    def tokenizar(self, fonte, tamanho_bloco=TAMANHO_BLOCO):
+        reconhecedor = self.reconhecedor
+        transicao = reconhecedor.transicao
+        regras = self._regras_afd
+        inicial = reconhecedor.estado_inicial()
+        descartes = reconhecedor.descartes_afd
+        blocos = _blocos_de_texto(fonte, tamanho_bloco)
+
+        texto = ''
+        base = 0
+        inicio = 0
+        i = 0
+        atual = inicial
+        fim_aceito = -1
+        regra_aceita = -1
+        estado_aceito = inicial
+        falhas = set()
+        limite_falhas = -1
+        esgotado = False
+
+        while True:
+            if i == len(texto):
+                if not esgotado:
+                    bloco = next(blocos, None)
+                    if bloco is None:
+                        esgotado = True
+                    else:
+                        texto = texto[inicio:] + bloco
+                        base += inicio
+                        i -= inicio
+                        if fim_aceito >= 0:
+                            fim_aceito -= inicio
+                        falhas = {(estado, posicao - inicio) for estado, posicao in falhas if posicao > inicio}
+                        limite_falhas -= inicio
+                        inicio = 0
+                        continue
+                if inicio == len(texto):
+                    return
+                parar = True
+            else:
+                atual = transicao(atual, texto[i])
+                i += 1
+
+                dados = regras.get(atual)
+                if dados is None:
+                    if descartes != reconhecedor.descartes_afd:
+                        descartes = reconhecedor.descartes_afd
+                        falhas.clear()
+                        limite_falhas = -1
+                        estado_aceito = None
+                    dados = self._regra(atual)
+                regra, parar = dados
+                if regra >= 0:
+                    fim_aceito = i
+                    regra_aceita = regra
+                    estado_aceito = atual
+                elif i <= limite_falhas and (atual, i) in falhas:
+                    parar = True
+
+            if parar:
+                if fim_aceito < 0:
+                    raise ErroLexico(base + inicio)
+
+                if i > fim_aceito + 1 and estado_aceito is not None:
+                    estado = estado_aceito
+                    for posicao in range(fim_aceito + 1, i + 1):
+                        estado = transicao(estado, texto[posicao - 1])
+                        dados = regras.get(estado)
+                        if dados is None:
+                            break
+                        if not dados[1]:
+                            falhas.add((estado, posicao))
+                    limite_falhas = max(limite_falhas, i)
+
+                nome = self.nomes[regra_aceita]
+                if nome not in self.ignorar:
+                    yield Token(nome, texto[inicio:fim_aceito], base + inicio, base + fim_aceito)
+
+                inicio = i = fim_aceito
+                atual = inicial
+                fim_aceito = -1
+
+    def tokenizar_arquivo(self, caminho, tamanho_bloco=TAMANHO_BLOCO):
+        with open(caminho, 'rb') as arquivo:
+            if arquivo.seek(0, 2) == 0:
+                return
+            with mmap.mmap(arquivo.fileno(), 0, access=mmap.ACCESS_READ) as mapa:
+                yield from self.tokenizar(mapa, tamanho_bloco)
@@ -1,8 +1,16 @@
+import argparse
+import mmap
+import sys
+import time
+
 from afn import Estado
-from conversor import ConversorERparaAFN
+from conversor import compilar, ErroSintaxeER
 from reconhecedor import ReconhecedorAFN
 
 
+TAMANHO_BLOCO = 1 << 20
+
+
 def main():
     print("="*60)
     print("CONVERSOR DE EXPRESSÃO REGULAR PARA AFN-ε")
@@ -13,7 +21,9 @@ def main():
     print("  • Concatenação: ab (símbolos adjacentes)")
     print("  • União: a|b")
     print("  • Fechamento de Kleene: a*")
+    print("  • Repetição: a+, a?, a{3}, a{2,}, a{2,5}")
     print("  • Parênteses: (a|b)*")
+    print("  • Classes: [a-z0-9], negação [^abc]")
     print("  • Símbolos: letras, dígitos e caracteres especiais")
 
     print("\n" + "-"*60)
@@ -25,10 +35,9 @@ def main():
 
     try:
         print(f"\nConvertendo ER '{expressao}' para AFN-ε...")
-        conversor = ConversorERparaAFN(expressao)
-        afn = conversor.converter()
+        automato = compilar(expressao)
 
-        print(afn.exibir_texto())
+        print(automato.exibir_texto())
 
         print("\n" + "="*60)
         print("RECONHECIMENTO DE CADEIAS")
@@ -36,7 +45,7 @@ def main():
         print("Digite as cadeias para testar (uma por linha)")
         print("Digite 'fim' para encerrar\n")
 
-        reconhecedor = ReconhecedorAFN(afn)
+        reconhecedor = ReconhecedorAFN(automato)
 
         while True:
             cadeia = input("Cadeia: ").strip()
@@ -61,5 +70,95 @@ def main():
         traceback.print_exc()
 
 
+def _linhas(mapa):
+    inicio = 0
+    numero = 1
+    tamanho = len(mapa)
+
+    while inicio < tamanho:
+        fim = mapa.find(b'\n', inicio)
+        if fim == -1:
+            fim = tamanho
+        linha = mapa[inicio:fim]
+        if linha.endswith(b'\r'):
+            linha = linha[:-1]
+        yield numero, linha
+        numero += 1
+        inicio = fim + 1
+
+
+def _varrer_linhas(reconhecedor, mapa, caminho, contar):
+    total = 0
+    for numero, linha in _linhas(mapa):
+        if reconhecedor.aceita(linha.decode('utf-8', 'replace')):
+            total += 1
+            if not contar:
+                print(f"{caminho}:{numero}")
+    if contar:
+        print(f"{caminho}: {total} linha(s) aceita(s)")
+
+
+def _varrer_buffer(reconhecedor, mapa, caminho):
+    incremental = reconhecedor.incremental()
+    for inicio in range(0, len(mapa), TAMANHO_BLOCO):
+        if not incremental.alimentar(mapa[inicio:inicio + TAMANHO_BLOCO]):
+            break
+    resultado = "ACEITA" if incremental.finalizar() else "REJEITADA"
+    print(f"{caminho}: {resultado}")
+
+
+def _varrer_arquivo(reconhecedor, caminho, opcoes):
+    with open(caminho, 'rb') as arquivo:
+        if arquivo.seek(0, 2) == 0:
+            mapa = b''
+        else:
+            mapa = mmap.mmap(arquivo.fileno(), 0, access=mmap.ACCESS_READ)
+
+        try:
+            if opcoes.buffer:
+                _varrer_buffer(reconhecedor, mapa, caminho)
+            else:
+                _varrer_linhas(reconhecedor, mapa, caminho, opcoes.contar)
+            return len(mapa)
+        finally:
+            if isinstance(mapa, mmap.mmap):
+                mapa.close()
+
+
+def varrer(argumentos):
+    parser = argparse.ArgumentParser(prog="main_terminal.py scan", description="Varre arquivos com uma expressão regular")
+    parser.add_argument("expressao", help="expressão regular")
+    parser.add_argument("arquivos", nargs="+", help="arquivos a varrer")
+    parser.add_argument("--contar", action="store_true", help="exibe apenas a contagem de linhas aceitas")
+    parser.add_argument("--buffer", action="store_true", help="reconhece o arquivo inteiro como uma única cadeia")
+    opcoes = parser.parse_args(argumentos)
+
+    try:
+        reconhecedor = ReconhecedorAFN(compilar(opcoes.expressao), modo='afd_preguicoso', rastreamento='desligado')
+    except ErroSintaxeER as erro:
+        print(f"Erro: {erro}", file=sys.stderr)
+        return 2
+
+    total_bytes = 0
+    codigo = 0
+    inicio = time.perf_counter()
+
+    for caminho in opcoes.arquivos:
+        try:
+            total_bytes += _varrer_arquivo(reconhecedor, caminho, opcoes)
+        except OSError as erro:
+            print(f"Erro: {caminho}: {erro.strerror}", file=sys.stderr)
+            codigo = 2
+        except UnicodeDecodeError as erro:
+            print(f"Erro: {caminho}: UTF-8 inválido ({erro.reason})", file=sys.stderr)
+            codigo = 2
+
+    duracao = max(time.perf_counter() - inicio, 1e-9)
+    print(f"{total_bytes} bytes em {duracao:.3f}s ({total_bytes / duracao / 1e6:.2f} MB/s)", file=sys.stderr)
+    return codigo
+
+
 if __name__ == "__main__":
+    if len(sys.argv) > 1 and sys.argv[1] == "scan":
+        sys.exit(varrer(sys.argv[2:]))
     main()
\ No newline at end of file
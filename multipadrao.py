@@ -0,0 +1,68 @@
+from afn import AFN, FabricaEstados
+from conversor import CONSTRUCOES
+from reconhecedor import ReconhecedorAFN, LIMITE_ESTADOS_AFD
+
+
+class AFNMultiplo(AFN):
+    def __init__(self, estado_inicial, padroes, expressoes):
+        super().__init__(estado_inicial)
+        self.padroes = padroes
+        self.expressoes = list(expressoes)
+
+    @classmethod
+    def combinar(cls, expressoes, construcao='thompson'):
+        fabrica = FabricaEstados()
+        inicial = fabrica.novo()
+        padroes = {}
+
+        for indice, er in enumerate(expressoes):
+            afn = CONSTRUCOES[construcao](er).converter(fabrica)
+            inicial.adicionar_transicao('ε', afn.estado_inicial)
+
+            if afn.estado_final is not None:
+                finais = [afn.estado_final]
+            else:
+                finais = [estado for estado in afn.obter_todos_estados() if estado.eh_final]
+            for estado in finais:
+                padroes.setdefault(estado.id, set()).add(indice)
+
+        return cls(inicial, {id: frozenset(indices) for id, indices in padroes.items()}, expressoes)
+
+    def padroes_do_estado(self, estado):
+        return self.padroes.get(estado.id, frozenset())
+
+    def exibir_texto(self):
+        resultado = [super().exibir_texto(), "Padrões por estado final:"]
+        for id, indices in sorted(self.padroes.items()):
+            resultado.append(f"  q{id}: {', '.join(str(i) for i in sorted(indices))}")
+        return "\n".join(resultado)
+
+
+class ReconhecedorMultiplo(ReconhecedorAFN):
+    def __init__(self, afn, rastreamento='desligado', instrumentacao=None, limite_estados_afd=LIMITE_ESTADOS_AFD):
+        super().__init__(
+            afn, modo='afd_preguicoso', rastreamento=rastreamento, instrumentacao=instrumentacao,
+            limite_estados_afd=limite_estados_afd
+        )
+        self.expressoes = afn.expressoes
+        self._padroes_estado = [
+            afn.padroes.get(self.compacto.ids[i], frozenset()) for i in range(self.compacto.total_estados())
+        ]
+        self._padroes_afd = {}
+
+    def _descartar_afd(self):
+        self._padroes_afd.clear()
+        super()._descartar_afd()
+
+    def padroes_do_estado(self, estado):
+        padroes = self._padroes_afd.get(estado)
+        if padroes is None:
+            padroes = frozenset().union(*(self._padroes_estado[e] for e in self.estados_ativos(estado)))
+            self._padroes_afd[estado] = padroes
+        return padroes
+
+    def padroes(self, cadeia):
+        return self.padroes_do_estado(self.avancar(self.estado_inicial(), cadeia))
+
+    def expressoes_aceitas(self, cadeia):
+        return [self.expressoes[i] for i in sorted(self.padroes(cadeia))]
@@ -1,58 +1,604 @@
+import codecs
+import os
+import sys
+import time
+from array import array
+from collections import deque, namedtuple
+from contextlib import nullcontext
+from itertools import islice
+from multiprocessing import Pool
+
+from alfabeto import TAMANHO_TABELA
+from compacto import AFNCompacto
+from fechos import calcular_fechos_epsilon
+
+
+TAMANHO_BLOCO_CLASSES = 1 << 16
+LIMITE_ESTADOS_AFD = 10000
+
+Ocorrencia = namedtuple('Ocorrencia', ['inicio', 'fim', 'trecho'])
+
+
 class ReconhecedorAFN:
-    def __init__(self, afn):
+    MODOS = ('conjuntos', 'afd_preguicoso', 'bits')
+    NIVEIS_RASTREAMENTO = ('desligado', 'resumo', 'completo')
+
+    def __init__(self, afn, modo='conjuntos', rastreamento='completo', instrumentacao=None,
+                 limite_estados_afd=LIMITE_ESTADOS_AFD):
+        if modo not in self.MODOS:
+            raise ValueError(f"Modo de reconhecimento inválido: {modo}")
+        if rastreamento not in self.NIVEIS_RASTREAMENTO:
+            raise ValueError(f"Nível de rastreamento inválido: {rastreamento}")
+        if limite_estados_afd is not None and limite_estados_afd < 2:
+            raise ValueError(f"Limite de estados do AFD inválido: {limite_estados_afd}")
+
         self.afn = afn
+        self.modo = modo
+        self.rastreamento = rastreamento
         self.historico = []
+        self.resumo = None
+        self.instrumentacao = instrumentacao
+        self._rastrear = False
 
-    def _epsilon_fecho(self, estados):
-        fecho = set(estados)
-        pilha = list(estados)
+        if isinstance(afn, AFNCompacto):
+            self.compacto = afn
+            self._estados = [afn.rotulo(i) for i in range(afn.total_estados())]
+        else:
+            with self._fase('compactacao'):
+                self.compacto = afn.compactar()
+            self._estados = afn.obter_todos_estados()
 
-        while pilha:
-            estado = pilha.pop()
+        sucessores_epsilon = self.compacto.sucessores_epsilon
+        if instrumentacao is not None:
+            sucessores_epsilon = instrumentacao.contar_arestas(sucessores_epsilon, 'arestas_epsilon_percorridas')
+            self._epsilon_fecho = instrumentacao.contar(self._epsilon_fecho, 'fechos_calculados')
+            self._transicao_afd = instrumentacao.contar(self._transicao_afd, 'transicoes_afd_calculadas')
 
-            if 'ε' in estado.transicoes:
-                for destino in estado.transicoes['ε']:
-                    if destino not in fecho:
-                        fecho.add(destino)
-                        pilha.append(destino)
+        inicio = time.perf_counter()
+        with self._fase('fechos_epsilon'):
+            self.fechos = calcular_fechos_epsilon(range(self.compacto.total_estados()), sucessores_epsilon)
+        self.tempo_precomputacao = time.perf_counter() - inicio
+        fechos_distintos = {id(fecho): fecho for fecho in self.fechos.values()}
+        self.memoria_fechos = sys.getsizeof(self.fechos) + sum(
+            sys.getsizeof(fecho) for fecho in fechos_distintos.values()
+        )
+
+        self.classes = None
+        self._mapa_classes = None
+        self._indices_afd = {}
+        self._conjuntos_afd = []
+        self._transicoes_afd = []
+        self._finais_afd = []
+        self._ordenados_afd = {}
+        self._morto_afd = None
+        self.limite_estados_afd = limite_estados_afd
+        self.descartes_afd = 0
+        self.ao_descartar_afd = None
+
+        if modo == 'bits':
+            with self._fase('preparacao_bits'):
+                self._preparar_bits()
+        elif modo == 'conjuntos':
+            self._preparar_conjuntos()
+
+    def _fase(self, nome):
+        if self.instrumentacao is None:
+            return nullcontext()
+        return self.instrumentacao.fase(nome)
+
+    def _epsilon_fecho(self, estados):
+        fecho = set()
+        fechos = self.fechos
+
+        for estado in estados:
+            fecho |= fechos[estado]
 
         return fecho
 
-    def reconhecer(self, cadeia):
-        self.historico = []
+    def _mover(self, estados, simbolo):
+        novos_estados = set()
+        indices = self.compacto.indices_do_simbolo(simbolo)
 
-        estados_atuais = self._epsilon_fecho([self.afn.estado_inicial])
+        if not indices:
+            return novos_estados
 
-        self.historico.append({
-            'passo': 'Inicial',
-            'simbolo': '',
-            'estados': sorted(estados_atuais, key=lambda x: x.id)
-        })
+        deslocamentos = self.compacto.deslocamentos
+        rotulos = self.compacto.rotulos
+        destinos = self.compacto.destinos
 
-        for i, simbolo in enumerate(cadeia):
-            novos_estados = set()
+        for estado in estados:
+            for k in range(deslocamentos[estado], deslocamentos[estado + 1]):
+                if rotulos[k] in indices:
+                    novos_estados.add(destinos[k])
 
-            for estado in estados_atuais:
-                if simbolo in estado.transicoes:
-                    novos_estados.update(estado.transicoes[simbolo])
+        return novos_estados
 
-            estados_atuais = self._epsilon_fecho(novos_estados)
+    def _preparar_conjuntos(self):
+        total = self.compacto.total_estados()
+        self._marcas_conjuntos = array('q', [-1]) * total
+        self._ativos_conjuntos = array('l', [0]) * total
+        self._proximos_conjuntos = array('l', [0]) * total
+        self._geracao_conjuntos = 0
+
+    def _ordenar(self, estados):
+        return [self._estados[i] for i in sorted(estados)]
+
+    def _final(self, estados):
+        finais = self.compacto.finais
+        for estado in estados:
+            if finais[estado]:
+                return self._estados[estado]
+        return None
+
+    def _estado_afd(self, conjunto):
+        conjunto = frozenset(conjunto)
+        indice = self._indices_afd.get(conjunto)
+        limite = self.limite_estados_afd
+
+        if indice is None and limite is not None and len(self._conjuntos_afd) >= limite:
+            self._descartar_afd()
+            indice = self._indices_afd.get(conjunto)
+
+        if indice is None:
+            indice = len(self._conjuntos_afd)
+            self._indices_afd[conjunto] = indice
+            self._conjuntos_afd.append(conjunto)
+            self._transicoes_afd.append([None] * self.classes.total_classes())
+            self._finais_afd.append(self._final(conjunto))
+
+        return indice
+
+    def _descartar_afd(self):
+        self._indices_afd.clear()
+        self._conjuntos_afd.clear()
+        self._transicoes_afd.clear()
+        self._finais_afd.clear()
+        self._ordenados_afd.clear()
+        self._morto_afd = None
+        self.descartes_afd += 1
+        if self.ao_descartar_afd is not None:
+            self.ao_descartar_afd()
+        self._estado_afd(self.fechos[self.compacto.inicial])
+
+    def _listar_afd(self, indice):
+        ordenados = self._ordenados_afd.get(indice)
+        if ordenados is None:
+            ordenados = self._ordenar(self._conjuntos_afd[indice])
+            self._ordenados_afd[indice] = ordenados
+        return ordenados
+
+    def _preparar_classes(self):
+        if self.classes is None:
+            classes = self.compacto.classes_alfabeto()
+            if classes.total_classes() <= 256:
+                self._mapa_classes = bytes(classes.tabela.tolist())
+            self.classes = classes
+        return self.classes
+
+    def _blocos_de_classes(self, cadeia):
+        classe = self.classes.classe
+        if not isinstance(cadeia, str):
+            yield map(classe, cadeia)
+            return
+
+        mapa = self._mapa_classes
+        for inicio in range(0, len(cadeia), TAMANHO_BLOCO_CLASSES):
+            bloco = cadeia[inicio:inicio + TAMANHO_BLOCO_CLASSES]
+            if mapa is not None:
+                try:
+                    yield bloco.encode('latin-1').translate(mapa)
+                    continue
+                except UnicodeEncodeError:
+                    pass
+            yield map(classe, bloco)
+
+    def _classe(self, simbolo):
+        codigo = ord(simbolo)
+        if codigo < TAMANHO_TABELA:
+            return self.classes.tabela[codigo]
+        return self.classes.classe(simbolo)
+
+    def _transicao_afd(self, indice, classe):
+        destino = self._transicoes_afd[indice][classe]
+
+        if destino is None:
+            representante = self.classes.representante(classe)
+            novos_estados = self._mover(self._conjuntos_afd[indice], representante) if representante else ()
+            descartes = self.descartes_afd
+            destino = self._estado_afd(self._epsilon_fecho(novos_estados))
+            if descartes == self.descartes_afd:
+                self._transicoes_afd[indice][classe] = destino
+            if not self._conjuntos_afd[destino]:
+                self._morto_afd = destino
+
+        return destino
+
+    def _mascara(self, estados):
+        mascara = 0
+        for estado in estados:
+            mascara |= 1 << estado
+        return mascara
+
+    def _preparar_bits(self):
+        compacto = self.compacto
+        fechos = [self._mascara(self.fechos[i]) for i in range(compacto.total_estados())]
 
+        self._fecho_inicial_bits = fechos[compacto.inicial]
+        self._finais_bits = self._mascara(i for i, final in enumerate(compacto.finais) if final)
+        passos_rotulos = [[] for _ in compacto.simbolos]
+
+        for estado in range(compacto.total_estados()):
+            alvos = {}
+            for k in range(compacto.deslocamentos[estado], compacto.deslocamentos[estado + 1]):
+                rotulo = compacto.rotulos[k]
+                alvos[rotulo] = alvos.get(rotulo, 0) | fechos[compacto.destinos[k]]
+            for rotulo, alvo in alvos.items():
+                passos_rotulos[rotulo].append((1 << estado, alvo))
+
+        classes = self._preparar_classes()
+        self._passos_bits = [[]]
+        for classe in range(1, classes.total_classes()):
+            indices = compacto.indices_do_simbolo(classes.representante(classe))
+            self._passos_bits.append([par for indice in indices for par in passos_rotulos[indice]])
+
+    def _estados_da_mascara(self, mascara):
+        estados = []
+        while mascara:
+            menor = mascara & -mascara
+            estados.append(self._estados[menor.bit_length() - 1])
+            mascara ^= menor
+        return estados
+
+    def total_estados_afd(self):
+        return len(self._conjuntos_afd)
+
+    def _iniciar_rastreamento(self):
+        self.historico = []
+        self.resumo = None
+        if self.rastreamento != 'desligado':
+            self.resumo = {'simbolos_lidos': 0, 'max_estados_ativos': 0, 'total_estados_ativos': 0}
+        self._rastrear = self.resumo is not None or self.instrumentacao is not None
+
+    def _registrar(self, passo, simbolo, estados, listar, total_ativos):
+        resumo = self.resumo
+        if resumo is not None:
+            if simbolo:
+                resumo['simbolos_lidos'] += 1
+            resumo['total_estados_ativos'] += total_ativos
+            if total_ativos > resumo['max_estados_ativos']:
+                resumo['max_estados_ativos'] = total_ativos
+
+        if self.instrumentacao is not None:
+            self.instrumentacao.registrar_passo(simbolo, total_ativos)
+
+        if self.rastreamento == 'completo':
             self.historico.append({
-                'passo': f'Após ler {i+1}',
+                'passo': passo,
                 'simbolo': simbolo,
-                'estados': sorted(estados_atuais, key=lambda x: x.id)
+                'estados': listar(estados)
             })
 
+    def reconhecer(self, cadeia):
+        if self.instrumentacao is None:
+            return self._reconhecer(cadeia)
+
+        with self.instrumentacao.fase('reconhecimento'):
+            aceita, mensagem = self._reconhecer(cadeia)
+        self.instrumentacao.notificar('reconhecimento', {'modo': self.modo, 'tamanho': len(cadeia), 'aceita': aceita})
+        return aceita, mensagem
+
+    def _reconhecer(self, cadeia):
+        self._iniciar_rastreamento()
+
+        if self.modo == 'afd_preguicoso':
+            return self._reconhecer_afd_preguicoso(cadeia)
+        if self.modo == 'bits':
+            return self._reconhecer_bits(cadeia)
+
+        if not self._rastrear:
+            return self._reconhecer_conjuntos_sem_rastreamento(cadeia)
+
+        estados_atuais = self._epsilon_fecho([self.compacto.inicial])
+        self._registrar('Inicial', '', estados_atuais, self._ordenar, len(estados_atuais))
+
+        for i, simbolo in enumerate(cadeia):
+            novos_estados = self._mover(estados_atuais, simbolo)
+
+            estados_atuais = self._epsilon_fecho(novos_estados)
+            self._registrar(f'Após ler {i+1}', simbolo, estados_atuais, self._ordenar, len(estados_atuais))
+
             if not estados_atuais:
                 return False, "Nenhum estado alcançável"
 
-        for estado in estados_atuais:
-            if estado.eh_final:
-                return True, f"Estado final {estado} alcançado"
+        final = self._final(estados_atuais)
+        if final is not None:
+            return True, f"Estado final {final} alcançado"
+
+        return False, "Nenhum estado final alcançado"
+
+    def _reconhecer_conjuntos_sem_rastreamento(self, cadeia):
+        compacto = self.compacto
+        fechos = self.fechos
+        deslocamentos = compacto.deslocamentos
+        rotulos = compacto.rotulos
+        destinos = compacto.destinos
+        marcas = self._marcas_conjuntos
+        ativos = self._ativos_conjuntos
+        proximos = self._proximos_conjuntos
+        geracao = self._geracao_conjuntos
+
+        total = 0
+        for estado in fechos[compacto.inicial]:
+            ativos[total] = estado
+            total += 1
+
+        for simbolo in cadeia:
+            indices = compacto.indices_do_simbolo(simbolo)
+            geracao += 1
+            quantidade = 0
+
+            if indices:
+                for j in range(total):
+                    estado = ativos[j]
+                    for k in range(deslocamentos[estado], deslocamentos[estado + 1]):
+                        if rotulos[k] in indices:
+                            for alvo in fechos[destinos[k]]:
+                                if marcas[alvo] != geracao:
+                                    marcas[alvo] = geracao
+                                    proximos[quantidade] = alvo
+                                    quantidade += 1
+
+            ativos, proximos = proximos, ativos
+            total = quantidade
+            if not total:
+                self._geracao_conjuntos = geracao
+                return False, "Nenhum estado alcançável"
+
+        self._geracao_conjuntos = geracao
+        final = self._final(sorted(ativos[:total]))
+        if final is not None:
+            return True, f"Estado final {final} alcançado"
+
+        return False, "Nenhum estado final alcançado"
+
+    def _reconhecer_afd_preguicoso(self, cadeia):
+        rastrear = self._rastrear
+        atual = self._estado_inicial_afd()
+
+        if not rastrear:
+            atual = self._avancar_afd(atual, cadeia)
+            if atual == self._morto_afd:
+                return False, "Nenhum estado alcançável"
+        else:
+            transicoes = self._transicoes_afd
+            conjuntos = self._conjuntos_afd
+            listar = self._listar_afd
+
+            self._registrar('Inicial', '', atual, listar, len(conjuntos[atual]))
+
+            for i, simbolo in enumerate(cadeia):
+                classe = self._classe(simbolo)
+                proximo = transicoes[atual][classe]
+                if proximo is None:
+                    proximo = self._transicao_afd(atual, classe)
+                atual = proximo
+
+                self._registrar(f'Após ler {i+1}', simbolo, atual, listar, len(conjuntos[atual]))
+
+                if not conjuntos[atual]:
+                    return False, "Nenhum estado alcançável"
+
+        final = self._finais_afd[atual]
+        if final is not None:
+            return True, f"Estado final {final} alcançado"
+
+        return False, "Nenhum estado final alcançado"
+
+    def _reconhecer_bits(self, cadeia):
+        rastrear = self._rastrear
+        atual = self._fecho_inicial_bits
+        passos = self._passos_bits
+        tabela = self.classes.tabela
+        classe_de = self.classes.classe
+
+        if rastrear:
+            self._registrar('Inicial', '', atual, self._estados_da_mascara, atual.bit_count())
+
+        for i, simbolo in enumerate(cadeia):
+            codigo = ord(simbolo)
+            passo = passos[tabela[codigo] if codigo < TAMANHO_TABELA else classe_de(simbolo)]
+            proximo = 0
+            for bit, alvo in passo:
+                if atual & bit:
+                    proximo |= alvo
+            atual = proximo
+
+            if rastrear:
+                self._registrar(f'Após ler {i+1}', simbolo, atual, self._estados_da_mascara, atual.bit_count())
+
+            if not atual:
+                return False, "Nenhum estado alcançável"
+
+        finais = atual & self._finais_bits
+        if finais:
+            final = self._estados[(finais & -finais).bit_length() - 1]
+            return True, f"Estado final {final} alcançado"
 
         return False, "Nenhum estado final alcançado"
 
+    def _estado_inicial_afd(self):
+        self._preparar_classes()
+        return self._estado_afd(self.fechos[self.compacto.inicial])
+
+    def _avancar_afd(self, atual, cadeia):
+        transicoes = self._transicoes_afd
+        morto = self._morto_afd
+
+        if atual == morto:
+            return atual
+
+        for bloco in self._blocos_de_classes(cadeia):
+            for classe in bloco:
+                proximo = transicoes[atual][classe]
+                if proximo is None:
+                    proximo = self._transicao_afd(atual, classe)
+                    morto = self._morto_afd
+                atual = proximo
+                if atual == morto:
+                    return atual
+
+        return atual
+
+    def aceita(self, cadeia):
+        atual = self._avancar_afd(self._estado_inicial_afd(), cadeia)
+        return self._finais_afd[atual] is not None
+
+    def estado_inicial(self):
+        return self._estado_inicial_afd()
+
+    def transicao(self, estado, simbolo):
+        codigo = ord(simbolo)
+        classe = self.classes.tabela[codigo] if codigo < TAMANHO_TABELA else self.classes.classe(simbolo)
+        destino = self._transicoes_afd[estado][classe]
+        if destino is None:
+            destino = self._transicao_afd(estado, classe)
+        return destino
+
+    def avancar(self, estado, cadeia):
+        return self._avancar_afd(estado, cadeia)
+
+    def esta_morto(self, estado):
+        return not self._conjuntos_afd[estado]
+
+    def eh_final(self, estado):
+        return self._finais_afd[estado] is not None
+
+    def estados_ativos(self, estado):
+        return self._conjuntos_afd[estado]
+
+    def buscar(self, texto):
+        return next(self.buscar_todos(texto), None)
+
+    def buscar_todos(self, texto):
+        finais = self.compacto.finais
+        fecho_inicial = self.fechos[self.compacto.inicial]
+        n = len(texto)
+
+        camadas = deque()
+        vivas = []
+        ocupados = set()
+        i = 0
+
+        while True:
+            alterada = True
+            while alterada:
+                alterada = False
+
+                ultima = camadas[-1] if camadas else None
+                if ultima is None or (ultima.melhor is not None and i >= _seguinte(ultima.melhor)):
+                    ultima = _Camada()
+                    camadas.append(ultima)
+                if ultima.melhor is None:
+                    if not vivas or vivas[-1] is not ultima:
+                        vivas.append(ultima)
+                    for estado in fecho_inicial:
+                        if estado not in ocupados:
+                            ultima.fios[estado] = i
+                            ocupados.add(estado)
+                        elif finais[estado] and estado not in ultima.fios:
+                            ultima.melhor = (i, i)
+
+                for posicao, camada in enumerate(vivas):
+                    melhor = camada.melhor
+                    for estado, origem in camada.fios.items():
+                        if finais[estado] and (melhor is None or origem < melhor[0] or (origem == melhor[0] and i > melhor[1])):
+                            melhor = (origem, i)
+
+                    if melhor is not camada.melhor:
+                        camada.melhor = melhor
+                        camada.fios = {estado: origem for estado, origem in camada.fios.items() if origem <= melhor[0]}
+                        while camadas[-1] is not camada:
+                            camadas.pop()
+                        del vivas[posicao + 1:]
+                        ocupados = set().union(*(c.fios for c in vivas))
+                        alterada = True
+                        break
+
+            if i == n:
+                for camada in camadas:
+                    if camada.melhor is not None:
+                        yield _ocorrencia(texto, camada.melhor)
+                return
+
+            simbolo = texto[i]
+            ocupados = set()
+            sobreviventes = []
+            for camada in vivas:
+                camada.fios = self._avancar_fios(camada.fios, simbolo, ocupados)
+                if camada.fios:
+                    ocupados.update(camada.fios)
+                    sobreviventes.append(camada)
+            vivas = sobreviventes
+            i += 1
+
+            while camadas and camadas[0].melhor is not None and not camadas[0].fios:
+                yield _ocorrencia(texto, camadas.popleft().melhor)
+
+    def _avancar_fios(self, fios, simbolo, ocupados):
+        novos = {}
+        if not fios:
+            return novos
+
+        compacto = self.compacto
+        indices = compacto.indices_do_simbolo(simbolo)
+        if not indices:
+            return novos
+
+        fechos = self.fechos
+        deslocamentos = compacto.deslocamentos
+        rotulos = compacto.rotulos
+        destinos = compacto.destinos
+
+        for estado, origem in fios.items():
+            for k in range(deslocamentos[estado], deslocamentos[estado + 1]):
+                if rotulos[k] not in indices:
+                    continue
+                for alvo in fechos[destinos[k]]:
+                    if alvo in ocupados:
+                        continue
+                    anterior = novos.get(alvo)
+                    if anterior is None or origem < anterior:
+                        novos[alvo] = origem
+
+        return novos
+
+    def incremental(self):
+        return ReconhecedorIncremental(self)
+
+    def reconhecer_lote(self, cadeias, workers=None, chunksize=1000):
+        resultados = []
+        for _, aceitas in self._executar_lote(cadeias, workers, chunksize, ordenado=True):
+            resultados.extend(aceitas)
+        return resultados
+
+    def reconhecer_lote_fluxo(self, cadeias, workers=None, chunksize=1000):
+        for inicio, aceitas in self._executar_lote(cadeias, workers, chunksize, ordenado=False):
+            for deslocamento, aceita in enumerate(aceitas):
+                yield inicio + deslocamento, aceita
+
+    def _executar_lote(self, cadeias, workers, chunksize, ordenado):
+        workers = workers or os.cpu_count() or 1
+        blocos = _dividir_em_blocos(cadeias, chunksize)
+
+        if workers == 1:
+            for inicio, bloco in blocos:
+                yield inicio, [self.aceita(cadeia) for cadeia in bloco]
+            return
+
+        with Pool(workers, initializer=_iniciar_trabalhador, initargs=(self.compacto,)) as pool:
+            mapear = pool.imap if ordenado else pool.imap_unordered
+            yield from mapear(_avaliar_bloco, blocos)
+
     def obter_historico_texto(self):
         resultado = []
         for item in self.historico:
@@ -61,4 +607,84 @@ class ReconhecedorAFN:
                 resultado.append(f"{item['passo']}: {{{estados_str}}}")
             else:
                 resultado.append(f"{item['passo']} '{item['simbolo']}': {{{estados_str}}}")
-        return '\n'.join(resultado)
\ No newline at end of file
+        return '\n'.join(resultado)
+
+
+class ReconhecedorIncremental:
+    def __init__(self, reconhecedor):
+        self.reconhecedor = reconhecedor
+        self.reiniciar()
+
+    def reiniciar(self):
+        self._atual = self.reconhecedor.estado_inicial()
+        self._decodificador = codecs.getincrementaldecoder('utf-8')()
+        self.consumidos = 0
+
+    def alimentar(self, bloco):
+        if isinstance(bloco, (bytes, bytearray, memoryview)):
+            bloco = self._decodificador.decode(bloco)
+
+        self.consumidos += len(bloco)
+        self._atual = self.reconhecedor.avancar(self._atual, bloco)
+        return not self.esta_morto()
+
+    def alimentar_fluxo(self, fluxo, tamanho_bloco=65536):
+        while not self.esta_morto():
+            bloco = fluxo.read(tamanho_bloco)
+            if not bloco:
+                break
+            self.alimentar(bloco)
+        return self.finalizar()
+
+    def finalizar(self):
+        if not self.esta_morto():
+            self.alimentar(self._decodificador.decode(b'', final=True))
+        return self.esta_aceitando()
+
+    def esta_aceitando(self):
+        return not self._decodificador.getstate()[0] and self.reconhecedor.eh_final(self._atual)
+
+    def esta_morto(self):
+        return self.reconhecedor.esta_morto(self._atual)
+
+
+class _Camada:
+    __slots__ = ('fios', 'melhor')
+
+    def __init__(self):
+        self.fios = {}
+        self.melhor = None
+
+
+def _ocorrencia(texto, melhor):
+    inicio, fim = melhor
+    return Ocorrencia(inicio, fim, texto[inicio:fim])
+
+
+def _seguinte(ocorrencia):
+    inicio, fim = ocorrencia
+    return fim if fim > inicio else fim + 1
+
+
+_reconhecedor_trabalhador = None
+
+
+def _iniciar_trabalhador(compacto):
+    global _reconhecedor_trabalhador
+    _reconhecedor_trabalhador = ReconhecedorAFN(compacto, modo='afd_preguicoso', rastreamento='desligado')
+
+
+def _avaliar_bloco(bloco_indexado):
+    inicio, bloco = bloco_indexado
+    return inicio, [_reconhecedor_trabalhador.aceita(cadeia) for cadeia in bloco]
+
+
+def _dividir_em_blocos(cadeias, tamanho):
+    iterador = iter(cadeias)
+    inicio = 0
+    while True:
+        bloco = list(islice(iterador, tamanho))
+        if not bloco:
+            return
+        yield inicio, bloco
+        inicio += len(bloco)
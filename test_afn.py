@@ -1,7 +1,31 @@
+import contextlib
+import gc
+import io
+import os
+import tempfile
+import tracemalloc
 import unittest
+from concurrent.futures import ThreadPoolExecutor
 from afn import Estado, AFN
-from conversor import ConversorERparaAFN
-from reconhecedor import ReconhecedorAFN
+from alfabeto import ClasseCaracteres
+from compacto import AFNCompacto, ErroFormatoAutomato, memoria_grafo_objetos
+from conversor import ConversorERparaAFN, ConversorGlushkov, ErroSintaxeER, CacheCompilacao, compilar, compilar_afn, LIMITE_REPETICAO
+from fechos import calcular_fechos_epsilon
+from reconhecedor import ReconhecedorAFN, Ocorrencia
+from afd import AFD, ReconhecedorAFD, LimiteEstadosExcedido, criar_reconhecedor_deterministico
+from main_terminal import varrer
+from benchmarks.suite import comparar
+from instrumentacao import Instrumentacao
+from multipadrao import AFNMultiplo, ReconhecedorMultiplo
+from lexer import AnalisadorLexico, ErroLexico, Token
+
+try:
+    import matplotlib
+    matplotlib.use('Agg')
+    import matplotlib.pyplot as plt
+    from visualizador import VisualizadorAFN
+except ImportError:
+    VisualizadorAFN = None
 
 
 class TestEstado(unittest.TestCase):
@@ -801,5 +825,1234 @@ class TestReconhecimentoPadrao(unittest.TestCase):
         self.assertFalse(aceita)
 
 
+class TestReconhecimentoAFDPreguicoso(unittest.TestCase):
+    def setUp(self):
+        Estado.contador = 0
+    
+    def test_modo_invalido(self):
+        afn = ConversorERparaAFN('a').converter()
+        with self.assertRaises(ValueError):
+            ReconhecedorAFN(afn, modo='inexistente')
+    
+    def test_mesmo_resultado_que_conjuntos(self):
+        afn = ConversorERparaAFN('(a|b)*abb').converter()
+        conjuntos = ReconhecedorAFN(afn)
+        preguicoso = ReconhecedorAFN(afn, modo='afd_preguicoso')
+        for cadeia in ['', 'abb', 'aabb', 'babb', 'ab', 'abc', 'abbabb']:
+            self.assertEqual(conjuntos.reconhecer(cadeia)[0], preguicoso.reconhecer(cadeia)[0])
+            self.assertEqual(conjuntos.obter_historico_texto(), preguicoso.obter_historico_texto())
+    
+    def test_estados_afd_reaproveitados(self):
+        afn = ConversorERparaAFN('(a|b)*').converter()
+        reconhecedor = ReconhecedorAFN(afn, modo='afd_preguicoso')
+        reconhecedor.reconhecer('ab' * 50)
+        total = reconhecedor.total_estados_afd()
+        reconhecedor.reconhecer('ba' * 100)
+        self.assertEqual(reconhecedor.total_estados_afd(), total)
+        self.assertLessEqual(total, 3)
+    
+    def test_rejeita_sem_estado_alcancavel(self):
+        afn = ConversorERparaAFN('ab').converter()
+        reconhecedor = ReconhecedorAFN(afn, modo='afd_preguicoso')
+        aceita, motivo = reconhecedor.reconhecer('ba')
+        self.assertFalse(aceita)
+        self.assertEqual(motivo, "Nenhum estado alcançável")
+    
+    def test_passos_publicos(self):
+        afn = ConversorERparaAFN('ab*').converter()
+        reconhecedor = ReconhecedorAFN(afn, modo='afd_preguicoso')
+        inicial = reconhecedor.estado_inicial()
+        self.assertFalse(reconhecedor.eh_final(inicial))
+        estado = reconhecedor.transicao(inicial, 'a')
+        self.assertTrue(reconhecedor.eh_final(estado))
+        self.assertEqual(reconhecedor.avancar(inicial, 'abbb'), reconhecedor.transicao(estado, 'b'))
+        self.assertTrue(reconhecedor.estados_ativos(estado))
+        morto = reconhecedor.transicao(estado, 'a')
+        self.assertTrue(reconhecedor.esta_morto(morto))
+        self.assertFalse(reconhecedor.esta_morto(estado))
+        self.assertEqual(reconhecedor.transicao(morto, 'b'), morto)
+    
+    def test_limite_estados_descarta_cache(self):
+        afn = ConversorERparaAFN('(a|b)*a(a|b)(a|b)(a|b)(a|b)').converter()
+        conjuntos = ReconhecedorAFN(afn, rastreamento='desligado')
+        limitado = ReconhecedorAFN(afn, modo='afd_preguicoso', rastreamento='desligado', limite_estados_afd=8)
+        cadeias = ['abbabaabbbaaab' * 3, 'ba' * 20 + 'abbb', 'b' * 30, 'aabab']
+        for cadeia in cadeias:
+            self.assertEqual(limitado.aceita(cadeia), conjuntos.reconhecer(cadeia)[0], cadeia)
+            self.assertEqual(limitado.reconhecer(cadeia), conjuntos.reconhecer(cadeia), cadeia)
+            self.assertLessEqual(limitado.total_estados_afd(), 8)
+        self.assertGreater(limitado.descartes_afd, 0)
+        
+        with self.assertRaises(ValueError):
+            ReconhecedorAFN(afn, modo='afd_preguicoso', limite_estados_afd=1)
+    
+    def test_listas_ordenadas_apenas_no_rastreamento_completo(self):
+        afn = ConversorERparaAFN('(a|b)*abb').converter()
+        desligado = ReconhecedorAFN(afn, modo='afd_preguicoso', rastreamento='desligado')
+        desligado.reconhecer('aabb')
+        self.assertEqual(desligado._ordenados_afd, {})
+        completo = ReconhecedorAFN(afn, modo='afd_preguicoso')
+        completo.reconhecer('aabb')
+        self.assertEqual(len(completo._ordenados_afd), completo.total_estados_afd())
+
+
+class TestFechosEpsilon(unittest.TestCase):
+    def setUp(self):
+        Estado.contador = 0
+    
+    def test_fecho_inclui_o_proprio_estado(self):
+        afn = ConversorERparaAFN('a').converter()
+        fechos = calcular_fechos_epsilon(afn.obter_todos_estados())
+        self.assertEqual(fechos[afn.estado_inicial], frozenset([afn.estado_inicial]))
+    
+    def test_ciclo_epsilon_compartilha_fecho(self):
+        e0 = Estado()
+        e1 = Estado()
+        e2 = Estado()
+        e0.adicionar_transicao('ε', e1)
+        e1.adicionar_transicao('ε', e0)
+        e1.adicionar_transicao('ε', e2)
+        afn = AFN(e0, e2)
+        fechos = calcular_fechos_epsilon(afn.obter_todos_estados())
+        self.assertEqual(fechos[e0], frozenset([e0, e1, e2]))
+        self.assertIs(fechos[e0], fechos[e1])
+        self.assertEqual(fechos[e2], frozenset([e2]))
+    
+    def test_fechamento_aninhado(self):
+        afn = ConversorERparaAFN('((a*)*)*').converter()
+        fechos = calcular_fechos_epsilon(afn.obter_todos_estados())
+        self.assertIn(afn.estado_final, fechos[afn.estado_inicial])
+    
+    def test_reconhecedor_expoe_precomputacao(self):
+        afn = ConversorERparaAFN('(a|b)*c').converter()
+        reconhecedor = ReconhecedorAFN(afn)
+        self.assertEqual(len(reconhecedor.fechos), len(afn.obter_todos_estados()))
+        self.assertGreaterEqual(reconhecedor.tempo_precomputacao, 0)
+        self.assertGreater(reconhecedor.memoria_fechos, 0)
+
+
+class TestAFD(unittest.TestCase):
+    def setUp(self):
+        Estado.contador = 0
+    
+    def _reconhecedores(self, er):
+        afn = ConversorERparaAFN(er).converter()
+        afd = AFD.de_afn(afn)
+        return ReconhecedorAFN(afn), ReconhecedorAFD(afd), ReconhecedorAFD(afd.minimizar())
+    
+    def test_equivalencia_com_afn(self):
+        cadeias = ['', 'a', 'b', 'ab', 'abb', 'aabb', 'babb', 'abab', 'c']
+        for er in ['(a|b)*abb', 'a*b*', 'ab|ba', '(ab)*', '((a*)*)*']:
+            reconhecedor_afn, reconhecedor_afd, reconhecedor_min = self._reconhecedores(er)
+            for cadeia in cadeias:
+                esperado = reconhecedor_afn.reconhecer(cadeia)[0]
+                self.assertEqual(reconhecedor_afd.reconhecer(cadeia)[0], esperado, (er, cadeia))
+                self.assertEqual(reconhecedor_min.reconhecer(cadeia)[0], esperado, (er, cadeia))
+    
+    def test_minimizacao_a_ou_b_estrela_abb(self):
+        afn = ConversorERparaAFN('(a|b)*abb').converter()
+        afd = AFD.de_afn(afn).minimizar()
+        self.assertEqual(afd.total_estados(), 4)
+    
+    def test_minimizacao_uniao_redundante(self):
+        afn = ConversorERparaAFN('(a|b)*|(b|a)*').converter()
+        afd = AFD.de_afn(afn).minimizar()
+        self.assertEqual(afd.total_estados(), 1)
+        self.assertEqual(afd.finais, {0})
+    
+    def test_limite_estados(self):
+        afn = ConversorERparaAFN('(a|b)*a(a|b)(a|b)(a|b)(a|b)').converter()
+        with self.assertRaises(LimiteEstadosExcedido):
+            AFD.de_afn(afn, limite_estados=8)
+    
+    def test_fallback_para_afd_preguicoso(self):
+        afn = ConversorERparaAFN('(a|b)*a(a|b)(a|b)(a|b)(a|b)').converter()
+        reconhecedor = criar_reconhecedor_deterministico(afn, limite_estados=8)
+        self.assertIsInstance(reconhecedor, ReconhecedorAFN)
+        self.assertEqual(reconhecedor.modo, 'afd_preguicoso')
+        self.assertTrue(reconhecedor.reconhecer('abbbb')[0])
+        reconhecedor = criar_reconhecedor_deterministico(afn)
+        self.assertIsInstance(reconhecedor, ReconhecedorAFD)
+        self.assertTrue(reconhecedor.reconhecer('abbbb')[0])
+        self.assertFalse(reconhecedor.reconhecer('bbbbb')[0])
+
+
+class TestAFNCompacto(unittest.TestCase):
+    def setUp(self):
+        Estado.contador = 0
+    
+    def test_numeracao_densa(self):
+        afn = ConversorERparaAFN('(a|b)*c').converter()
+        compacto = afn.compactar()
+        estados = afn.obter_todos_estados()
+        self.assertEqual(compacto.total_estados(), len(estados))
+        self.assertEqual(list(compacto.ids), [e.id for e in estados])
+        self.assertEqual(compacto.simbolos, ('a', 'b', 'c'))
+        self.assertEqual(compacto.total_transicoes(), len(afn.obter_transicoes()))
+    
+    def test_obter_transicoes_equivalente(self):
+        afn = ConversorERparaAFN('(ab|c)*d').converter()
+        compacto = afn.compactar()
+        esperado = sorted((o.id, s, d.id) for o, s, d in afn.obter_transicoes())
+        obtido = sorted((compacto.ids[o], s, compacto.ids[d]) for o, s, d in compacto.obter_transicoes())
+        self.assertEqual(obtido, esperado)
+    
+    def test_exibir_texto_identico(self):
+        afn = ConversorERparaAFN('(a|b)*abb').converter()
+        self.assertEqual(afn.compactar().exibir_texto(), afn.exibir_texto())
+    
+    def test_reconhecedor_consome_compacto(self):
+        afn = ConversorERparaAFN('(a|b)*abb').converter()
+        reconhecedor_afn = ReconhecedorAFN(afn)
+        reconhecedor_compacto = ReconhecedorAFN(afn.compactar())
+        for cadeia in ['abb', 'aabb', 'ab', 'c', '']:
+            self.assertEqual(reconhecedor_compacto.reconhecer(cadeia), reconhecedor_afn.reconhecer(cadeia))
+            self.assertEqual(reconhecedor_compacto.obter_historico_texto(), reconhecedor_afn.obter_historico_texto())
+    
+    def test_memoria_menor_que_grafo_de_objetos(self):
+        afn = ConversorERparaAFN('(a|b|c|d)*' + 'abcd' * 50).converter()
+        compacto = afn.compactar()
+        self.assertLess(compacto.memoria_bytes(), memoria_grafo_objetos(afn))
+        self.assertGreater(compacto.bytes_por_estado(), 0)
+
+
+class TestReconhecimentoBits(unittest.TestCase):
+    def setUp(self):
+        Estado.contador = 0
+    
+    def test_mesmo_resultado_e_historico_que_conjuntos(self):
+        cadeias = ['', 'a', 'ab', 'abb', 'aabb', 'babb', 'abc', 'abbabb']
+        for er in ['(a|b)*abb', 'ab|ba', '((a*)*)*', '(ab)*c']:
+            afn = ConversorERparaAFN(er).converter()
+            conjuntos = ReconhecedorAFN(afn)
+            bits = ReconhecedorAFN(afn, modo='bits')
+            for cadeia in cadeias:
+                self.assertEqual(bits.reconhecer(cadeia), conjuntos.reconhecer(cadeia), (er, cadeia))
+                self.assertEqual(bits.obter_historico_texto(), conjuntos.obter_historico_texto())
+    
+    def test_automato_grande(self):
+        afn = ConversorERparaAFN('(a|b)*' + 'ab' * 200).converter()
+        reconhecedor = ReconhecedorAFN(afn, modo='bits')
+        self.assertGreater(afn.compactar().total_estados(), 64)
+        self.assertTrue(reconhecedor.reconhecer('ba' + 'ab' * 200)[0])
+        self.assertFalse(reconhecedor.reconhecer('ab' * 199)[0])
+    
+    def test_simbolo_fora_do_alfabeto(self):
+        afn = ConversorERparaAFN('a*').converter()
+        reconhecedor = ReconhecedorAFN(afn, modo='bits')
+        aceita, motivo = reconhecedor.reconhecer('ax')
+        self.assertFalse(aceita)
+        self.assertEqual(motivo, "Nenhum estado alcançável")
+
+
+class TestReconhecimentoLote(unittest.TestCase):
+    def setUp(self):
+        Estado.contador = 0
+        self.cadeias = ['abb', 'ab', '', 'aabb', 'c', 'babb', 'abbc'] * 5
+        afn = ConversorERparaAFN('(a|b)*abb').converter()
+        self.reconhecedor = ReconhecedorAFN(afn)
+        self.esperado = [self.reconhecedor.reconhecer(c)[0] for c in self.cadeias]
+    
+    def test_lote_sequencial_em_ordem(self):
+        resultado = self.reconhecedor.reconhecer_lote(self.cadeias, workers=1, chunksize=4)
+        self.assertEqual(resultado, self.esperado)
+    
+    def test_lote_com_processos_em_ordem(self):
+        resultado = self.reconhecedor.reconhecer_lote(iter(self.cadeias), workers=2, chunksize=3)
+        self.assertEqual(resultado, self.esperado)
+    
+    def test_lote_fluxo(self):
+        resultado = dict(self.reconhecedor.reconhecer_lote_fluxo(self.cadeias, workers=2, chunksize=3))
+        self.assertEqual([resultado[i] for i in range(len(self.cadeias))], self.esperado)
+    
+    def test_lote_vazio(self):
+        self.assertEqual(self.reconhecedor.reconhecer_lote([], workers=2), [])
+
+
+class TestReconhecedorIncremental(unittest.TestCase):
+    def setUp(self):
+        Estado.contador = 0
+        afn = ConversorERparaAFN('(a|b)*abb').converter()
+        self.incremental = ReconhecedorAFN(afn).incremental()
+    
+    def test_blocos_equivalem_a_cadeia_inteira(self):
+        for bloco in ['ab', 'aa', 'b', 'abb']:
+            self.incremental.alimentar(bloco)
+        self.assertTrue(self.incremental.esta_aceitando())
+        self.incremental.alimentar('a')
+        self.assertFalse(self.incremental.esta_aceitando())
+        self.assertEqual(self.incremental.consumidos, 9)
+    
+    def test_morto_interrompe_leitura(self):
+        self.assertTrue(self.incremental.alimentar('ab'))
+        self.assertFalse(self.incremental.alimentar('c'))
+        self.assertTrue(self.incremental.esta_morto())
+        self.incremental.alimentar('abb')
+        self.assertFalse(self.incremental.esta_aceitando())
+    
+    def test_reiniciar(self):
+        self.incremental.alimentar('x')
+        self.incremental.reiniciar()
+        self.assertFalse(self.incremental.esta_morto())
+        self.incremental.alimentar('abb')
+        self.assertTrue(self.incremental.esta_aceitando())
+    
+    def test_bytes_e_fluxo(self):
+        fluxo = io.BytesIO(b'ab' * 1000 + b'abb')
+        self.assertTrue(self.incremental.alimentar_fluxo(fluxo, tamanho_bloco=7))
+        self.incremental.reiniciar()
+        fluxo = io.BytesIO(b'abc' + b'ab' * 1000)
+        self.assertFalse(self.incremental.alimentar_fluxo(fluxo, tamanho_bloco=2))
+        self.assertLess(fluxo.tell(), 10)
+    
+    def test_sequencia_utf8_truncada(self):
+        incremental = ReconhecedorAFN(ConversorERparaAFN('é+').converter(), modo='afd_preguicoso').incremental()
+        incremental.alimentar(b'\xc3\xa9\xc3')
+        self.assertFalse(incremental.esta_aceitando())
+        with self.assertRaises(UnicodeDecodeError):
+            incremental.finalizar()
+        
+        incremental.reiniciar()
+        incremental.alimentar(b'\xc3\xa9\xc3')
+        incremental.alimentar(b'\xa9')
+        self.assertTrue(incremental.esta_aceitando())
+        self.assertTrue(incremental.finalizar())
+        
+        incremental.reiniciar()
+        with self.assertRaises(UnicodeDecodeError):
+            incremental.alimentar_fluxo(io.BytesIO(b'\xc3\xa9\xc3'), tamanho_bloco=2)
+
+
+class TestNiveisRastreamento(unittest.TestCase):
+    def setUp(self):
+        Estado.contador = 0
+        self.afn = ConversorERparaAFN('(a|b)*abb').converter()
+    
+    def test_nivel_invalido(self):
+        with self.assertRaises(ValueError):
+            ReconhecedorAFN(self.afn, rastreamento='detalhado')
+    
+    def test_desligado_nao_registra(self):
+        for modo in ReconhecedorAFN.MODOS:
+            reconhecedor = ReconhecedorAFN(self.afn, modo=modo, rastreamento='desligado')
+            self.assertEqual(reconhecedor.reconhecer('aabb'), ReconhecedorAFN(self.afn).reconhecer('aabb'))
+            self.assertEqual(reconhecedor.reconhecer('abc')[1], "Nenhum estado alcançável")
+            self.assertEqual(reconhecedor.historico, [])
+            self.assertIsNone(reconhecedor.resumo)
+    
+    def test_resumo_igual_entre_modos(self):
+        completo = ReconhecedorAFN(self.afn)
+        completo.reconhecer('abab')
+        maximo = max(len(item['estados']) for item in completo.historico)
+        for modo in ReconhecedorAFN.MODOS:
+            reconhecedor = ReconhecedorAFN(self.afn, modo=modo, rastreamento='resumo')
+            reconhecedor.reconhecer('abab')
+            self.assertEqual(reconhecedor.historico, [])
+            self.assertEqual(reconhecedor.resumo['simbolos_lidos'], 4)
+            self.assertEqual(reconhecedor.resumo['max_estados_ativos'], maximo)
+    
+    def test_completo_e_o_padrao(self):
+        reconhecedor = ReconhecedorAFN(self.afn)
+        reconhecedor.reconhecer('ab')
+        self.assertEqual(len(reconhecedor.historico), 3)
+        self.assertTrue(reconhecedor.obter_historico_texto().startswith('Inicial: {'))
+    
+    def test_conjuntos_desligado_igual_ao_rastreado(self):
+        desligado = ReconhecedorAFN(self.afn, rastreamento='desligado')
+        rastreado = ReconhecedorAFN(self.afn, rastreamento='resumo')
+        for cadeia in ['', 'a', 'abb', 'aabb', 'babb', 'abba', 'abc', 'ababb' * 3]:
+            self.assertEqual(desligado.reconhecer(cadeia), rastreado.reconhecer(cadeia), cadeia)
+    
+    def test_conjuntos_desligado_sem_alocacao_por_simbolo(self):
+        reconhecedor = ReconhecedorAFN(self.afn, rastreamento='desligado')
+        picos = []
+        for tamanho in [1000, 20000]:
+            cadeia = 'ab' * (tamanho // 2)
+            tracemalloc.start()
+            reconhecedor.reconhecer(cadeia)
+            picos.append(tracemalloc.get_traced_memory()[1])
+            tracemalloc.stop()
+        self.assertLess(picos[1], picos[0] + 1024)
+
+
+class TestConversorIterativo(unittest.TestCase):
+    def setUp(self):
+        Estado.contador = 0
+    
+    def _estrutura(self, afn):
+        return [
+            (e.id, e.eh_final, sorted((s, [d.id for d in ds]) for s, ds in e.transicoes.items()))
+            for e in afn.obter_todos_estados()
+        ]
+    
+    def test_ids_seguem_ordem_de_thompson(self):
+        afn = ConversorERparaAFN('a|b|c').converter()
+        self.assertEqual(afn.estado_inicial.id, 8)
+        self.assertEqual(afn.estado_final.id, 9)
+        self.assertEqual(self._estrutura(afn)[8], (8, False, [('ε', [0, 6])]))
+    
+    def test_concatenacao_longa_sem_recursao(self):
+        er = 'ab' * 5000
+        afn = ConversorERparaAFN(er).converter()
+        reconhecedor = ReconhecedorAFN(afn, modo='afd_preguicoso', rastreamento='desligado')
+        self.assertTrue(reconhecedor.reconhecer(er)[0])
+        self.assertFalse(reconhecedor.reconhecer(er[:-1])[0])
+    
+    def test_aninhamento_profundo(self):
+        er = '(' * 5000 + 'a' + ')*' * 5000
+        afn = ConversorERparaAFN(er).converter()
+        self.assertTrue(ReconhecedorAFN(afn, rastreamento='desligado').reconhecer('aaa')[0])
+    
+    def test_erros_com_posicao(self):
+        casos = {'(a': 0, 'ab(c|d': 2, 'a)': 1, '()': 1, '|a': 0, 'a|': 2, '*a': 0, '(a|)b': 3, '': 0}
+        for er, posicao in casos.items():
+            with self.assertRaises(ErroSintaxeER) as contexto:
+                ConversorERparaAFN(er).converter()
+            self.assertEqual(contexto.exception.posicao, posicao, er)
+
+
+class TestCacheCompilacao(unittest.TestCase):
+    def setUp(self):
+        Estado.contador = 0
+    
+    def test_acerto_retorna_mesmo_automato(self):
+        cache = CacheCompilacao()
+        primeiro = cache.obter('(a|b)*abb')
+        segundo = cache.obter('(a|b)*abb')
+        self.assertIs(primeiro, segundo)
+        self.assertEqual(cache.estatisticas()['acertos'], 1)
+        self.assertEqual(cache.estatisticas()['faltas'], 1)
+    
+    def test_remocao_lru_por_tamanho(self):
+        cache = CacheCompilacao(tamanho_maximo=2)
+        cache.obter('a')
+        cache.obter('b')
+        cache.obter('a')
+        cache.obter('c')
+        estatisticas = cache.estatisticas()
+        self.assertEqual(estatisticas['entradas'], 2)
+        self.assertEqual(estatisticas['remocoes'], 1)
+        cache.obter('a')
+        self.assertEqual(cache.estatisticas()['acertos'], 2)
+        cache.obter('b')
+        self.assertEqual(cache.estatisticas()['faltas'], 4)
+    
+    def test_remocao_por_bytes(self):
+        cache = CacheCompilacao(tamanho_maximo=None, bytes_maximo=1)
+        cache.obter('a')
+        self.assertEqual(cache.estatisticas()['entradas'], 0)
+        self.assertEqual(cache.estatisticas()['remocoes'], 1)
+    
+    def test_automato_compilado_e_imutavel(self):
+        compacto = compilar('ab')
+        with self.assertRaises(AttributeError):
+            compacto.inicial = 1
+        with self.assertRaises(TypeError):
+            compacto.destinos[0] = 0
+        self.assertTrue(ReconhecedorAFN(compacto).reconhecer('ab')[0])
+    
+    def test_afn_reconstruido_do_cache(self):
+        afn = compilar_afn('(a|b)*abb')
+        original = ConversorERparaAFN('(a|b)*abb').converter()
+        self.assertEqual(afn.exibir_texto(), original.exibir_texto())
+        self.assertEqual(afn.estado_final.id, original.estado_final.id)
+        self.assertIsNot(compilar_afn('(a|b)*abb'), afn)
+
+
+class TestCompilacaoConcorrente(unittest.TestCase):
+    def _estrutura(self, afn):
+        return [
+            (e.id, e.eh_final, sorted((s, [d.id for d in ds]) for s, ds in e.transicoes.items()))
+            for e in afn.obter_todos_estados()
+        ]
+    
+    def test_ids_locais_a_cada_compilacao(self):
+        Estado.contador = 100
+        afn = ConversorERparaAFN('ab').converter()
+        self.assertEqual([e.id for e in afn.obter_todos_estados()], [0, 1, 2, 3])
+        self.assertEqual(Estado.contador, 100)
+    
+    def test_compilacao_em_threads(self):
+        padroes = ['(a|b)*abb', '(ab|c)*d', 'a*b*c*', '((a|b)(c|d))*'] * 25
+        esperado = [self._estrutura(ConversorERparaAFN(er).converter()) for er in padroes]
+        with ThreadPoolExecutor(8) as executor:
+            obtido = list(executor.map(lambda er: self._estrutura(ConversorERparaAFN(er).converter()), padroes))
+        self.assertEqual(obtido, esperado)
+    
+    def test_compilacao_nao_altera_coletor(self):
+        with ThreadPoolExecutor(16) as executor:
+            list(executor.map(lambda _: ConversorERparaAFN('a').converter(), range(2000)))
+        self.assertTrue(gc.isenabled())
+        gc.disable()
+        try:
+            ConversorERparaAFN('(a|b)*').converter()
+            self.assertFalse(gc.isenabled())
+        finally:
+            gc.enable()
+
+
+class TestConversorGlushkov(unittest.TestCase):
+    def setUp(self):
+        Estado.contador = 0
+    
+    def test_n_mais_um_estados_sem_epsilon(self):
+        afn = ConversorGlushkov('(a|b)*abb').converter()
+        self.assertEqual(len(afn.obter_todos_estados()), 6)
+        self.assertNotIn('ε', [simbolo for _, simbolo, _ in afn.obter_transicoes()])
+    
+    def test_inicial_final_quando_anulavel(self):
+        afn = ConversorGlushkov('a*').converter()
+        self.assertTrue(afn.estado_inicial.eh_final)
+        self.assertFalse(ConversorGlushkov('ab').converter().estado_inicial.eh_final)
+    
+    def test_equivalencia_com_thompson(self):
+        cadeias = ['', 'a', 'b', 'ab', 'ba', 'abb', 'aabb', 'abab', 'bbb', 'c']
+        for er in ['(a|b)*abb', 'a*b*', 'ab|ba', '(ab)*', '((a*)*)*', '(a|ab)(b|a)*', 'a(b|c)*a']:
+            thompson = ReconhecedorAFN(ConversorERparaAFN(er).converter())
+            glushkov = ReconhecedorAFN(ConversorGlushkov(er).converter())
+            for cadeia in cadeias:
+                self.assertEqual(glushkov.reconhecer(cadeia)[0], thompson.reconhecer(cadeia)[0], (er, cadeia))
+    
+    def test_exibir_texto_com_varios_finais(self):
+        texto = ConversorGlushkov('a|b').converter().exibir_texto()
+        self.assertIn('Estados Finais: q1, q2', texto)
+    
+    def test_compilar_por_construcao(self):
+        self.assertEqual(compilar('(a|b)*', construcao='glushkov').total_estados(), 3)
+        self.assertEqual(compilar('(a|b)*').total_estados(), 8)
+
+
+class TestEliminacaoEpsilon(unittest.TestCase):
+    def setUp(self):
+        Estado.contador = 0
+    
+    def test_sem_transicoes_epsilon(self):
+        afn = ConversorERparaAFN('(a|b)*abb').converter().eliminar_epsilon()
+        self.assertNotIn('ε', [simbolo for _, simbolo, _ in afn.obter_transicoes()])
+        self.assertEqual(len(afn.obter_todos_estados()), 6)
+    
+    def test_relatorio(self):
+        afn = ConversorERparaAFN('(a|b)*abb').converter()
+        relatorio = afn.eliminar_epsilon().relatorio_eliminacao
+        self.assertEqual(relatorio['estados_antes'], 14)
+        self.assertEqual(relatorio['estados_removidos'], 8)
+        self.assertEqual(relatorio['transicoes_antes'] - relatorio['transicoes_removidas'], relatorio['transicoes_depois'])
+    
+    def test_original_nao_e_alterado(self):
+        afn = ConversorERparaAFN('a*').converter()
+        texto = afn.exibir_texto()
+        afn.eliminar_epsilon()
+        self.assertEqual(afn.exibir_texto(), texto)
+    
+    def test_finais_propagados(self):
+        afn = ConversorERparaAFN('a*b*').converter().eliminar_epsilon()
+        self.assertTrue(afn.estado_inicial.eh_final)
+    
+    def test_equivalencia(self):
+        cadeias = ['', 'a', 'b', 'ab', 'ba', 'abb', 'aabb', 'abab', 'bbb', 'c']
+        for er in ['(a|b)*abb', 'a*b*', 'ab|ba', '(ab)*', '((a*)*)*', '(a|ab)(b|a)*']:
+            afn = ConversorERparaAFN(er).converter()
+            original = ReconhecedorAFN(afn)
+            sem_epsilon = ReconhecedorAFN(afn.eliminar_epsilon())
+            for cadeia in cadeias:
+                self.assertEqual(sem_epsilon.reconhecer(cadeia)[0], original.reconhecer(cadeia)[0], (er, cadeia))
+    
+    def test_compilar_sem_epsilon(self):
+        compacto = compilar('(a|b)*abb', eliminar_epsilon=True)
+        self.assertEqual(len(compacto.destinos_epsilon), 0)
+        self.assertTrue(ReconhecedorAFN(compacto).reconhecer('babb')[0])
+
+
+class TestIndiceAFN(unittest.TestCase):
+    def setUp(self):
+        Estado.contador = 0
+    
+    def test_indice_reaproveitado(self):
+        afn = ConversorERparaAFN('(a|b)*abb').converter()
+        afn.obter_todos_estados()
+        estados = afn._estados
+        afn.obter_transicoes()
+        afn.total_estados()
+        self.assertIs(afn._estados, estados)
+    
+    def test_acesso_por_id_e_contagens(self):
+        afn = ConversorERparaAFN('(a|b)*abb').converter()
+        self.assertEqual(afn.total_estados(), 14)
+        self.assertEqual(afn.total_transicoes(), len(afn.obter_transicoes()))
+        self.assertEqual(afn.obter_estado(afn.estado_inicial.id), afn.estado_inicial)
+        arestas = afn.transicoes_por_simbolo('b')
+        self.assertEqual(len(arestas), 3)
+        self.assertTrue(all(destino in origem.transicoes['b'] for origem, destino in arestas))
+        self.assertEqual(afn.transicoes_por_simbolo('z'), [])
+    
+    def test_invalidado_apos_mutacao(self):
+        inicial = Estado()
+        final = Estado()
+        inicial.adicionar_transicao('a', final)
+        afn = AFN(inicial, final)
+        self.assertEqual(afn.total_estados(), 2)
+        extra = Estado()
+        final.adicionar_transicao('b', extra)
+        self.assertEqual(afn.total_estados(), 3)
+        self.assertEqual(afn.obter_estado(extra.id), extra)
+        self.assertEqual(len(afn.transicoes_por_simbolo('b')), 1)
+    
+    def test_mutacao_de_outro_automato_preserva_indice(self):
+        afn = ConversorERparaAFN('(a|b)*abb').converter()
+        afn.obter_todos_estados()
+        estados = afn._estados
+        outro = ConversorERparaAFN('a*').converter()
+        outro.estado_final.adicionar_transicao('b', Estado())
+        afn.total_estados()
+        self.assertIs(afn._estados, estados)
+    
+    def test_mutacao_durante_indexacao_invalida(self):
+        inicial = Estado()
+        final = Estado()
+        extra = Estado()
+        inicial.adicionar_transicao('a', final)
+        chamadas = []
+        
+        class Gatilho(dict):
+            def items(self):
+                chamadas.append(None)
+                if len(chamadas) == 2:
+                    final.adicionar_transicao('b', extra)
+                return super().items()
+        
+        inicial.transicoes = Gatilho(inicial.transicoes)
+        afn = AFN(inicial, final)
+        self.assertEqual(afn.total_estados(), 2)
+        self.assertEqual(afn.total_estados(), 3)
+    
+    def test_estados_avulsos_compartilham_versao(self):
+        estados = [Estado() for _ in range(100)]
+        for origem, destino in zip(estados, estados[1:]):
+            origem.adicionar_transicao('a', destino)
+        afn = AFN(estados[0], estados[-1])
+        self.assertEqual(afn.total_estados(), 100)
+        self.assertEqual(len(afn._versoes), 1)
+        compilado = ConversorERparaAFN('a' * 50).converter()
+        compilado.total_estados()
+        self.assertEqual(len(compilado._versoes), 1)
+
+
+class TestBuscaNaoAncorada(unittest.TestCase):
+    def setUp(self):
+        Estado.contador = 0
+    
+    def _buscar(self, er, texto):
+        reconhecedor = ReconhecedorAFN(ConversorERparaAFN(er).converter())
+        return [(o.inicio, o.fim, o.trecho) for o in reconhecedor.buscar_todos(texto)]
+    
+    def test_todas_as_ocorrencias(self):
+        self.assertEqual(self._buscar('ab', 'xxabyyabab'), [(2, 4, 'ab'), (6, 8, 'ab'), (8, 10, 'ab')])
+    
+    def test_mais_a_esquerda_mais_longa(self):
+        self.assertEqual(self._buscar('abcd|c', 'xabcd'), [(1, 5, 'abcd')])
+        self.assertEqual(self._buscar('a|ab|abc', 'abcab'), [(0, 3, 'abc'), (3, 5, 'ab')])
+        self.assertEqual(self._buscar('(a|b)*', 'ccabba'), [(0, 0, ''), (1, 1, ''), (2, 6, 'abba'), (6, 6, '')])
+    
+    def test_buscar_primeira(self):
+        reconhecedor = ReconhecedorAFN(ConversorERparaAFN('b*c').converter())
+        self.assertEqual(reconhecedor.buscar('aabbbcbc'), Ocorrencia(2, 6, 'bbbc'))
+        self.assertIsNone(reconhecedor.buscar('aaaa'))
+    
+    def test_texto_grande(self):
+        reconhecedor = ReconhecedorAFN(ConversorERparaAFN('erro(0|1)*').converter())
+        texto = 'x' * 50000 + 'erro101' + 'y' * 50000 + 'erro'
+        ocorrencias = list(reconhecedor.buscar_todos(texto))
+        self.assertEqual([(o.inicio, o.trecho) for o in ocorrencias], [(50000, 'erro101'), (100007, 'erro')])
+    
+    def test_ocorrencias_vazias_apos_casamento(self):
+        self.assertEqual(self._buscar('b|bb|ab|ε', 'cbabc'), [(0, 0, ''), (1, 2, 'b'), (2, 4, 'ab'), (4, 4, ''), (5, 5, '')])
+        self.assertEqual(self._buscar('a*', 'aab'), [(0, 2, 'aa'), (2, 2, ''), (3, 3, '')])
+    
+    def test_trabalho_linear_no_tamanho_do_texto(self):
+        reconhecedor = ReconhecedorAFN(ConversorERparaAFN('a|a*b').converter(), rastreamento='desligado')
+        avancar = reconhecedor._avancar_fios
+        trabalho = []
+        
+        def contar(fios, simbolo, ocupados):
+            trabalho[-1] += len(fios)
+            return avancar(fios, simbolo, ocupados)
+        
+        reconhecedor._avancar_fios = contar
+        for tamanho in [1000, 4000]:
+            trabalho.append(0)
+            ocorrencias = list(reconhecedor.buscar_todos('a' * tamanho))
+            self.assertEqual(len(ocorrencias), tamanho)
+            self.assertTrue(all(o.trecho == 'a' for o in ocorrencias))
+        self.assertLess(trabalho[1], 5 * trabalho[0])
+        self.assertLess(trabalho[1], 10 * 4000)
+
+
+class TestVarreduraArquivos(unittest.TestCase):
+    def setUp(self):
+        Estado.contador = 0
+        diretorio = tempfile.mkdtemp()
+        self.caminho = os.path.join(diretorio, 'entrada.txt')
+        with open(self.caminho, 'wb') as arquivo:
+            arquivo.write(b'ab\nabbb\nx\n\nabc\r\nab\r\n')
+        self.vazio = os.path.join(diretorio, 'vazio.txt')
+        open(self.vazio, 'wb').close()
+    
+    def _executar(self, *argumentos):
+        saida = io.StringIO()
+        with contextlib.redirect_stdout(saida), contextlib.redirect_stderr(io.StringIO()):
+            varrer(list(argumentos))
+        return saida.getvalue().splitlines()
+    
+    def test_linhas_aceitas(self):
+        linhas = self._executar('ab*', self.caminho, self.vazio)
+        self.assertEqual(linhas, [f'{self.caminho}:1', f'{self.caminho}:2', f'{self.caminho}:6'])
+    
+    def test_contagem(self):
+        self.assertEqual(self._executar('ab*', self.caminho, '--contar'), [f'{self.caminho}: 3 linha(s) aceita(s)'])
+    
+    def test_buffer_inteiro(self):
+        self.assertEqual(self._executar('(a|b|c|x|\n|\r)*', self.caminho, '--buffer'), [f'{self.caminho}: ACEITA'])
+        self.assertEqual(self._executar('ab*', self.caminho, '--buffer'), [f'{self.caminho}: REJEITADA'])
+    
+    def test_erros_sem_traceback(self):
+        inexistente = os.path.join(os.path.dirname(self.caminho), 'inexistente.txt')
+        for argumentos, esperado in [(['(ab', self.caminho], []), (['ab*', inexistente, self.caminho], [f'{self.caminho}:1'])]:
+            saida = io.StringIO()
+            erros = io.StringIO()
+            with contextlib.redirect_stdout(saida), contextlib.redirect_stderr(erros):
+                codigo = varrer(argumentos)
+            self.assertEqual(codigo, 2)
+            self.assertTrue(erros.getvalue().startswith('Erro: '), erros.getvalue())
+            self.assertEqual(saida.getvalue().splitlines()[:1], esperado)
+
+
+class TestComparacaoBenchmarks(unittest.TestCase):
+    def test_regressao_acima_do_limite(self):
+        base = {'resultados': [
+            {'nome': 'conversao/x', 'parametro': 10, 'segundos': 0.010},
+            {'nome': 'conversao/y', 'parametro': 10, 'segundos': 0.010},
+            {'nome': 'conversao/ruido', 'parametro': 10, 'segundos': 0.00001},
+        ]}
+        atual = {'resultados': [
+            {'nome': 'conversao/x', 'parametro': 10, 'segundos': 0.020},
+            {'nome': 'conversao/y', 'parametro': 10, 'segundos': 0.011},
+            {'nome': 'conversao/ruido', 'parametro': 10, 'segundos': 0.001},
+            {'nome': 'conversao/nova', 'parametro': 10, 'segundos': 1.0},
+        ]}
+        regressoes = comparar(base, atual, limite=0.25)
+        self.assertEqual([(r['nome'], r['parametro']) for r in regressoes], [('conversao/x', 10)])
+        self.assertAlmostEqual(regressoes[0]['razao'], 2.0)
+
+
+class TestInstrumentacao(unittest.TestCase):
+    def setUp(self):
+        Estado.contador = 0
+    
+    def test_conversor_conta_operacoes_e_fases(self):
+        instrumentacao = Instrumentacao()
+        afn = ConversorERparaAFN("(a|b)*c", instrumentacao).converter()
+        estatisticas = instrumentacao.estatisticas
+        self.assertEqual(estatisticas.contadores['simbolos'], 3)
+        self.assertEqual(estatisticas.contadores['unioes'], 1)
+        self.assertEqual(estatisticas.contadores['fechamentos'], 1)
+        self.assertEqual(estatisticas.contadores['concatenacoes'], 1)
+        self.assertEqual(estatisticas.contadores['estados_criados'], afn.total_estados())
+        self.assertIn('analise', estatisticas.tempos)
+        self.assertIn('finalizacao', estatisticas.tempos)
+    
+    def test_reconhecedor_conta_passos_e_pico(self):
+        afn = ConversorERparaAFN("(a|b)*c").converter()
+        for modo in ReconhecedorAFN.MODOS:
+            instrumentacao = Instrumentacao()
+            reconhecedor = ReconhecedorAFN(afn, modo=modo, rastreamento='desligado', instrumentacao=instrumentacao)
+            aceita, _ = reconhecedor.reconhecer("abac")
+            self.assertTrue(aceita)
+            self.assertIsNone(reconhecedor.resumo)
+            
+            estatisticas = instrumentacao.estatisticas
+            referencia = ReconhecedorAFN(afn, modo='conjuntos', rastreamento='resumo')
+            referencia.reconhecer("abac")
+            self.assertEqual(estatisticas.contadores['passos'], 4)
+            self.assertEqual(estatisticas.contadores['estados_visitados'], referencia.resumo['total_estados_ativos'])
+            self.assertEqual(estatisticas.picos['estados_ativos'], referencia.resumo['max_estados_ativos'])
+            self.assertEqual(estatisticas.contadores['arestas_epsilon_percorridas'] % 2, 0)
+            self.assertGreater(estatisticas.contadores['arestas_epsilon_percorridas'], 0)
+            self.assertIn('fechos_epsilon', estatisticas.tempos)
+            self.assertIn('reconhecimento', estatisticas.tempos)
+    
+    def test_contagem_de_fechos(self):
+        instrumentacao = Instrumentacao()
+        reconhecedor = ReconhecedorAFN(ConversorERparaAFN("ab").converter(), instrumentacao=instrumentacao)
+        reconhecedor.reconhecer("ab")
+        self.assertEqual(instrumentacao.estatisticas.contadores['fechos_calculados'], 3)
+        
+        instrumentacao = Instrumentacao()
+        reconhecedor = ReconhecedorAFN(ConversorERparaAFN("ab").converter(), modo='afd_preguicoso', instrumentacao=instrumentacao)
+        reconhecedor.reconhecer("ab")
+        reconhecedor.reconhecer("ab")
+        self.assertEqual(instrumentacao.estatisticas.contadores['transicoes_afd_calculadas'], 2)
+    
+    def test_callback_recebe_eventos(self):
+        eventos = []
+        instrumentacao = Instrumentacao(lambda evento, dados: eventos.append((evento, dados)))
+        reconhecedor = ReconhecedorAFN(ConversorERparaAFN("a*").converter(), rastreamento='desligado', instrumentacao=instrumentacao)
+        reconhecedor.reconhecer("aa")
+        tipos = [evento for evento, _ in eventos]
+        self.assertIn('fase', tipos)
+        self.assertEqual(tipos.count('passo'), 3)
+        self.assertEqual(eventos[-1], ('reconhecimento', {'modo': 'conjuntos', 'tamanho': 2, 'aceita': True}))
+    
+    def test_desligada_por_padrao(self):
+        reconhecedor = ReconhecedorAFN(ConversorERparaAFN("a*").converter(), rastreamento='desligado')
+        self.assertIsNone(reconhecedor.instrumentacao)
+        self.assertNotIn('_epsilon_fecho', vars(reconhecedor))
+        self.assertTrue(reconhecedor.reconhecer("aaa")[0])
+        self.assertEqual(reconhecedor.historico, [])
+
+
+class TestSerializacao(unittest.TestCase):
+    def setUp(self):
+        Estado.contador = 0
+        self.diretorio = tempfile.mkdtemp()
+        self.afn = ConversorERparaAFN("(a|b)*abb|ç").converter()
+        self.compacto = self.afn.compactar()
+    
+    def _caminho(self, nome):
+        return os.path.join(self.diretorio, nome)
+    
+    def _assert_iguais(self, a, b):
+        self.assertEqual(a.inicial, b.inicial)
+        self.assertEqual(a.simbolos, b.simbolos)
+        for campo in ('ids', 'finais', 'deslocamentos', 'rotulos', 'destinos', 'deslocamentos_epsilon', 'destinos_epsilon'):
+            self.assertEqual(list(getattr(a, campo)), list(getattr(b, campo)), campo)
+    
+    def test_ida_e_volta_binario_e_json(self):
+        for nome in ('automato.afnc', 'automato.json'):
+            caminho = self._caminho(nome)
+            self.compacto.salvar(caminho)
+            carregado = AFNCompacto.carregar(caminho)
+            self._assert_iguais(self.compacto, carregado)
+            self.assertEqual(carregado.exibir_texto(), self.afn.exibir_texto())
+        
+        with open(self._caminho('automato.afnc'), 'rb') as arquivo:
+            self.assertEqual(arquivo.read(4), b'AFNC')
+    
+    def test_afn_salvar_e_carregar(self):
+        caminho = self._caminho('automato.bin')
+        self.afn.salvar(caminho)
+        carregado = AFN.carregar(caminho)
+        self.assertEqual(carregado.exibir_texto(), self.afn.exibir_texto())
+        for cadeia in ["abb", "babb", "ç", "ab", ""]:
+            self.assertEqual(
+                ReconhecedorAFN(carregado).reconhecer(cadeia)[0],
+                ReconhecedorAFN(self.afn).reconhecer(cadeia)[0],
+            )
+    
+    def test_soma_de_verificacao(self):
+        dados = bytearray(self.compacto.para_bytes())
+        dados[-1] ^= 1
+        with self.assertRaises(ErroFormatoAutomato):
+            AFNCompacto.de_bytes(bytes(dados))
+        
+        caminho = self._caminho('automato.json')
+        self.compacto.salvar(caminho)
+        with open(caminho, encoding='utf-8') as arquivo:
+            texto = arquivo.read()
+        with self.assertRaises(ErroFormatoAutomato):
+            AFNCompacto.de_json(texto.replace('"final": true', '"final": false', 1))
+    
+    def test_versao_e_formato_invalidos(self):
+        dados = bytearray(self.compacto.para_bytes())
+        dados[4] = 99
+        with self.assertRaises(ErroFormatoAutomato):
+            AFNCompacto.de_bytes(bytes(dados))
+        with self.assertRaises(ErroFormatoAutomato):
+            AFNCompacto.de_bytes(self.compacto.para_bytes()[:-3])
+        
+        caminho = self._caminho('lixo.txt')
+        with open(caminho, 'w', encoding='utf-8') as arquivo:
+            arquivo.write('(a|b)*')
+        with self.assertRaises(ErroFormatoAutomato):
+            AFNCompacto.carregar(caminho)
+        with self.assertRaises(ValueError):
+            self.compacto.salvar(caminho, formato='xml')
+
+
+class TestClassesAlfabeto(unittest.TestCase):
+    def setUp(self):
+        Estado.contador = 0
+    
+    def test_simbolos_indistinguiveis_compartilham_classe(self):
+        q0, q1, q2 = Estado(), Estado(), Estado()
+        for simbolo in 'abc':
+            q0.adicionar_transicao(simbolo, q1)
+        q1.adicionar_transicao('d', q2)
+        q1.adicionar_transicao('a', q2)
+        q1.adicionar_transicao('€', q2)
+        q1.adicionar_transicao('d', q0)
+        classes = AFN(q0, q2).classes_alfabeto()
+        
+        self.assertEqual(classes.total_classes(), 5)
+        self.assertEqual(classes.classe('b'), classes.classe('c'))
+        self.assertNotEqual(classes.classe('a'), classes.classe('b'))
+        self.assertNotIn(classes.classe('€'), (0, classes.classe('a'), classes.classe('d')))
+        self.assertEqual(classes.classe('z'), 0)
+        self.assertEqual(classes.classe('語'), 0)
+        self.assertEqual(classes.traduzir('bcz'), [classes.classe('b')] * 2 + [0])
+        self.assertEqual(classes.representante(0), None)
+    
+    def test_compacto_produz_mesma_particao(self):
+        afn = ConversorERparaAFN("(a|b)*abb").converter().eliminar_epsilon()
+        por_afn = afn.classes_alfabeto()
+        por_compacto = afn.compactar().classes_alfabeto()
+        self.assertEqual(por_afn.classes, por_compacto.classes)
+        self.assertEqual(list(por_afn.tabela), list(por_compacto.tabela))
+    
+    def test_afd_preguicoso_reaproveita_transicao_por_classe(self):
+        reconhecedor = ReconhecedorAFN(ConversorERparaAFN("a*").converter(), modo='afd_preguicoso', rastreamento='desligado')
+        self.assertFalse(reconhecedor.aceita('aax'))
+        self.assertFalse(reconhecedor.aceita('aay'))
+        self.assertFalse(reconhecedor.aceita('aa語'))
+        self.assertTrue(reconhecedor.aceita('aaa'))
+        self.assertEqual(reconhecedor.total_estados_afd(), 3)
+        self.assertEqual(reconhecedor._transicoes_afd[1], [2, 1])
+    
+    def test_tabelas_limitadas_pelas_classes(self):
+        afn = ConversorERparaAFN("[a-z]+").converter()
+        texto = ''.join(chr(codigo) for codigo in range(0x100, 0x20000, 7) if not 0xD800 <= codigo < 0xE000)
+        for modo in ReconhecedorAFN.MODOS:
+            reconhecedor = ReconhecedorAFN(afn, modo=modo, rastreamento='desligado')
+            for simbolo in texto[::50]:
+                self.assertFalse(reconhecedor.reconhecer('ab' + simbolo)[0])
+            self.assertFalse(reconhecedor.aceita('a' + texto))
+            self.assertTrue(reconhecedor.aceita('xyz'))
+        total = reconhecedor.classes.total_classes()
+        self.assertEqual(total, 2)
+        self.assertTrue(all(len(linha) == total for linha in reconhecedor._transicoes_afd))
+        self.assertFalse(hasattr(reconhecedor.compacto, '_indices_simbolo'))
+        bits = ReconhecedorAFN(afn, modo='bits', rastreamento='desligado')
+        bits.reconhecer('a' + texto)
+        self.assertEqual(len(bits._passos_bits), total)
+
+
+class TestClassesCaracteres(unittest.TestCase):
+    def setUp(self):
+        Estado.contador = 0
+    
+    def _aceitas(self, er, cadeias):
+        afn = ConversorERparaAFN(er).converter()
+        resultados = []
+        for modo in ReconhecedorAFN.MODOS:
+            reconhecedor = ReconhecedorAFN(afn, modo=modo, rastreamento='desligado')
+            resultados.append([reconhecedor.reconhecer(c)[0] for c in cadeias])
+        deterministico = ReconhecedorAFD(AFD.de_afn(afn).minimizar())
+        resultados.append([deterministico.reconhecer(c)[0] for c in cadeias])
+        for resultado in resultados[1:]:
+            self.assertEqual(resultado, resultados[0])
+        return resultados[0]
+    
+    def test_intervalos_ordenados_e_fundidos(self):
+        classe = ClasseCaracteres([(ord('x'), ord('z')), (ord('a'), ord('c')), (ord('d'), ord('d'))])
+        self.assertEqual(classe.intervalos, ((ord('a'), ord('d')), (ord('x'), ord('z'))))
+        self.assertEqual(classe, '[a-dx-z]')
+        self.assertTrue(classe.contem('b'))
+        self.assertFalse(classe.contem('e'))
+        self.assertEqual(classe.total_simbolos(), 7)
+    
+    def test_classe_vira_uma_unica_transicao(self):
+        afn = ConversorERparaAFN("[a-z0-9]").converter()
+        self.assertEqual(afn.total_estados(), 2)
+        self.assertEqual(afn.obter_transicoes()[0][1], '[0-9a-z]')
+        
+        Estado.contador = 0
+        encadeada = ConversorERparaAFN('|'.join('abcdefghijklmnopqrstuvwxyz0123456789')).converter()
+        self.assertGreater(encadeada.total_estados(), 30 * afn.total_estados())
+    
+    def test_intervalos_e_negacao(self):
+        cadeias = ['a', 'm', 'z', '5', 'A', '-', '語', '']
+        self.assertEqual(self._aceitas("[a-z0-9]", cadeias), [True, True, True, True, False, False, False, False])
+        self.assertEqual(self._aceitas("[^a-z]", cadeias), [False, False, False, True, True, True, True, False])
+        self.assertEqual(self._aceitas("[a-]", ['a', '-', 'b']), [True, True, False])
+        self.assertEqual(self._aceitas("[]a]", [']', 'a', 'b']), [True, True, False])
+        self.assertEqual(self._aceitas(r"[\]\\]", [']', '\\', 'a']), [True, True, False])
+    
+    def test_classes_sobrepostas_a_simbolos(self):
+        cadeias = ['ab', 'zb', 'ac', 'zc', 'b']
+        self.assertEqual(self._aceitas("[a-z]b|ac", cadeias), [True, True, True, False, False])
+        self.assertEqual(self._aceitas("([a-m]|[h-z])*q", ['hq', 'zzq', 'q', 'Aq']), [True, True, True, False])
+    
+    def test_exibicao_compacta(self):
+        self.assertEqual(ConversorERparaAFN("[^abc]").converter().obter_transicoes()[0][1], '[^a-c]')
+        self.assertEqual(ConversorERparaAFN("[a]").converter().obter_transicoes()[0][1], 'a')
+        self.assertIn("[0-9] →", ConversorERparaAFN("[0-9]").converter().exibir_texto())
+        self.assertEqual(ClasseCaracteres.de_texto('[^a-c]').intervalos, ((0, ord('a') - 1), (ord('c') + 1, 0x10FFFF)))
+    
+    def test_erros_de_sintaxe(self):
+        for er, posicao in [("[a-z", 0), ("a[", 1), ("[z-a]", 1), ("[]", 0)]:
+            with self.assertRaises(ErroSintaxeER) as contexto:
+                ConversorERparaAFN(er).converter()
+            self.assertEqual(contexto.exception.posicao, posicao)
+    
+    def test_busca_e_serializacao_com_classes(self):
+        afn = ConversorERparaAFN("[0-9][0-9]*").converter()
+        reconhecedor = ReconhecedorAFN(afn)
+        self.assertEqual([o.trecho for o in reconhecedor.buscar_todos("ab 12 c 345")], ['12', '345'])
+        
+        carregado = AFNCompacto.de_bytes(afn.compactar().para_bytes())
+        self.assertIsInstance(carregado.simbolos[0], ClasseCaracteres)
+        self.assertTrue(ReconhecedorAFN(carregado).reconhecer("907")[0])
+    
+    def test_classes_de_alfabeto_com_intervalos(self):
+        classes = ConversorERparaAFN("[a-z]|m").converter().classes_alfabeto()
+        self.assertEqual(classes.total_classes(), 3)
+        self.assertEqual(classes.classe('a'), classes.classe('z'))
+        self.assertNotEqual(classes.classe('m'), classes.classe('a'))
+        self.assertEqual(classes.classe('A'), 0)
+
+
+class TestRepeticao(unittest.TestCase):
+    def setUp(self):
+        Estado.contador = 0
+    
+    def _aceitas(self, er, cadeias):
+        resultados = []
+        for conversor in (ConversorERparaAFN, ConversorGlushkov):
+            afn = conversor(er).converter()
+            for modo in ReconhecedorAFN.MODOS:
+                reconhecedor = ReconhecedorAFN(afn, modo=modo, rastreamento='desligado')
+                resultados.append([reconhecedor.reconhecer(c)[0] for c in cadeias])
+        for resultado in resultados[1:]:
+            self.assertEqual(resultado, resultados[0])
+        return resultados[0]
+    
+    def test_mais_e_opcional(self):
+        cadeias = ['', 'a', 'aa', 'ab', 'b']
+        self.assertEqual(self._aceitas("a+", cadeias), [False, True, True, False, False])
+        self.assertEqual(self._aceitas("a?b?", cadeias), [True, True, False, True, True])
+        self.assertEqual(self._aceitas("(ab)+", ['ab', 'abab', '', 'aba']), [True, True, False, False])
+    
+    def test_quantificadores(self):
+        cadeias = ['a' * n for n in range(7)]
+        self.assertEqual(self._aceitas("a{3}", cadeias), [n == 3 for n in range(7)])
+        self.assertEqual(self._aceitas("a{2,}", cadeias), [n >= 2 for n in range(7)])
+        self.assertEqual(self._aceitas("a{2,4}", cadeias), [2 <= n <= 4 for n in range(7)])
+        self.assertEqual(self._aceitas("a{0,2}", cadeias), [n <= 2 for n in range(7)])
+        self.assertEqual(self._aceitas("ba{0}", ['b', 'ba']), [True, False])
+        self.assertEqual(self._aceitas("(a|bc){2}", ['aa', 'abc', 'bcbc', 'a', 'bca', 'abca']), [True, True, True, False, True, False])
+        self.assertEqual(self._aceitas("((a{2}){2,3})?", cadeias), [n in (0, 4, 6) for n in range(7)])
+    
+    def test_mais_nao_duplica_operando(self):
+        positivo = ConversorERparaAFN("(a|b)+").converter()
+        Estado.contador = 0
+        expandido = ConversorERparaAFN("(a|b)(a|b)*").converter()
+        self.assertLess(positivo.total_estados(), expandido.total_estados())
+    
+    def test_limites_grandes_crescem_linearmente(self):
+        afn = ConversorERparaAFN("(a|b){1000}").converter()
+        self.assertEqual(afn.total_estados(), 5001)
+        reconhecedor = ReconhecedorAFN(afn, modo='afd_preguicoso', rastreamento='desligado')
+        self.assertTrue(reconhecedor.reconhecer('ab' * 500)[0])
+        self.assertFalse(reconhecedor.reconhecer('ab' * 499)[0])
+        
+        glushkov = ConversorGlushkov("[0-9]{1,1000}").converter()
+        self.assertEqual(glushkov.total_estados(), 1001)
+    
+    def test_erros_de_sintaxe(self):
+        casos = [("+a", 0), ("a{", 1), ("a{x}", 1), ("a{3,2}", 1), ("a{1,2,3}", 1), ("(?)", 1), (f"a{{{LIMITE_REPETICAO + 1}}}", 1)]
+        for er, posicao in casos:
+            with self.assertRaises(ErroSintaxeER) as contexto:
+                ConversorERparaAFN(er).converter()
+            self.assertEqual(contexto.exception.posicao, posicao, er)
+
+
+class TestMultiplosPadroes(unittest.TestCase):
+    def setUp(self):
+        Estado.contador = 0
+        self.expressoes = ["[a-z]+", "ab*", "[0-9]{3}", "a?"]
+    
+    def test_padroes_aceitos_em_uma_varredura(self):
+        for construcao in ('thompson', 'glushkov'):
+            reconhecedor = ReconhecedorMultiplo(AFNMultiplo.combinar(self.expressoes, construcao))
+            self.assertEqual(reconhecedor.padroes("a"), {0, 1, 3})
+            self.assertEqual(reconhecedor.padroes("abbb"), {0, 1})
+            self.assertEqual(reconhecedor.padroes("123"), {2})
+            self.assertEqual(reconhecedor.padroes(""), {3})
+            self.assertEqual(reconhecedor.padroes("12"), frozenset())
+            self.assertEqual(reconhecedor.expressoes_aceitas("zz"), ["[a-z]+"])
+    
+    def test_equivale_a_reconhecedores_separados(self):
+        afn = AFNMultiplo.combinar(self.expressoes)
+        reconhecedor = ReconhecedorMultiplo(afn)
+        individuais = [ReconhecedorAFN(ConversorERparaAFN(er).converter()) for er in self.expressoes]
+        for cadeia in ["", "a", "ab", "b", "999", "a1", "xyz", "abba"]:
+            esperado = {i for i, r in enumerate(individuais) if r.reconhecer(cadeia)[0]}
+            self.assertEqual(reconhecedor.padroes(cadeia), esperado, cadeia)
+    
+    def test_estados_finais_marcados(self):
+        afn = AFNMultiplo.combinar(["a", "a"])
+        finais = [estado for estado in afn.obter_todos_estados() if estado.eh_final]
+        self.assertEqual(len(finais), 2)
+        self.assertEqual(sorted(sorted(afn.padroes_do_estado(e)) for e in finais), [[0], [1]])
+        self.assertEqual(len({e.id for e in afn.obter_todos_estados()}), afn.total_estados())
+        self.assertIn("Padrões por estado final:", afn.exibir_texto())
+    
+    def test_padroes_do_estado(self):
+        reconhecedor = ReconhecedorMultiplo(AFNMultiplo.combinar(self.expressoes))
+        estado = reconhecedor.avancar(reconhecedor.estado_inicial(), "ab")
+        self.assertEqual(reconhecedor.padroes_do_estado(estado), {0, 1})
+        self.assertEqual(reconhecedor.padroes_do_estado(reconhecedor.estado_inicial()), {3})
+    
+    def test_limite_estados_afd(self):
+        ilimitado = ReconhecedorMultiplo(AFNMultiplo.combinar(self.expressoes), limite_estados_afd=None)
+        limitado = ReconhecedorMultiplo(AFNMultiplo.combinar(self.expressoes), limite_estados_afd=2)
+        for cadeia in ["", "a", "ab", "abbb", "123", "12", "zz", "a1b"]:
+            self.assertEqual(limitado.padroes(cadeia), ilimitado.padroes(cadeia), cadeia)
+        self.assertGreater(limitado.descartes_afd, 0)
+
+
+class TestAnalisadorLexico(unittest.TestCase):
+    def setUp(self):
+        Estado.contador = 0
+        self.analisador = AnalisadorLexico([
+            ('SE', 'se'),
+            ('ID', '[a-z_][a-z0-9_]*'),
+            ('NUM', '[0-9]+'),
+            ('OP', '[-+=<]|==|<='),
+            ('ESP', '[ \n]+'),
+        ], ignorar={'ESP'})
+        self.fonte = 'se x1 == 42 seja <= y\n'
+    
+    def test_maior_casamento_e_prioridade(self):
+        tokens = list(self.analisador.tokenizar(self.fonte))
+        self.assertEqual([(t.tipo, t.lexema) for t in tokens], [
+            ('SE', 'se'), ('ID', 'x1'), ('OP', '=='), ('NUM', '42'), ('ID', 'seja'), ('OP', '<='), ('ID', 'y'),
+        ])
+        self.assertEqual(tokens[1], Token('ID', 'x1', 3, 5))
+    
+    def test_fluxo_em_blocos_pequenos(self):
+        esperado = list(self.analisador.tokenizar(self.fonte))
+        for tamanho_bloco in (1, 2, 5):
+            fluxo = io.BytesIO(self.fonte.encode('utf-8'))
+            self.assertEqual(list(self.analisador.tokenizar(fluxo, tamanho_bloco)), esperado)
+        self.assertEqual(list(self.analisador.tokenizar(io.StringIO(self.fonte), 3)), esperado)
+    
+    def test_arquivo_mapeado(self):
+        caminho = os.path.join(tempfile.mkdtemp(), 'fonte.txt')
+        with open(caminho, 'w', encoding='utf-8') as arquivo:
+            arquivo.write(self.fonte * 100)
+        tokens = list(self.analisador.tokenizar_arquivo(caminho, tamanho_bloco=7))
+        self.assertEqual(len(tokens), 700)
+        self.assertEqual(tokens[-1].fim, len(self.fonte) * 100 - 1)
+        
+        vazio = os.path.join(os.path.dirname(caminho), 'vazio.txt')
+        open(vazio, 'w').close()
+        self.assertEqual(list(self.analisador.tokenizar_arquivo(vazio)), [])
+    
+    def test_retrocede_ate_ultimo_aceito(self):
+        analisador = AnalisadorLexico([('A', 'a'), ('ABC', 'abc'), ('B', 'b')])
+        self.assertEqual([t.lexema for t in analisador.tokenizar('ababcab')], ['a', 'b', 'abc', 'a', 'b'])
+        analisador = AnalisadorLexico([('A', 'a'), ('ABC', 'abc')])
+        with self.assertRaises(ErroLexico) as contexto:
+            list(analisador.tokenizar('aab'))
+        self.assertEqual(contexto.exception.posicao, 2)
+    
+    def test_erro_lexico(self):
+        tokens = self.analisador.tokenizar('x # y')
+        self.assertEqual(next(tokens).lexema, 'x')
+        with self.assertRaises(ErroLexico) as contexto:
+            list(tokens)
+        self.assertEqual(contexto.exception.posicao, 2)
+    
+    def test_trabalho_linear_com_lookahead_longo(self):
+        analisador = AnalisadorLexico([('A', 'a'), ('B', 'a*b')])
+        transicao = analisador.reconhecedor.transicao
+        trabalho = []
+        
+        def contar(estado, simbolo):
+            trabalho[-1] += 1
+            return transicao(estado, simbolo)
+        
+        analisador.reconhecedor.transicao = contar
+        for tamanho in [1000, 4000]:
+            trabalho.append(0)
+            tokens = list(analisador.tokenizar('a' * tamanho, tamanho_bloco=64))
+            self.assertEqual(len(tokens), tamanho)
+            self.assertTrue(all(t.lexema == 'a' for t in tokens))
+        self.assertLess(trabalho[1], 5 * trabalho[0])
+        self.assertLess(trabalho[1], 10 * 4000)
+        self.assertEqual([t.lexema for t in analisador.tokenizar('aaab' + 'a' * 3 + 'ab')], ['aaab', 'aaaab'])
+    
+    def test_descarte_do_cache_afd(self):
+        esperado = list(self.analisador.tokenizar(self.fonte * 5))
+        limitado = AnalisadorLexico([('SE', 'se'), ('ID', '[a-z_][a-z0-9_]*'), ('NUM', '[0-9]+'),
+                                     ('OP', '[-+=<]|==|<='), ('ESP', '[ \n]+')], ignorar={'ESP'})
+        limitado.reconhecedor.limite_estados_afd = 3
+        self.assertEqual(list(limitado.tokenizar(self.fonte * 5, tamanho_bloco=4)), esperado)
+        self.assertGreater(limitado.reconhecedor.descartes_afd, 0)
+        
+        analisador = AnalisadorLexico([('A', 'a'), ('B', 'a*b')])
+        analisador.reconhecedor.limite_estados_afd = 2
+        self.assertEqual([t.lexema for t in analisador.tokenizar('a' * 50 + 'b' + 'aa')], ['a' * 50 + 'b', 'a', 'a'])
+
+
+@unittest.skipIf(VisualizadorAFN is None, "matplotlib não está instalado")
+class TestVisualizador(unittest.TestCase):
+    def setUp(self):
+        Estado.contador = 0
+    
+    def test_detalhe_automatico(self):
+        pequeno = ConversorERparaAFN('ab').converter()
+        grande = ConversorERparaAFN('|'.join(format(i, 'x') for i in range(100))).converter()
+        self.assertEqual(VisualizadorAFN(pequeno).detalhe, 'completo')
+        self.assertEqual(VisualizadorAFN(grande).detalhe, 'simplificado')
+        self.assertEqual(VisualizadorAFN(grande, detalhe='completo').detalhe, 'completo')
+    
+    def test_detalhe_invalido(self):
+        afn = ConversorERparaAFN('a').converter()
+        with self.assertRaises(ValueError):
+            VisualizadorAFN(afn, detalhe='medio')
+    
+    def test_colapsar_cadeias_epsilon(self):
+        afn = ConversorERparaAFN('ab').converter()
+        arestas = VisualizadorAFN(afn)._colapsar_epsilon()
+        self.assertEqual([(str(o), s, str(d)) for o, s, d in arestas], [('q0', 'a', 'q2'), ('q2', 'b', 'q3')])
+    
+    def test_colapsar_preserva_linguagem(self):
+        for er in ['(a|b)*abb', 'a*b*', '((a|ε)b)*', '(ab|c)*d|e']:
+            afn = ConversorERparaAFN(er).converter()
+            saidas = {}
+            for origem, simbolo, destino in VisualizadorAFN(afn)._colapsar_epsilon():
+                saidas.setdefault(origem, []).append((simbolo, destino))
+            copias = {}
+            
+            def copia(estado):
+                if estado not in copias:
+                    copias[estado] = Estado()
+                    copias[estado].eh_final = estado.eh_final
+                return copias[estado]
+            
+            for origem, arestas in saidas.items():
+                for simbolo, destino in arestas:
+                    copia(origem).adicionar_transicao(simbolo, copia(destino))
+            colapsado = AFN(copia(afn.estado_inicial))
+            
+            original = ReconhecedorAFN(afn, rastreamento='desligado')
+            reduzido = ReconhecedorAFN(colapsado, rastreamento='desligado')
+            for cadeia in ['', 'a', 'b', 'ab', 'abb', 'aabb', 'bab', 'abab', 'cd', 'abcd', 'e', 'de']:
+                self.assertEqual(original.reconhecer(cadeia)[0], reduzido.reconhecer(cadeia)[0], (er, cadeia))
+    
+    def test_posicoes_alcancaveis(self):
+        afn = ConversorERparaAFN('(a|b)*c').converter()
+        posicoes = VisualizadorAFN(afn)._calcular_posicoes()
+        self.assertEqual(set(posicoes), set(afn.obter_todos_estados()))
+        self.assertEqual(posicoes[afn.estado_inicial][0], 0)
+    
+    def test_visualizar_ambos_niveis(self):
+        afn = ConversorERparaAFN('(a|b)*abb').converter()
+        for detalhe in ['completo', 'simplificado']:
+            fig = VisualizadorAFN(afn, detalhe=detalhe).visualizar("teste")
+            self.assertEqual(len(fig.axes), 1)
+            plt.close(fig)
+
 if __name__ == '__main__':
     unittest.main(verbosity=2)
@@ -1,40 +1,59 @@
 import matplotlib.pyplot as plt
+from matplotlib.collections import LineCollection
 from matplotlib.patches import FancyArrowPatch, Circle
+from collections import deque
 import math
 
 
+LIMITE_DETALHE = 150
+LIMITE_ROTULOS = 60
+NIVEIS_DETALHE = ('completo', 'simplificado')
+
+
 class VisualizadorAFN:
-    def __init__(self, afn):
+    def __init__(self, afn, detalhe=None, limite_detalhe=LIMITE_DETALHE, limite_rotulos=LIMITE_ROTULOS):
+        if detalhe is not None and detalhe not in NIVEIS_DETALHE:
+            raise ValueError(f"Nível de detalhe desconhecido: {detalhe}")
+
         self.afn = afn
         self.posicoes = {}
+        self.limite_rotulos = limite_rotulos
 
-    def _calcular_posicoes(self):
-        estados = self.afn.obter_todos_estados()
+        if detalhe is None:
+            detalhe = 'completo' if afn.total_estados() <= limite_detalhe else 'simplificado'
+        self.detalhe = detalhe
 
-        niveis = {}
-        visitados = set()
-        fila = [(self.afn.estado_inicial, 0)]
+    def _calcular_posicoes(self, arestas=None):
+        if arestas is None:
+            arestas = self.afn.obter_transicoes()
 
-        while fila:
-            estado, nivel = fila.pop(0)
-            if estado in visitados:
-                continue
+        sucessores = {}
+        for origem, _, destino in arestas:
+            sucessores.setdefault(origem, []).append(destino)
+
+        inicial = self.afn.estado_inicial
+        niveis = []
+        nivel_de = {inicial: 0}
+        fila = deque([inicial])
 
-            visitados.add(estado)
-            if nivel not in niveis:
-                niveis[nivel] = []
+        while fila:
+            estado = fila.popleft()
+            nivel = nivel_de[estado]
+            if nivel == len(niveis):
+                niveis.append([])
             niveis[nivel].append(estado)
 
-            for simbolo, destinos in estado.transicoes.items():
-                for destino in destinos:
-                    if destino not in visitados:
-                        fila.append((destino, nivel + 1))
+            for destino in sucessores.get(estado, ()):
+                if destino not in nivel_de:
+                    nivel_de[destino] = nivel + 1
+                    fila.append(destino)
 
-        max_nivel = max(niveis.keys()) if niveis else 0
+        max_nivel = len(niveis) - 1
         largura = 10
         altura = 6
 
-        for nivel, estados_nivel in niveis.items():
+        self.posicoes = {}
+        for nivel, estados_nivel in enumerate(niveis):
             n = len(estados_nivel)
             x = (nivel / max(max_nivel, 1)) * largura
 
@@ -48,33 +67,89 @@ class VisualizadorAFN:
 
         return self.posicoes
 
+    def _colapsar_epsilon(self):
+        transicoes = self.afn.obter_transicoes()
+        inicial = self.afn.estado_inicial
+
+        saidas = {}
+        for origem, simbolo, destino in transicoes:
+            saidas.setdefault(origem, []).append((simbolo, destino))
+
+        passagem = {
+            estado: arestas[0][1]
+            for estado, arestas in saidas.items()
+            if len(arestas) == 1 and arestas[0][0] == 'ε' and arestas[0][1] is not estado
+            and estado is not inicial and not estado.eh_final
+        }
+
+        atalhos = {}
+
+        def resolver(estado):
+            caminho = []
+            vistos = set()
+            while estado in passagem and estado not in atalhos and estado not in vistos:
+                vistos.add(estado)
+                caminho.append(estado)
+                estado = passagem[estado]
+
+            destino = atalhos.get(estado, estado)
+            for intermediario in caminho:
+                atalhos[intermediario] = destino
+            return destino
+
+        arestas = {}
+        for origem, simbolo, destino in transicoes:
+            if origem in passagem:
+                continue
+            destino = resolver(destino)
+            if simbolo == 'ε' and destino is origem:
+                continue
+            arestas[(origem, simbolo, destino)] = None
+
+        return list(arestas)
+
     def visualizar(self, titulo="AFN-ε"):
+        if self.detalhe == 'simplificado':
+            return self._visualizar_simplificado(titulo)
+        return self._visualizar_completo(titulo)
+
+    def _novo_grafico(self):
         fig, ax = plt.subplots(figsize=(14, 8))
         ax.set_xlim(-1, 11)
         ax.set_ylim(-1, 7)
         ax.axis('off')
+        return fig, ax
+
+    def _desenhar_inicio(self, ax):
+        pos_inicial = self.posicoes[self.afn.estado_inicial]
+        arrow_start = FancyArrowPatch(
+            (pos_inicial[0] - 1, pos_inicial[1]),
+            (pos_inicial[0] - 0.4, pos_inicial[1]),
+            arrowstyle='->,head_width=0.4,head_length=0.8',
+            color='green',
+            linewidth=2.5,
+            zorder=5
+        )
+        ax.add_patch(arrow_start)
+
+    def _visualizar_completo(self, titulo):
+        fig, ax = self._novo_grafico()
 
         self._calcular_posicoes()
 
         transicoes_desenhadas = {}
 
         for origem, simbolo, destino in self.afn.obter_transicoes():
-            pos_origem = self.posicoes[origem]
-            pos_destino = self.posicoes[destino]
-
-            chave = (origem.id, destino.id)
+            chave = (origem, destino)
             if chave not in transicoes_desenhadas:
                 transicoes_desenhadas[chave] = []
             transicoes_desenhadas[chave].append(simbolo)
 
-        for (origem_id, destino_id), simbolos in transicoes_desenhadas.items():
-            origem = next(e for e in self.posicoes.keys() if e.id == origem_id)
-            destino = next(e for e in self.posicoes.keys() if e.id == destino_id)
-
+        for (origem, destino), simbolos in transicoes_desenhadas.items():
             pos_origem = self.posicoes[origem]
             pos_destino = self.posicoes[destino]
 
-            label = ', '.join('ε' if s == 'ε' else s for s in simbolos)
+            label = ', '.join(simbolos)
 
             if origem == destino:
                 circle = Circle((pos_origem[0], pos_origem[1] + 0.5), 0.3, fill=False, edgecolor='black', linewidth=1.5)
@@ -133,19 +208,88 @@ class VisualizadorAFN:
 
             ax.text(x, y, str(estado), ha='center', va='center', fontsize=12, fontweight='bold', zorder=12)
 
-        pos_inicial = self.posicoes[self.afn.estado_inicial]
-        arrow_start = FancyArrowPatch(
-            (pos_inicial[0] - 1, pos_inicial[1]),
-            (pos_inicial[0] - 0.4, pos_inicial[1]),
-            arrowstyle='->,head_width=0.4,head_length=0.8',
-            color='green',
-            linewidth=2.5,
-            zorder=5
-        )
-        ax.add_patch(arrow_start)
+        self._desenhar_inicio(ax)
 
         ax.text(0.5, 6.5, titulo, fontsize=16, fontweight='bold', ha='left')
         ax.text(0.5, 6.1, '● Verde: Estado Inicial  ● Azul: Estados  ◎ Círculo Duplo: Estado Final', fontsize=10, ha='left')
 
         plt.tight_layout()
         return fig
+
+    def _visualizar_simplificado(self, titulo):
+        fig, ax = self._novo_grafico()
+
+        arestas = self._colapsar_epsilon()
+        posicoes = self._calcular_posicoes(arestas)
+
+        agrupadas = {}
+        for origem, simbolo, destino in arestas:
+            if origem in posicoes and destino in posicoes:
+                agrupadas.setdefault((origem, destino), []).append(simbolo)
+
+        segmentos = []
+        cores = []
+        lacos = []
+        setas = []
+        for (origem, destino), simbolos in agrupadas.items():
+            if origem is destino:
+                lacos.append(posicoes[origem])
+                continue
+            (x1, y1), (x2, y2) = posicoes[origem], posicoes[destino]
+            segmentos.append(((x1, y1), (x2, y2)))
+            cores.append('gray' if all(simbolo == 'ε' for simbolo in simbolos) else 'black')
+            setas.append((x1 + (x2 - x1) * 0.8, y1 + (y2 - y1) * 0.8, (x2 - x1) * 0.2, (y2 - y1) * 0.2))
+
+        total = len(posicoes)
+        tamanho = max(4, min(300, 30000 / max(total, 1)))
+        espessura = 1.2 if total <= self.limite_rotulos else 0.5
+
+        if segmentos:
+            ax.add_collection(LineCollection(segmentos, colors=cores, linewidths=espessura, zorder=1))
+            x, y, u, v = zip(*setas)
+            ax.quiver(
+                x, y, u, v, color=cores, angles='xy', scale_units='xy', scale=1,
+                width=0.0015, headwidth=4, headlength=5, zorder=2
+            )
+
+        if lacos:
+            x, y = zip(*lacos)
+            ax.scatter(x, [p + 0.15 for p in y], s=tamanho, facecolors='none', edgecolors='black', linewidths=espessura, zorder=3)
+
+        if total <= self.limite_rotulos:
+            for (origem, destino), simbolos in agrupadas.items():
+                (x1, y1), (x2, y2) = posicoes[origem], posicoes[destino]
+                deslocamento = 0.35 if origem is destino else 0.1
+                ax.text(
+                    (x1 + x2) / 2, (y1 + y2) / 2 + deslocamento,
+                    ', '.join(simbolos),
+                    ha='center', va='bottom', fontsize=8, zorder=4
+                )
+
+        estados = list(posicoes)
+        x = [posicoes[estado][0] for estado in estados]
+        y = [posicoes[estado][1] for estado in estados]
+        cores_estados = ['lightgreen' if estado is self.afn.estado_inicial else 'lightblue' for estado in estados]
+        ax.scatter(x, y, s=tamanho, c=cores_estados, edgecolors='black', linewidths=espessura, zorder=10)
+
+        finais = [posicoes[estado] for estado in estados if estado.eh_final]
+        if finais:
+            x, y = zip(*finais)
+            ax.scatter(x, y, s=tamanho * 0.5, facecolors='none', edgecolors='black', linewidths=espessura, zorder=11)
+
+        if total <= self.limite_rotulos:
+            for estado, (x, y) in posicoes.items():
+                ax.text(x, y, str(estado), ha='center', va='center', fontsize=8, zorder=12)
+
+        self._desenhar_inicio(ax)
+
+        ax.text(0.5, 6.5, titulo, fontsize=16, fontweight='bold', ha='left')
+        ax.text(
+            0.5, 6.1,
+            f'Visão simplificada: {total} de {self.afn.total_estados()} estados, '
+            f'{len(agrupadas)} arestas (cadeias ε colapsadas)',
+            fontsize=10, ha='left'
+        )
+
+        plt.tight_layout()
+        return fig